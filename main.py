@@ -2,14 +2,27 @@ import pygame
 import sys
 import random
 import os
-import json
 import math
 import time
+import glob
+import zlib
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 
 # Import tkinter for the file dialog
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog
+
+from src.ui.widgets import Widget, WidgetLayer, Label, fonts
+from src.services.avatars import Avatar, AvatarPipeline
+from src.services.assets import AssetLoader
+from src.services.audio import AudioManager
+from src.services.synth import SoundSynth
+from src.services.savegame import BlobStore
+from src.services.slots import SaveSlots
+from src.services.persistence import WriteBehind
+from src.ui.list_view import VirtualList
+from src.config.settings import SOUND_CACHE_DIR, AVATAR_BLOB_DIR, WRITE_BEHIND_DELAY, CLASSIC_SAVE_SLOT_DIR, LOOSE_SAVE_DIR
 
 # --- Constants ---
 # Screen dimensions
@@ -28,6 +41,8 @@ BOARD_Y_POS = (SCREEN_HEIGHT - BOARD_HEIGHT) // 2
 
 # Player Token Size
 PLAYER_TOKEN_SIZE = 50
+# Every size an avatar is drawn at: sidebar list, current turn, board token, game-over, setup preview
+AVATAR_SIZES = (25, 40, PLAYER_TOKEN_SIZE, 80, 90)
 
 # Colors
 WHITE = (255, 255, 255)
@@ -57,6 +72,7 @@ class GameState(Enum):
     GAME_OVER = 'GAME_OVER'
     TUTORIAL = 'TUTORIAL'
     SETTINGS = 'SETTINGS'
+    LOAD_SLOTS = 'LOAD_SLOTS'
 
 # Game Modes
 class GameMode(Enum):
@@ -84,8 +100,8 @@ POWER_UPS = {
 }
 
 # --- Pygame Setup ---
+pygame.mixer.pre_init(44100, -16, 2, 512)  # Small buffer so effects keep up with the animation
 pygame.init()
-pygame.mixer.init()  # Initialize sound mixer
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Snake and Ladder - Enhanced Edition")
 clock = pygame.time.Clock()
@@ -112,87 +128,144 @@ except:
     font = pygame.font.Font(None, 28)
     sidebar_font = pygame.font.Font(None, 24)
 
-# Load sounds
-try:
-    roll_sound = pygame.mixer.Sound("assets/sounds/dice_roll.wav")
-    move_sound = pygame.mixer.Sound("assets/sounds/move.wav")
-    snake_sound = pygame.mixer.Sound("assets/sounds/snake.wav")
-    ladder_sound = pygame.mixer.Sound("assets/sounds/ladder.wav")
-    win_sound = pygame.mixer.Sound("assets/sounds/win.wav")
-    button_click = pygame.mixer.Sound("assets/sounds/button_click.wav")
-except:
-    print("Warning: Could not load sound files. Sound will be disabled.")
-    roll_sound = None
-    move_sound = None
-    snake_sound = None
-    ladder_sound = None
-    win_sound = None
-    button_click = None
-
-# Load background images
-try:
-    menu_bg = pygame.image.load("assets/images/menu_bg.jpg").convert()
-    board_bg = pygame.image.load("assets/images/board_bg.jpg").convert()
-except:
-    print("Warning: Could not load background images. Using solid colors.")
-    menu_bg = None
-    board_bg = None
+# Effects are decoded the first time they play and kept; missing files are
+# synthesized once and cached as WAV. The AudioManager spreads them over
+# reserved channels and skips rapid repeats.
+SOUNDS = {
+    "roll": "assets/sounds/dice_roll.wav",
+    "step": "assets/sounds/move.wav",
+    "snake": "assets/sounds/snake.wav",
+    "ladder": "assets/sounds/ladder.wav",
+    "win": "assets/sounds/win.wav",
+    "click": "assets/sounds/button_click.wav",
+}
+MUSIC_TRACK = "assets/music/theme.ogg"
+audio = AudioManager(AssetLoader({"images": {}, "sounds": dict(SOUNDS)}, synth=SoundSynth(SOUND_CACHE_DIR)))
+# Widget fonts come from the same loader
+fonts.attach(audio.assets)
+if os.path.exists(MUSIC_TRACK):
+    audio.play_music(MUSIC_TRACK)
+
+# Background images and effects load on a worker pool so the window opens straight away.
+# Backgrounds start as None (backgrounds off) and are swapped in as they finish;
+# effects are only decoded there and handed to the sound cache on the main thread.
+menu_bg = board_bg = None
+asset_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="preload")
+pending_assets = {
+    "menu_bg": asset_pool.submit(pygame.image.load, "assets/images/menu_bg.jpg"),
+    "board_bg": asset_pool.submit(pygame.image.load, "assets/images/board_bg.jpg"),
+}
+for key in SOUNDS:
+    if audio.assets.has_sound(key):
+        pending_assets["sound:" + key] = asset_pool.submit(audio.assets.decode_sound, key)
+
+# Avatars are decoded, downsampled and masked off the main thread
+avatar_pipeline = AvatarPipeline(AVATAR_SIZES)
+# Saves and avatar blobs are written on a background thread
+save_writer = WriteBehind(WRITE_BEHIND_DELAY)
+save_blobs = BlobStore(AVATAR_BLOB_DIR, save_writer)
+# Saves go to named slots listed from an index; games saved through the old
+# file dialog are imported once, oldest first
+save_slots = SaveSlots(CLASSIC_SAVE_SLOT_DIR, save_blobs, save_writer)
+if not save_slots.slots:
+    loose = glob.glob(os.path.join(LOOSE_SAVE_DIR, "*.sav")) + glob.glob(os.path.join(LOOSE_SAVE_DIR, "*.json"))
+    for path in sorted(loose, key=os.path.getmtime):
+        try:
+            name = os.path.splitext(os.path.basename(path))[0]
+            save_slots.import_file(path, save_slots.new_id(), name, app="classic")
+        except (OSError, ValueError, KeyError, IndexError, TypeError, zlib.error, pygame.error) as e:
+            print(f"Warning: could not import {path}: {e}")
+
+def apply_loaded_assets():
+    # Runs on the main thread: convert() needs the display
+    for name, future in list(pending_assets.items()):
+        if not future.done():
+            continue
+        del pending_assets[name]
+        if name.startswith("sound:"):
+            key = name[len("sound:"):]
+            # A sound played before its decode finished was loaded on demand already
+            if key not in audio.assets.sounds:
+                audio.assets.adopt_sound(key, future.result())
+            continue
+        try:
+            value = future.result()
+            if name.endswith("_bg"):
+                value = value.convert()
+        except Exception:
+            print(f"Warning: Could not load {name}. Using the fallback.")
+            value = None
+        globals()[name] = value
 
 # --- Helper Classes ---
-class Button:
+class Button(Widget):
     def __init__(self, x, y, width, height, text, color, hover_color, disabled_color=None, font_size=28):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.text = text
         self.color = color
         self.hover_color = hover_color
         self.disabled_color = disabled_color or BUTTON_DISABLED_COLOR
         self.is_hovered = False
         self.is_enabled = True
-        self.font = pygame.font.Font(None, font_size)
+        self.font = fonts.get(None, font_size)
         self.click_cooldown = 0
 
-    def draw(self, surface):
-        # Update click cooldown
-        if self.click_cooldown > 0:
-            self.click_cooldown -= 1
-            
+    @property
+    def enabled(self):
+        # WidgetLayer.hit skips disabled widgets
+        return self.is_enabled
+
+    def state(self):
+        return (self.text, self.is_enabled, self.is_hovered, self.color, self.hover_color)
+
+    def paint(self, surface):
+        local = surface.get_rect()
         color = self.disabled_color if not self.is_enabled else (self.hover_color if self.is_hovered else self.color)
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=8)
+        pygame.draw.rect(surface, color, local, border_radius=8)
+        pygame.draw.rect(surface, BLACK, local, 2, border_radius=8)
         
         text_color = WHITE if self.is_enabled else (150, 150, 150)
-        text_surf = self.font.render(self.text, True, text_color)
-        text_rect = text_surf.get_rect(center=self.rect.center)
+        text_surf = self.label(self.font, self.text, text_color)
+        text_rect = text_surf.get_rect(center=local.center)
         surface.blit(text_surf, text_rect)
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos) and self.is_enabled
-        if event.type == pygame.MOUSEBUTTONDOWN and self.is_enabled and self.click_cooldown == 0:
-            if self.rect.collidepoint(event.pos):
-                self.click_cooldown = 10  # Prevent multiple clicks in quick succession
-                return True
+    def draw(self, surface):
+        # Update click cooldown
+        if self.click_cooldown > 0:
+            self.click_cooldown -= 1
+        super().draw(surface)
+
+    def handle(self, event):
+        # Clicks arrive through the screen's WidgetLayer, already hit-tested
+        if self.click_cooldown == 0:
+            self.click_cooldown = 10  # Prevent multiple clicks in quick succession
+            return True
         return False
 
-class TextBox:
+class TextBox(Widget):
     def __init__(self, x, y, width, height, label_text, default_text=""):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.text = default_text
         self.label_text = label_text
+        self.caption = Label((x, y - 30), font, label_text, WHITE)
         self.active = False
         self.cursor_visible = True
         self.cursor_timer = 0
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
-        if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            elif event.key == pygame.K_RETURN:
-                self.active = False
-            else:
-                self.text += event.unicode
+    def state(self):
+        return (self.text, self.active, self.cursor_visible)
+
+    def handle(self, event):
+        # Focus: Game.handle_event clears it from the other boxes
+        return True
+
+    def handle_key(self, event):
+        if event.key == pygame.K_BACKSPACE:
+            self.text = self.text[:-1]
+        elif event.key == pygame.K_RETURN:
+            self.active = False
+        else:
+            self.text += event.unicode
 
     def update(self):
         self.cursor_timer += 1
@@ -200,66 +273,84 @@ class TextBox:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = 0
 
-    def draw(self, surface):
-        label_surf = font.render(self.label_text, True, WHITE)
-        surface.blit(label_surf, (self.rect.x, self.rect.y - 30))
+    def paint(self, surface):
+        local = surface.get_rect()
         color = LIGHT_GREY if self.active else WHITE
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
-        text_surface = font.render(self.text, True, BLACK)
-        surface.blit(text_surface, (self.rect.x + 10, self.rect.y + 10))
+        pygame.draw.rect(surface, color, local, border_radius=5)
+        pygame.draw.rect(surface, BLACK, local, 2, border_radius=5)
+        text_surface = self.label(font, self.text, BLACK)
+        surface.blit(text_surface, (10, 10))
         if self.active and self.cursor_visible:
-            cursor_x = self.rect.x + 10 + text_surface.get_width()
-            pygame.draw.line(surface, BLACK, (cursor_x, self.rect.y + 10), (cursor_x, self.rect.y + self.rect.height - 10), 2)
+            cursor_x = 10 + text_surface.get_width()
+            pygame.draw.line(surface, BLACK, (cursor_x, 10), (cursor_x, local.height - 10), 2)
+
+    def draw(self, surface):
+        self.caption.draw(surface)
+        super().draw(surface)
 
-class PlayerImageLoader:
+class PlayerImageLoader(Widget):
     def __init__(self, x, y, size, label_text):
-        self.rect = pygame.Rect(x, y, size, size)
+        super().__init__((x, y, size, size))
         self.label_text = label_text
         self.image_surface = None
+        self.avatar = None
+        self.pending = None
+        # Added to the setup screen's layer next to this widget
         self.browse_button = Button(x, y + size + 10, size, 40, "Browse...", BUTTON_COLOR, BUTTON_HOVER_COLOR)
 
-    def handle_event(self, event):
-        if self.browse_button.handle_event(event):
-            if not tk_root:
-                print("Tkinter is not available. Cannot open file dialog.")
-                return False
-            
-            # Open the file dialog
-            file_path = filedialog.askopenfilename(
-                parent=tk_root,
-                title=f"Select an image for {self.label_text}",
-                filetypes=[("Image Files", "*.png *.jpg *.jpeg *.bmp *.gif"), ("All Files", "*.*")]
-            )
-            
-            if file_path:
-                try:
-                    # Use convert_alpha() for images with transparency
-                    loaded_image = pygame.image.load(file_path).convert_alpha()
-                    self.image_surface = loaded_image
-                    return True  # Signal that an image was loaded
-                except pygame.error as e:
-                    print(f"Error loading image: {e}")
+    def browse(self):
+        """Ask for an image; True when one was chosen."""
+        if not tk_root:
+            print("Tkinter is not available. Cannot open file dialog.")
             return False
+        
+        # Open the file dialog
+        file_path = filedialog.askopenfilename(
+            parent=tk_root,
+            title=f"Select an image for {self.label_text}",
+            filetypes=[("Image Files", "*.png *.jpg *.jpeg *.bmp *.gif"), ("All Files", "*.*")]
+        )
+        
+        if file_path:
+            # Decoding and resizing happen on the avatar pipeline; poll() picks up the result
+            self.pending = avatar_pipeline.load(file_path)
+            return True
         return False
 
-    def draw(self, surface):
+    def poll(self):
+        if self.pending is not None and self.pending.done():
+            try:
+                self.avatar = avatar_pipeline.ready(self.pending)
+                self.image_surface = self.avatar.source
+            except Exception as e:
+                print(f"Error loading image: {e}")
+            self.pending = None
+
+    def state(self):
+        return (id(self.avatar), self.pending is not None)
+
+    def paint(self, surface):
+        local = surface.get_rect()
         # Draw image or placeholder
-        if self.image_surface:
-            scaled_image = pygame.transform.scale(self.image_surface, (self.rect.width, self.rect.height))
-            surface.blit(scaled_image, self.rect)
+        if self.avatar:
+            surface.blit(self.avatar.get(self.rect.width), (0, 0))
+        elif self.pending is not None:
+            pygame.draw.rect(surface, LIGHT_GREY, local, border_radius=5)
+            loading_text = self.label(font, "Loading...", DARK_GREY)
+            surface.blit(loading_text, loading_text.get_rect(center=local.center))
         else:
-            pygame.draw.rect(surface, LIGHT_GREY, self.rect, border_radius=5)
-            pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
-            placeholder_text = font.render("No Image", True, DARK_GREY)
-            text_rect = placeholder_text.get_rect(center=self.rect.center)
-            surface.blit(placeholder_text, text_rect)
-        
-        # Draw browse button
-        self.browse_button.draw(surface)
+            pygame.draw.rect(surface, LIGHT_GREY, local, border_radius=5)
+            pygame.draw.rect(surface, BLACK, local, 2, border_radius=5)
+            placeholder_text = self.label(font, "No Image", DARK_GREY)
+            surface.blit(placeholder_text, placeholder_text.get_rect(center=local.center))
+
+    def draw(self, surface):
+        self.poll()
+        super().draw(surface)
 
     def is_image_loaded(self):
-        return self.image_surface is not None
+        self.poll()
+        return self.avatar is not None
 
 # NOTE: The MenuPlayerSlot class is no longer used but kept for potential future use.
 class MenuPlayerSlot:
@@ -296,75 +387,92 @@ class MenuPlayerSlot:
         label_rect = label.get_rect(center=(self.rect.centerx, self.rect.bottom + 20))
         surface.blit(label, label_rect)
 
-class ToggleButton:
+class ToggleButton(Widget):
     def __init__(self, x, y, width, height, text, initial_state=False):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.text = text
         self.is_on = initial_state
 
-    def draw(self, surface):
+    def state(self):
+        return (self.text, self.is_on)
+
+    def paint(self, surface):
+        local = surface.get_rect()
         # Draw the button background
         color = GREEN if self.is_on else BUTTON_COLOR
-        pygame.draw.rect(surface, color, self.rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
+        pygame.draw.rect(surface, color, local, border_radius=5)
+        pygame.draw.rect(surface, BLACK, local, 2, border_radius=5)
         
         # Draw the text
-        text_surf = font.render(self.text, True, WHITE)
-        text_rect = text_surf.get_rect(center=self.rect.center)
+        text_surf = self.label(font, self.text, WHITE)
+        text_rect = text_surf.get_rect(center=local.center)
         surface.blit(text_surf, text_rect)
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.is_on = not self.is_on
-                return True
-        return False
+    def handle(self, event):
+        self.is_on = not self.is_on
+        return True
 
-class Dropdown:
+class Dropdown(Widget):
     def __init__(self, x, y, width, height, options, default_text="Select..."):
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__((x, y, width, height))
         self.options = options
         self.default_text = default_text
         self.selected_option = None
         self.is_expanded = False
-        self.option_rects = [pygame.Rect(x, y + (i + 1) * height, width, height) for i in range(len(options))]
+        # The open list is its own widget on top of the layer, hidden while collapsed
+        self.menu = DropdownMenu(self)
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, WHITE, self.rect, border_radius=5)
-        pygame.draw.rect(surface, BLACK, self.rect, 2, border_radius=5)
+    def state(self):
+        return (self.selected_option, self.default_text)
+
+    def paint(self, surface):
+        local = surface.get_rect()
+        pygame.draw.rect(surface, WHITE, local, border_radius=5)
+        pygame.draw.rect(surface, BLACK, local, 2, border_radius=5)
         text_to_display = self.selected_option if self.selected_option else self.default_text
-        text_surf = font.render(text_to_display, True, BLACK)
-        text_rect = text_surf.get_rect(midleft=(self.rect.x + 10, self.rect.centery))
+        text_surf = self.label(font, text_to_display, BLACK)
+        text_rect = text_surf.get_rect(midleft=(10, local.centery))
         surface.blit(text_surf, text_rect)
-        arrow_points = [(self.rect.right - 20, self.rect.centery - 5), (self.rect.right - 10, self.rect.centery + 5), (self.rect.right - 30, self.rect.centery + 5)]
+        arrow_points = [(local.right - 20, local.centery - 5), (local.right - 10, local.centery + 5), (local.right - 30, local.centery + 5)]
         pygame.draw.polygon(surface, BLACK, arrow_points)
-        if self.is_expanded:
-            for i, option_rect in enumerate(self.option_rects):
-                pygame.draw.rect(surface, WHITE, option_rect, border_radius=5)
-                pygame.draw.rect(surface, BLACK, option_rect, 1, border_radius=5)
-                option_text = font.render(self.options[i], True, BLACK)
-                option_text_rect = option_text.get_rect(midleft=(option_rect.x + 10, option_rect.centery))
-                surface.blit(option_text, option_text_rect)
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_expanded:
-                for i, option_rect in enumerate(self.option_rects):
-                    if option_rect.collidepoint(event.pos):
-                        self.selected_option = self.options[i]
-                        self.is_expanded = False
-                        return True
-                if not self.rect.collidepoint(event.pos):
-                    self.is_expanded = False
-            else:
-                if self.rect.collidepoint(event.pos):
-                    self.is_expanded = True
-        return False
+    def handle(self, event):
+        self.is_expanded = self.menu.visible = not self.is_expanded
+        return True
+
+    def collapse(self):
+        self.is_expanded = self.menu.visible = False
+
+class DropdownMenu(Widget):
+    def __init__(self, dropdown):
+        r = dropdown.rect
+        super().__init__((r.x, r.bottom, r.width, r.height * len(dropdown.options)))
+        self.dropdown = dropdown
+        self.visible = False
+
+    def state(self):
+        return tuple(self.dropdown.options)
+
+    def paint(self, surface):
+        height = self.dropdown.rect.height
+        for i, option in enumerate(self.dropdown.options):
+            option_rect = pygame.Rect(0, i * height, self.rect.width, height)
+            pygame.draw.rect(surface, WHITE, option_rect, border_radius=5)
+            pygame.draw.rect(surface, BLACK, option_rect, 1, border_radius=5)
+            option_text = self.label(font, option, BLACK)
+            option_text_rect = option_text.get_rect(midleft=(10, option_rect.centery))
+            surface.blit(option_text, option_text_rect)
+
+    def handle(self, event):
+        index = (event.pos[1] - self.rect.y) // self.dropdown.rect.height
+        self.dropdown.selected_option = self.dropdown.options[index]
+        self.dropdown.collapse()
+        return True
 
 class Player:
-    def __init__(self, name, avatar_surface, pos=0):
+    def __init__(self, name, avatar, pos=0):
         self.name = name
-        self.avatar_surface = avatar_surface
+        self.avatar = avatar if isinstance(avatar, Avatar) else Avatar.from_surface(avatar, AVATAR_SIZES)
         self.pos = pos
         self.power_ups = []
         self.shield = False
@@ -372,7 +480,21 @@ class Player:
         self.skip_next_turn = False
         self.wins = 0
         self.games_played = 0
+        self.pending = None
         
+    @property
+    def avatar_surface(self):
+        return self.avatar.source
+
+    def poll(self):
+        # A loaded game decodes avatars on the pipeline; the default shows until then
+        if self.pending is not None and self.pending.done():
+            try:
+                self.avatar = avatar_pipeline.ready(self.pending)
+            except Exception as e:
+                print(f"Error loading avatar: {e}")
+            self.pending = None
+
     def add_power_up(self, power_up):
         self.power_ups.append(power_up)
         
@@ -402,8 +524,8 @@ class Dice:
         if not self.rolling:
             self.rolling = True
             self.roll_animation_timer = 0
-            if roll_sound and self.sounds_enabled: # Use self.sounds_enabled
-                roll_sound.play()
+            if self.sounds_enabled: # Use self.sounds_enabled
+                audio.play("roll", "dice")
             return True
         return False
     
@@ -520,6 +642,166 @@ def get_board_coords(square_num):
     y = BOARD_Y_POS + (BOARD_SIZE - 1 - row) * SQUARE_SIZE
     return (x, y)
 
+class BoardView(Widget):
+    """The board with its numbers, snakes and ladders; repainted only when the mode changes."""
+    def __init__(self, game):
+        super().__init__((0, 0, BOARD_AREA_WIDTH, SCREEN_HEIGHT))
+        self.game = game
+
+    def state(self):
+        return (self.game.mode == GameMode.POWER_UP,)
+
+    def paint(self, surface):
+        surface.fill(LIGHT_BLUE)
+        self.game.draw_board(surface)
+
+class Sidebar(Widget):
+    """Current turn and player list; repainted when any shown value changes."""
+    def __init__(self, game):
+        super().__init__((BOARD_AREA_WIDTH, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT))
+        self.game = game
+
+    def state(self):
+        g = self.game
+        players = tuple((p.name, p.pos, id(p.avatar), len(p.power_ups)) for p in g.players)
+        return (g.mode, g.current_player_index, players)
+
+    def paint(self, surface):
+        g = self.game
+        center_x = SIDEBAR_WIDTH // 2
+        surface.fill(DARK_GREY)
+        title = self.label(title_font, "Game Info", WHITE)
+        surface.blit(title, title.get_rect(center=(center_x, 40)))
+        
+        current_player = g.players[g.current_player_index]
+        surface.blit(self.label(sidebar_font, "Current Turn:", WHITE), (20, 100))
+        surface.blit(current_player.avatar.get(40), (20, 130))
+        surface.blit(self.label(font, current_player.name, WHITE), (70, 135))
+        
+        # Draw player list
+        surface.blit(self.label(sidebar_font, "Players:", WHITE), (20, 500))
+        for i, player in enumerate(g.players):
+            y_pos = 530 + i * 35
+            surface.blit(player.avatar.get(25), (20, y_pos - 12))
+            surface.blit(self.label(sidebar_font, f"{player.name}: {player.pos}", WHITE), (50, y_pos - 10))
+            
+            # Draw power-ups in Power-Up mode
+            if g.mode == GameMode.POWER_UP and len(player.power_ups) > 0:
+                surface.blit(self.label(font, f"Power-ups: {len(player.power_ups)}", GOLD), (50, y_pos + 10))
+
+class DiceView(Widget):
+    """Places the animated dice in a layer's draw order; it is drawn fresh every frame."""
+    def __init__(self, game):
+        super().__init__((BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2 - 90, 200, 180, 180))
+        self.game = game
+
+    def draw(self, surface):
+        if self.game.dice:
+            self.game.dice.draw(surface)
+
+class TurnStatus(Widget):
+    """Message and timer or round lines under the dice; wide messages overhang the sidebar."""
+    def __init__(self, game):
+        super().__init__((0, 320, SCREEN_WIDTH, 80))
+        self.game = game
+
+    def state(self):
+        g = self.game
+        timer = int(g.timed_mode_timer) if g.mode == GameMode.TIMED else None
+        rounds = (g.championship_current_round, g.championship_rounds) if g.mode == GameMode.CHAMPIONSHIP else None
+        return (g.message, timer, rounds)
+
+    def paint(self, surface):
+        g = self.game
+        center_x = BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2
+        # Draw message
+        message_text = self.label(sidebar_font, g.message, WHITE)
+        surface.blit(message_text, message_text.get_rect(center=(center_x, 30)))
+        
+        # Draw timer for timed mode
+        if g.mode == GameMode.TIMED:
+            timer_text = self.label(font, f"Time: {int(g.timed_mode_timer)}s", WHITE)
+            surface.blit(timer_text, timer_text.get_rect(center=(center_x, 60)))
+        
+        # Draw championship info
+        if g.mode == GameMode.CHAMPIONSHIP:
+            round_text = self.label(font, f"Round: {g.championship_current_round}/{g.championship_rounds}", WHITE)
+            surface.blit(round_text, round_text.get_rect(center=(center_x, 60)))
+
+class GameOverPanel(Widget):
+    """Winner overlay over the board area; text may overhang the 400x300 box."""
+    def __init__(self, game):
+        super().__init__((0, 0, BOARD_AREA_WIDTH, SCREEN_HEIGHT))
+        self.game = game
+
+    def state(self):
+        g = self.game
+        winner = g.players[g.winner_index]
+        scores = tuple(g.championship_scores) if g.mode == GameMode.CHAMPIONSHIP else None
+        return (winner.name, id(winner.avatar), scores, tuple(p.name for p in g.players))
+
+    def paint(self, surface):
+        g = self.game
+        center_x, center_y = BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2
+        box = pygame.Rect(0, 0, 400, 300)
+        box.center = (center_x, center_y)
+        surface.fill((255, 255, 255, 240), box)
+        
+        # Draw winner text
+        winner = g.players[g.winner_index]
+        win_text = self.label(title_font, f"{winner.name} Wins!", BLACK)
+        surface.blit(win_text, win_text.get_rect(center=(center_x, center_y - 80)))
+        
+        # Draw winner avatar
+        winner_avatar = winner.avatar.get(80)
+        surface.blit(winner_avatar, winner_avatar.get_rect(center=(center_x, center_y)))
+        
+        # Draw game mode specific information
+        if g.mode == GameMode.CHAMPIONSHIP:
+            score_text = self.label(subtitle_font, "Championship Scores:", BLACK)
+            surface.blit(score_text, score_text.get_rect(center=(center_x, center_y + 60)))
+            for i, (player, score) in enumerate(zip(g.players, g.championship_scores)):
+                player_score_text = self.label(font, f"{player.name}: {score} wins", BLACK)
+                surface.blit(player_score_text, player_score_text.get_rect(center=(center_x, center_y + 100 + i * 30)))
+
+class Banner(Widget):
+    """Translucent strip with one line of centered text, e.g. the power-up notification."""
+    def __init__(self, center_y, width, height, color, text=""):
+        super().__init__((0, center_y - height // 2, SCREEN_WIDTH, height))
+        self.box_width = width
+        self.color = color
+        self.text = text
+
+    def state(self):
+        return self.text
+
+    def paint(self, surface):
+        local = surface.get_rect()
+        box = pygame.Rect(0, 0, self.box_width, local.height)
+        box.center = local.center
+        surface.fill(self.color, box)
+        text = self.label(font, self.text, BLACK)
+        surface.blit(text, text.get_rect(center=local.center))
+
+class TutorialPage(Widget):
+    """One page of the tutorial, one centered line per row."""
+    def __init__(self, pages):
+        super().__init__((0, SCREEN_HEIGHT // 2 - 150, SCREEN_WIDTH, 300))
+        self.pages = pages
+        self.page = 0
+
+    def state(self):
+        return self.page
+
+    def paint(self, surface):
+        local = surface.get_rect()
+        box = pygame.Rect(0, 0, 700, 300)
+        box.center = local.center
+        surface.fill((255, 255, 255, 200), box)
+        for i, line in enumerate(self.pages[self.page].split('\n')):
+            text = self.label(font, line, BLACK)
+            surface.blit(text, text.get_rect(center=(local.centerx, 90 + i * 40)))
+
 class Game:
     def __init__(self):
         self.state = GameState.MENU
@@ -531,6 +813,8 @@ class Game:
         self.winner_index = -1
         self.message = ""
         self.sounds_enabled = True
+        self.slot_id = None  # Slot this game was saved to or loaded from
+        self.slot_entries = []
         self.animations = []
         self.particle_system = ParticleSystem()
         self.dice = None
@@ -541,6 +825,7 @@ class Game:
         self.show_power_up_notification = False
         self.power_up_notification_text = ""
         self.power_up_notification_timer = 0
+        self.hovered = None  # Widget under the mouse, from the current layer's hit test
         
         # Create UI elements
         self.create_ui_elements()
@@ -555,14 +840,15 @@ class Game:
             avatar = pygame.Surface((64, 64), pygame.SRCALPHA)
             pygame.draw.circle(avatar, color, (32, 32), 30)
             pygame.draw.circle(avatar, BLACK, (32, 32), 30, 2)
-            self.default_avatars.append(avatar)
+            self.default_avatars.append(Avatar.from_surface(avatar, AVATAR_SIZES, circle=False))
     
     def create_ui_elements(self):
         menu_center_x = SCREEN_WIDTH // 2
         
         # Menu elements
-        self.menu_title = title_font.render("Snakes & Ladders", True, WHITE)
-        self.menu_subtitle = subtitle_font.render("Enhanced Edition", True, WHITE)
+        self.menu_title = Label((menu_center_x, 80), title_font, "Snakes & Ladders", WHITE, anchor="center")
+        self.menu_subtitle = Label((menu_center_x, 130), subtitle_font, "Enhanced Edition", WHITE, anchor="center")
+        self.menu_footer = Label((menu_center_x, SCREEN_HEIGHT - 30), font, "You can save and continue your game from the game menu", WHITE, anchor="center")
         
         # Create menu buttons
         self.menu_sounds_button = ToggleButton(menu_center_x - 250, 180, 120, 40, "Sounds", self.sounds_enabled)
@@ -578,14 +864,14 @@ class Game:
         self.menu_settings_button = Button(menu_center_x - 150, 460, 300, 60, "Settings", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         
         # --- New UI Elements for Player Count Selection ---
-        self.player_count_title = title_font.render("Select Number of Players", True, WHITE)
+        self.player_count_title = Label((menu_center_x, 150), title_font, "Select Number of Players", WHITE, anchor="center")
         self.player_count_back_button = Button(menu_center_x - 100, 450, 200, 50, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.player_count_two_button = Button(menu_center_x - 250, 250, 150, 60, "2 Players", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.player_count_three_button = Button(menu_center_x - 75, 250, 150, 60, "3 Players", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.player_count_four_button = Button(menu_center_x + 100, 250, 150, 60, "4 Players", BUTTON_COLOR, BUTTON_HOVER_COLOR)
 
         # Player setup elements
-        self.setup_title = title_font.render("Enter Player Details", True, WHITE)
+        self.setup_title = Label((menu_center_x, 80), title_font, "Enter Player Details", WHITE, anchor="center")
         self.setup_back_button = Button(menu_center_x - 100, 550, 200, 50, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.setup_start_button = Button(menu_center_x - 100, 620, 200, 50, "Start Game", GREEN, (0, 220, 0))
         self.setup_start_button.is_enabled = False
@@ -598,14 +884,20 @@ class Game:
         self.game_save_button = Button(sidebar_center_x - 90, 520, 180, 60, "Save Game", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.game_power_up_button = Button(sidebar_center_x - 90, 470, 180, 40, "Use Power-Up", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.game_power_up_button.is_enabled = False
+        self.board_view = BoardView(self)
+        self.sidebar = Sidebar(self)
+        self.dice_view = DiceView(self)
+        self.turn_status = TurnStatus(self)
+        self.power_up_banner = Banner(150, 400, 60, (255, 215, 0, 200))  # Gold with transparency
         
         # Game over elements
         self.game_over_title = title_font.render("Game Over", True, BLACK)
+        self.game_over_panel = GameOverPanel(self)
         self.game_over_menu_button = Button(menu_center_x - 100, 450, 200, 50, "Main Menu", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.game_over_play_again_button = Button(menu_center_x - 100, 380, 200, 50, "Play Again", GREEN, (0, 220, 0))
         
         # Tutorial elements
-        self.tutorial_title = title_font.render("How to Play", True, WHITE)
+        self.tutorial_title = Label((menu_center_x, 80), title_font, "How to Play", WHITE, anchor="center")
         self.tutorial_back_button = Button(menu_center_x - 100, 600, 200, 50, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.tutorial_pages = [
             "Welcome to Snakes & Ladders Enhanced!\n\nThe goal is to be the first player to reach square 100.",
@@ -616,17 +908,94 @@ class Game:
             "In Championship mode, play multiple rounds.\n\nThe player with the most wins is the champion!"
         ]
         self.tutorial_current_page = 0
+        self.tutorial_page = TutorialPage(self.tutorial_pages)
+        self.tutorial_page_label = Label((menu_center_x, SCREEN_HEIGHT - 50), font, "", WHITE, anchor="center")
+        self.set_tutorial_page(0)
         self.tutorial_prev_button = Button(menu_center_x - 200, 500, 150, 50, "Previous", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.tutorial_next_button = Button(menu_center_x + 50, 500, 150, 50, "Next", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         
         # Settings elements
-        self.settings_title = title_font.render("Settings", True, WHITE)
+        self.settings_title = Label((menu_center_x, 80), title_font, "Settings", WHITE, anchor="center")
         self.settings_back_button = Button(menu_center_x - 100, 550, 200, 50, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR)
         self.settings_sounds_toggle = ToggleButton(menu_center_x - 100, 200, 200, 50, "Sound Effects", self.sounds_enabled)
         self.settings_difficulty_dropdown = Dropdown(menu_center_x - 100, 280, 200, 50, ["Easy", "Normal", "Hard"], "Normal")
         self.settings_difficulty_dropdown.selected_option = "Normal"
         self.settings_theme_dropdown = Dropdown(menu_center_x - 100, 360, 200, 50, ["Classic", "Modern", "Neon"], "Classic")
         self.settings_theme_dropdown.selected_option = "Classic"
+        
+        # Load screen elements; saved games are listed from the slot index
+        self.load_title = Label((menu_center_x, 80), title_font, "Saved Games", WHITE, anchor="center")
+        self.load_list = VirtualList((menu_center_x - 300, 140, 600, 360), 52,
+                                     lambda offset, limit: self.slot_entries[offset:offset + limit],
+                                     lambda: len(self.slot_entries), self.paint_slot_row)
+        self.load_message = Label((menu_center_x, 530), font, "", WHITE, anchor="center")
+        self.load_back_button = Button(menu_center_x - 320, 560, 200, 50, "Back", BUTTON_COLOR, BUTTON_HOVER_COLOR)
+        self.load_open_button = Button(menu_center_x - 100, 560, 200, 50, "Load", GREEN, (0, 220, 0))
+        self.load_delete_button = Button(menu_center_x + 120, 560, 200, 50, "Delete", BUTTON_COLOR, BUTTON_HOVER_COLOR)
+        self.load_open_button.is_enabled = self.load_delete_button.is_enabled = False
+        
+        # One layer per screen draws and hit-tests its widgets; later widgets are on top
+        self.ui = {
+            GameState.MENU: self.layer(self.menu_title, self.menu_subtitle, self.menu_footer,
+                                       self.menu_sounds_button, self.menu_mode_dropdown, self.menu_load_button,
+                                       self.menu_tutorial_button, self.menu_settings_button,
+                                       self.menu_start_button, self.menu_quick_start_button),
+            GameState.PLAYER_COUNT_SELECT: self.layer(self.player_count_title, self.player_count_back_button,
+                                                      self.player_count_two_button, self.player_count_three_button,
+                                                      self.player_count_four_button),
+            GameState.PLAYER_SETUP: self.layer(),
+            GameState.PLAYING: self.layer(self.sidebar, self.dice_view, self.turn_status, self.game_roll_button,
+                                          self.game_save_button, self.game_menu_button, self.game_power_up_button),
+            GameState.GAME_OVER: self.layer(self.sidebar, self.dice_view, self.turn_status, self.game_over_panel,
+                                            self.game_over_play_again_button, self.game_over_menu_button),
+            GameState.TUTORIAL: self.layer(self.tutorial_title, self.tutorial_page, self.tutorial_prev_button,
+                                           self.tutorial_next_button, self.tutorial_back_button,
+                                           self.tutorial_page_label),
+            GameState.SETTINGS: self.layer(self.settings_title, self.settings_sounds_toggle,
+                                           self.settings_difficulty_dropdown, self.settings_theme_dropdown,
+                                           self.settings_back_button),
+            GameState.LOAD_SLOTS: self.layer(self.load_title, self.load_message, self.load_back_button,
+                                             self.load_open_button, self.load_delete_button),
+        }
+    
+    def layer(self, *widgets):
+        layer = WidgetLayer()
+        for w in widgets:
+            layer.add(w)
+        # Open dropdown lists go over everything else on the screen
+        for w in widgets:
+            if isinstance(w, Dropdown):
+                layer.add(w.menu)
+        return layer
+    
+    def set_tutorial_page(self, page):
+        self.tutorial_current_page = self.tutorial_page.page = page
+        self.tutorial_page_label.set_text(f"Page {page + 1} of {len(self.tutorial_pages)}")
+    
+    def hover(self, widget):
+        if widget is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.is_hovered = False
+        if hasattr(widget, "is_hovered"):
+            widget.is_hovered = True
+        self.hovered = widget
+    
+    def paint_slot_row(self, surface, index, meta, selected):
+        rect = surface.get_rect().inflate(-4, -4)
+        pygame.draw.rect(surface, GOLD if selected else WHITE, rect, border_radius=8)
+        name_text = sidebar_font.render(meta["name"], True, BLACK)
+        surface.blit(name_text, (rect.x + 12, rect.y + 4))
+        when = time.strftime("%d %b %Y %H:%M", time.localtime(meta["saved_at"]))
+        info_text = sidebar_font.render(f"{meta['mode']} - {len(meta['players'])} players - {when}", True, DARK_GREY)
+        surface.blit(info_text, (rect.x + 12, rect.y + 26))
+    
+    def open_load_screen(self):
+        self.slot_entries = save_slots.list()
+        self.load_list.reset()
+        self.load_message.set_text("" if self.slot_entries else "No saved games yet")
+        self.load_open_button.is_enabled = self.load_delete_button.is_enabled = False
+        self.state = GameState.LOAD_SLOTS
     
     def create_player_setup_elements(self, num):
         self.setup_elements = []
@@ -637,12 +1006,15 @@ class Game:
             textbox = TextBox(setup_center_x - 250, y_pos, 200, 40, f"Player {i+1} Name:")
             image_loader = PlayerImageLoader(setup_center_x + 60, y_pos - 50, 90, f"Player {i+1}")
             self.setup_elements.append((textbox, image_loader))
+        widgets = [w for textbox, image_loader in self.setup_elements for w in (textbox, image_loader, image_loader.browse_button)]
+        self.ui[GameState.PLAYER_SETUP] = self.layer(self.setup_title, *widgets, self.setup_back_button, self.setup_start_button)
     
     def setup_game(self, player_data):
         self.num_players = len(player_data)
         self.players = [Player(data['name'], data['avatar']) for data in player_data]
         self.current_player_index = 0
         self.winner_index = -1
+        self.slot_id = None
         self.message = f"{self.players[self.current_player_index].name}'s turn"
         
         # Initialize dice
@@ -661,17 +1033,14 @@ class Game:
         self.state = GameState.PLAYING
     
     def save_game(self):
-        """Save the current game state to a file"""
-        # Create a directory for saves if it doesn't exist
-        if not os.path.exists("saves"):
-            os.makedirs("saves")
-        
-        # Prepare game data for saving
+        """Save the current game state to its save slot"""
+        # Prepare game data for saving (save format v2, see src/services/savegame.py)
         save_data = {
+            'app': 'classic',
             'mode': self.mode.value,
             'num_players': self.num_players,
             'players': [],
-            'current_player_index': self.current_player_index,
+            'turn': self.current_player_index,
             'winner_index': self.winner_index,
             'sounds_enabled': self.sounds_enabled
         }
@@ -684,116 +1053,87 @@ class Game:
             save_data['championship_rounds'] = self.championship_rounds
             save_data['championship_scores'] = self.championship_scores
         
-        # Save player data (excluding avatar surfaces which can't be pickled)
-        for i, player in enumerate(self.players):
-            player_data = {
-                'pos': player.pos,
+        # Avatars are stored once by content hash; an unchanged avatar is not re-encoded
+        for player in self.players:
+            save_data['players'].append({
+                'square': player.pos,
                 'name': player.name,
                 'power_ups': player.power_ups,
                 'shield': player.shield,
                 'extra_rolls': player.extra_rolls,
                 'skip_next_turn': player.skip_next_turn,
                 'wins': player.wins,
-                'games_played': player.games_played
-            }
-            save_data['players'].append(player_data)
+                'games_played': player.games_played,
+                'avatar': save_blobs.put(player.avatar_surface)
+            })
+        
+        # A game keeps one slot, overwritten by later saves; the first save creates it
+        names = ", ".join(player.name for player in self.players)
+        self.slot_id = save_slots.save(self.slot_id or save_slots.new_id(), names, save_data)
+        self.message = "Game saved"
+        return True
+    
+    def load_game(self, slot_id):
+        """Load a game state from a save slot"""
+        try:
+            save_data = save_slots.load(slot_id)
+            if save_data is None:
+                raise ValueError("save slot not found")
             
-            # Save player avatars as separate files
-            avatar_path = f"saves/avatar_{player.name}.png"
-            pygame.image.save(player.avatar_surface, avatar_path)
-            player_data['avatar_path'] = avatar_path
-        
-        # Get a filename from the user
-        if tk_root:
-            file_path = filedialog.asksaveasfilename(
-                parent=tk_root,
-                title="Save Game",
-                defaultextension=".json",
-                filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
-                initialdir="saves"
-            )
+            # Restore game state
+            self.mode = GameMode(save_data['mode'])
+            self.num_players = save_data['num_players']
+            self.current_player_index = save_data['turn']
+            self.winner_index = save_data['winner_index']
+            self.sounds_enabled = save_data.get('sounds_enabled', True)
+            audio.set_enabled(self.sounds_enabled)
             
-            if file_path:
-                with open(file_path, 'w') as f:
-                    json.dump(save_data, f)
-                return True
-        return False
-    
-    def load_game(self):
-        """Load a game state from a file"""
-        if not tk_root:
-            return False
-        
-        file_path = filedialog.askopenfilename(
-            parent=tk_root,
-            title="Load Game",
-            filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
-            initialdir="saves"
-        )
-        
-        if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    save_data = json.load(f)
-                
-                # Restore game state
-                self.mode = GameMode(save_data['mode'])
-                self.num_players = save_data['num_players']
-                self.current_player_index = save_data['current_player_index']
-                self.winner_index = save_data['winner_index']
-                self.sounds_enabled = save_data.get('sounds_enabled', True)
-                
-                # Restore mode-specific data
-                if self.mode == GameMode.TIMED:
-                    self.timed_mode_timer = save_data.get('timed_mode_timer', 30)
-                elif self.mode == GameMode.CHAMPIONSHIP:
-                    self.championship_current_round = save_data.get('championship_current_round', 1)
-                    self.championship_rounds = save_data.get('championship_rounds', 3)
-                    self.championship_scores = save_data.get('championship_scores', [0] * self.num_players)
-                
-                # Restore player data
-                self.players = []
-                for player_data in save_data['players']:
-                    # Load player avatar
-                    avatar_path = player_data.get('avatar_path')
-                    if avatar_path and os.path.exists(avatar_path):
-                        avatar = pygame.image.load(avatar_path).convert_alpha()
-                    else:
-                        # Create a default avatar if the file doesn't exist
-                        avatar = self.default_avatars[len(self.players) % len(self.default_avatars)]
-                    
-                    player = Player(
-                        player_data['name'],
-                        avatar,
-                        player_data['pos']
-                    )
-                    player.power_ups = player_data.get('power_ups', [])
-                    player.shield = player_data.get('shield', False)
-                    player.extra_rolls = player_data.get('extra_rolls', 0)
-                    player.skip_next_turn = player_data.get('skip_next_turn', False)
-                    player.wins = player_data.get('wins', 0)
-                    player.games_played = player_data.get('games_played', 0)
-                    
-                    self.players.append(player)
-                
-                # Initialize dice
-                sidebar_center_x = BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2
-                self.dice = Dice(sidebar_center_x - 90, 200, 180, self.sounds_enabled) # Pass sounds_enabled
-                
-                # Update UI elements
-                self.menu_mode_dropdown.selected_option = self.mode.value
-                self.menu_sounds_button.is_on = self.sounds_enabled
-                
-                # Start the game
-                self.state = GameState.PLAYING
+            # Restore mode-specific data
+            if self.mode == GameMode.TIMED:
+                self.timed_mode_timer = save_data.get('timed_mode_timer', 30)
+            elif self.mode == GameMode.CHAMPIONSHIP:
+                self.championship_current_round = save_data.get('championship_current_round', 1)
+                self.championship_rounds = save_data.get('championship_rounds', 3)
+                self.championship_scores = save_data.get('championship_scores', [0] * self.num_players)
+            
+            # Restore player data; avatars decode on the pipeline and swap in when ready
+            self.players = []
+            for player_data in save_data['players']:
+                digest = player_data.get('avatar')
+                player = Player(
+                    player_data['name'],
+                    self.default_avatars[len(self.players) % len(self.default_avatars)],
+                    player_data['square']
+                )
+                if digest and save_blobs.exists(digest):
+                    player.pending = avatar_pipeline.load(save_blobs.path(digest))
+                player.power_ups = player_data.get('power_ups', [])
+                player.shield = player_data.get('shield', False)
+                player.extra_rolls = player_data.get('extra_rolls', 0)
+                player.skip_next_turn = player_data.get('skip_next_turn', False)
+                player.wins = player_data.get('wins', 0)
+                player.games_played = player_data.get('games_played', 0)
                 
-                return True
-            except Exception as e:
-                print(f"Error loading game: {e}")
-                if tk_root:
-                    messagebox.showerror("Load Error", f"Failed to load game: {e}")
-                return False
-        return False
+                self.players.append(player)
+            
+            # Initialize dice
+            sidebar_center_x = BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2
+            self.dice = Dice(sidebar_center_x - 90, 200, 180, self.sounds_enabled) # Pass sounds_enabled
+            
+            # Update UI elements
+            self.menu_mode_dropdown.selected_option = self.mode.value
+            self.menu_sounds_button.is_on = self.sounds_enabled
+            
+            # Start the game
+            self.slot_id = slot_id
+            self.message = f"{self.players[self.current_player_index].name}'s turn"
+            self.state = GameState.PLAYING
+            
+            return True
+        except Exception as e:
+            print(f"Error loading game: {e}")
+            self.load_message.set_text(f"Failed to load game: {e}")
+            return False
     
     def handle_roll(self):
         """Handle dice roll and player movement"""
@@ -847,12 +1187,12 @@ class Game:
                           end_coords[1] + SQUARE_SIZE // 2 + offset_y)
                 
                 # Create animation
-                avatar = pygame.transform.scale(player.avatar_surface, (PLAYER_TOKEN_SIZE, PLAYER_TOKEN_SIZE))
+                avatar = player.avatar.get(PLAYER_TOKEN_SIZE)
                 self.animations.append(Animation(start_pos, end_pos, 30, avatar))
                 
                 # Play move sound
-                if move_sound and self.sounds_enabled:
-                    move_sound.play()
+                if self.sounds_enabled:
+                    audio.play("step", "move")
         
         # Update player position
         player.pos = new_pos
@@ -875,8 +1215,8 @@ class Game:
                 self.message += " Oh no, a snake!"
                 
                 # Play snake sound
-                if snake_sound and self.sounds_enabled:
-                    snake_sound.play()
+                if self.sounds_enabled:
+                    audio.play("snake", "event")
             else:
                 self.message += " Shield protected you from a snake!"
                 player.shield = False
@@ -896,8 +1236,8 @@ class Game:
             self.message += " Yay, a ladder!"
             
             # Play ladder sound
-            if ladder_sound and self.sounds_enabled:
-                ladder_sound.play()
+            if self.sounds_enabled:
+                audio.play("ladder", "event")
         
         # Check for power-ups in Power-Up mode
         if self.mode == GameMode.POWER_UP and player.pos in POWER_UPS:
@@ -954,8 +1294,8 @@ class Game:
                 self.state = GameState.GAME_OVER
             
             # Play win sound
-            if win_sound and self.sounds_enabled:
-                win_sound.play()
+            if self.sounds_enabled:
+                audio.play("win", "event")
                 
             # Create celebration particles
             winner_coords = get_board_coords(100)
@@ -1071,6 +1411,9 @@ class Game:
     
     def update(self):
         """Update game state"""
+        for player in self.players:
+            player.poll()
+
         # Update animations
         completed_animations = []
         for animation in self.animations:
@@ -1134,41 +1477,55 @@ class Game:
         if event.type == pygame.QUIT:
             return False
         
+        # Clicks and hover are hit-tested through the current screen's layer
+        layer = self.ui[self.state]
+        clicked = layer.handle(event)
+        if event.type == pygame.MOUSEMOTION:
+            self.hover(layer.hit(event.pos))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Any click moves text focus and closes dropdowns it missed
+            for w in layer.widgets:
+                if isinstance(w, TextBox):
+                    w.active = w is clicked
+                elif isinstance(w, Dropdown) and clicked not in (w, w.menu):
+                    w.collapse()
+        
         if self.state == GameState.MENU:
             # Handle menu buttons
-            if self.menu_sounds_button.handle_event(event):
+            if clicked is self.menu_sounds_button:
                 self.sounds_enabled = self.menu_sounds_button.is_on
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                audio.set_enabled(self.sounds_enabled)
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_mode_dropdown.handle_event(event):
+            if clicked is self.menu_mode_dropdown.menu:
                 self.mode = GameMode(self.menu_mode_dropdown.selected_option)
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_load_button.handle_event(event):
-                if self.load_game():
-                    if button_click and self.sounds_enabled:
-                        button_click.play()
+            if clicked is self.menu_load_button:
+                self.open_load_screen()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_tutorial_button.handle_event(event):
+            if clicked is self.menu_tutorial_button:
                 self.state = GameState.TUTORIAL
-                self.tutorial_current_page = 0
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                self.set_tutorial_page(0)
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_settings_button.handle_event(event):
+            if clicked is self.menu_settings_button:
                 self.state = GameState.SETTINGS
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_start_button.handle_event(event):
+            if clicked is self.menu_start_button:
                 # Go to player count selection screen
                 self.state = GameState.PLAYER_COUNT_SELECT
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.menu_quick_start_button.handle_event(event):
+            if clicked is self.menu_quick_start_button:
                 # Quick start with 4 players
                 num_players = 4
                 player_data = []
@@ -1178,95 +1535,96 @@ class Game:
                         'avatar': self.default_avatars[i]
                     })
                 self.setup_game(player_data)
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
 
         # --- Handle Player Count Selection ---
         elif self.state == GameState.PLAYER_COUNT_SELECT:
-            if self.player_count_back_button.handle_event(event):
+            if clicked is self.player_count_back_button:
                 self.state = GameState.MENU
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
 
-            if self.player_count_two_button.handle_event(event):
+            if clicked is self.player_count_two_button:
                 self.selected_num_players = 2
                 self.create_player_setup_elements(self.selected_num_players)
                 self.state = GameState.PLAYER_SETUP
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
 
-            if self.player_count_three_button.handle_event(event):
+            if clicked is self.player_count_three_button:
                 self.selected_num_players = 3
                 self.create_player_setup_elements(self.selected_num_players)
                 self.state = GameState.PLAYER_SETUP
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
 
-            if self.player_count_four_button.handle_event(event):
+            if clicked is self.player_count_four_button:
                 self.selected_num_players = 4
                 self.create_player_setup_elements(self.selected_num_players)
                 self.state = GameState.PLAYER_SETUP
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
         
         elif self.state == GameState.PLAYER_SETUP:
             # Handle the back button
-            if self.setup_back_button.handle_event(event):
+            if clicked is self.setup_back_button:
                 # Go back to player count selection instead of main menu
                 self.state = GameState.PLAYER_COUNT_SELECT
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
 
             for textbox, image_loader in self.setup_elements:
-                textbox.handle_event(event)
-                if image_loader.handle_event(event):
-                    if button_click and self.sounds_enabled:
-                        button_click.play()
+                if textbox.active and event.type == pygame.KEYDOWN:
+                    textbox.handle_key(event)
+                if clicked is image_loader.browse_button and image_loader.browse():
+                    if self.sounds_enabled:
+                        audio.play("click", "ui")
             
             all_names_filled = all(tb.text.strip() != "" for tb, _ in self.setup_elements)
             all_images_loaded = all(img.is_image_loaded() for _, img in self.setup_elements)
             self.setup_start_button.is_enabled = all_names_filled and all_images_loaded
 
-            if self.setup_start_button.handle_event(event) and self.setup_start_button.is_enabled:
+            if clicked is self.setup_start_button:
                 player_data = []
                 for textbox, image_loader in self.setup_elements:
                     player_data.append({
                         'name': textbox.text, 
-                        'avatar': image_loader.image_surface
+                        'avatar': image_loader.avatar
                     })
                 self.setup_game(player_data)
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
         
         elif self.state == GameState.PLAYING:
-            if self.game_roll_button.handle_event(event):
+            if clicked is self.game_roll_button:
                 self.handle_roll()
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.game_save_button.handle_event(event):
+            if clicked is self.game_save_button:
                 if self.save_game():
-                    if button_click and self.sounds_enabled:
-                        button_click.play()
+                    if self.sounds_enabled:
+                        audio.play("click", "ui")
             
-            if self.game_menu_button.handle_event(event):
+            if clicked is self.game_menu_button:
                 self.state = GameState.MENU
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.game_power_up_button.handle_event(event) and self.game_power_up_button.is_enabled:
+            if clicked is self.game_power_up_button:
                 # Use the first power-up (in a more advanced version, we could let the player choose)
                 if self.use_power_up(0):
-                    if button_click and self.sounds_enabled:
-                        button_click.play()
+                    if self.sounds_enabled:
+                        audio.play("click", "ui")
         
         elif self.state == GameState.GAME_OVER:
-            if self.game_over_menu_button.handle_event(event):
+            if clicked is self.game_over_menu_button:
                 self.state = GameState.MENU
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.game_over_play_again_button.handle_event(event):
+            if clicked is self.game_over_play_again_button:
                 # Reset the game with the same players
                 if self.mode == GameMode.CHAMPIONSHIP:
                     self.reset_round()
@@ -1285,45 +1643,68 @@ class Game:
                     self.message = f"{self.players[self.current_player_index].name}'s turn"
                     self.state = GameState.PLAYING
                 
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
         
         elif self.state == GameState.TUTORIAL:
-            if self.tutorial_back_button.handle_event(event):
+            if clicked is self.tutorial_back_button:
                 self.state = GameState.MENU
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
+            
+            if clicked is self.tutorial_prev_button and self.tutorial_current_page > 0:
+                self.set_tutorial_page(self.tutorial_current_page - 1)
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
+            
+            if clicked is self.tutorial_next_button and self.tutorial_current_page < len(self.tutorial_pages) - 1:
+                self.set_tutorial_page(self.tutorial_current_page + 1)
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
+        
+        elif self.state == GameState.LOAD_SLOTS:
+            self.load_list.handle(event)
+            selected = self.load_list.selected
+            slot = self.load_list.item(selected) if selected is not None else None
+            
+            if clicked is self.load_open_button or (slot and event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN):
+                if self.load_game(slot["id"]) and self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.tutorial_prev_button.handle_event(event) and self.tutorial_current_page > 0:
-                self.tutorial_current_page -= 1
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+            if clicked is self.load_delete_button:
+                save_slots.delete(slot["id"])
+                self.open_load_screen()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.tutorial_next_button.handle_event(event) and self.tutorial_current_page < len(self.tutorial_pages) - 1:
-                self.tutorial_current_page += 1
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+            if clicked is self.load_back_button or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                self.state = GameState.MENU
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
+            
+            self.load_open_button.is_enabled = self.load_delete_button.is_enabled = self.load_list.selected is not None
         
         elif self.state == GameState.SETTINGS:
-            if self.settings_back_button.handle_event(event):
+            if clicked is self.settings_back_button:
                 self.state = GameState.MENU
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.settings_sounds_toggle.handle_event(event):
+            if clicked is self.settings_sounds_toggle:
                 self.sounds_enabled = self.settings_sounds_toggle.is_on
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                audio.set_enabled(self.sounds_enabled)
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.settings_difficulty_dropdown.handle_event(event):
+            if clicked is self.settings_difficulty_dropdown.menu:
                 # Apply difficulty settings
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
             
-            if self.settings_theme_dropdown.handle_event(event):
+            if clicked is self.settings_theme_dropdown.menu:
                 # Apply theme settings
-                if button_click and self.sounds_enabled:
-                    button_click.play()
+                if self.sounds_enabled:
+                    audio.play("click", "ui")
         
         return True
     
@@ -1483,9 +1864,8 @@ class Game:
                     center_x = coords[0] + SQUARE_SIZE // 2 + offset_x
                     center_y = coords[1] + SQUARE_SIZE // 2 + offset_y
                     
-                    # Scale the avatar to the token size
-                    avatar = player.avatar_surface
-                    scaled_avatar = pygame.transform.scale(avatar, (PLAYER_TOKEN_SIZE, PLAYER_TOKEN_SIZE))
+                    # The avatar already exists at token size
+                    scaled_avatar = player.avatar.get(PLAYER_TOKEN_SIZE)
                     
                     # Get the rect for the scaled avatar and center it
                     avatar_rect = scaled_avatar.get_rect(center=(center_x, center_y))
@@ -1496,60 +1876,6 @@ class Game:
                     # Draw the border circle with the correct radius
                     pygame.draw.circle(surface, BLACK, (center_x, center_y), PLAYER_TOKEN_SIZE // 2, 2)
     
-    def draw_sidebar(self, surface):
-        """Draw the game sidebar"""
-        pygame.draw.rect(surface, DARK_GREY, (BOARD_AREA_WIDTH, 0, SIDEBAR_WIDTH, SCREEN_HEIGHT))
-        title = title_font.render("Game Info", True, WHITE)
-        title_rect = title.get_rect(center=(BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2, 40))
-        surface.blit(title, title_rect)
-        
-        current_player = self.players[self.current_player_index]
-        turn_text = sidebar_font.render("Current Turn:", True, WHITE)
-        surface.blit(turn_text, (BOARD_AREA_WIDTH + 20, 100))
-        
-        avatar = current_player.avatar_surface
-        scaled_avatar = pygame.transform.scale(avatar, (40, 40))
-        surface.blit(scaled_avatar, (BOARD_AREA_WIDTH + 20, 130))
-        
-        name_text = font.render(current_player.name, True, WHITE)
-        surface.blit(name_text, (BOARD_AREA_WIDTH + 70, 135))
-        
-        # Draw dice
-        if self.dice:
-            self.dice.draw(surface)
-        
-        # Draw message
-        message_text = sidebar_font.render(self.message, True, WHITE)
-        message_rect = message_text.get_rect(center=(BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2, 350))
-        surface.blit(message_text, message_rect)
-        
-        # Draw timer for timed mode
-        if self.mode == GameMode.TIMED:
-            timer_text = font.render(f"Time: {int(self.timed_mode_timer)}s", True, WHITE)
-            timer_rect = timer_text.get_rect(center=(BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2, 380))
-            surface.blit(timer_text, timer_rect)
-        
-        # Draw championship info
-        if self.mode == GameMode.CHAMPIONSHIP:
-            round_text = font.render(f"Round: {self.championship_current_round}/{self.championship_rounds}", True, WHITE)
-            round_rect = round_text.get_rect(center=(BOARD_AREA_WIDTH + SIDEBAR_WIDTH // 2, 380))
-            surface.blit(round_text, round_rect)
-        
-        # Draw player list
-        list_title = sidebar_font.render("Players:", True, WHITE)
-        surface.blit(list_title, (BOARD_AREA_WIDTH + 20, 500))
-        for i, player in enumerate(self.players):
-            y_pos = 530 + i * 35
-            list_avatar = pygame.transform.scale(player.avatar_surface, (25, 25))
-            surface.blit(list_avatar, (BOARD_AREA_WIDTH + 20, y_pos - 12))
-            pos_text = sidebar_font.render(f"{player.name}: {player.pos}", True, WHITE)
-            surface.blit(pos_text, (BOARD_AREA_WIDTH + 50, y_pos - 10))
-            
-            # Draw power-ups in Power-Up mode
-            if self.mode == GameMode.POWER_UP and len(player.power_ups) > 0:
-                power_up_text = font.render(f"Power-ups: {len(player.power_ups)}", True, GOLD)
-                surface.blit(power_up_text, (BOARD_AREA_WIDTH + 50, y_pos + 10))
-    
     def draw(self, surface):
         """Draw the game"""
         # Draw background based on game state
@@ -1566,73 +1892,17 @@ class Game:
         else:
             surface.fill(PURPLE)
         
-        if self.state == GameState.MENU:
-            # Draw menu
-            title_rect = self.menu_title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(self.menu_title, title_rect)
-            
-            subtitle_rect = self.menu_subtitle.get_rect(center=(SCREEN_WIDTH // 2, 130))
-            surface.blit(self.menu_subtitle, subtitle_rect)
-            
-            # Draw menu options
-            self.menu_sounds_button.draw(surface)
-            self.menu_mode_dropdown.draw(surface)
-            self.menu_load_button.draw(surface)
-            self.menu_tutorial_button.draw(surface)
-            self.menu_settings_button.draw(surface)
-            
-            # Player slots have been removed from here
-            
-            # Draw buttons
-            self.menu_start_button.draw(surface)
-            self.menu_quick_start_button.draw(surface)
-            
-            # Draw footer text
-            footer_text = font.render("You can save and continue your game from the game menu", True, WHITE)
-            footer_rect = footer_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
-            surface.blit(footer_text, footer_rect)
-
-        # --- Draw Player Count Selection Screen ---
-        elif self.state == GameState.PLAYER_COUNT_SELECT:
-            title_rect = self.player_count_title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-            surface.blit(self.player_count_title, title_rect)
-
-            self.player_count_back_button.draw(surface)
-            self.player_count_two_button.draw(surface)
-            self.player_count_three_button.draw(surface)
-            self.player_count_four_button.draw(surface)
-
-        elif self.state == GameState.PLAYER_SETUP:
-            # Draw player setup
-            title_rect = self.setup_title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(self.setup_title, title_rect)
-            
-            for textbox, image_loader in self.setup_elements:
-                textbox.draw(surface)
-                image_loader.draw(surface)
-            
-            self.setup_back_button.draw(surface)
-            self.setup_start_button.draw(surface)
-        
-        elif self.state == GameState.PLAYING:
-            # Draw game board area
-            pygame.draw.rect(surface, LIGHT_BLUE, (0, 0, BOARD_AREA_WIDTH, SCREEN_HEIGHT))
-            
-            # Draw board
-            self.draw_board(surface)
-            
-            # Draw players
+        if self.state in [GameState.PLAYING, GameState.GAME_OVER]:
+            self.board_view.draw(surface)
             self.draw_players(surface)
-            
-            # Draw sidebar
-            self.draw_sidebar(surface)
-            
-            # Draw game buttons
-            self.game_roll_button.draw(surface)
-            self.game_save_button.draw(surface)
-            self.game_menu_button.draw(surface)
-            self.game_power_up_button.draw(surface)
-            
+        
+        # Titles, text, panels and buttons; each repaints only when its state changes
+        self.ui[self.state].draw(surface)
+        
+        if self.state == GameState.LOAD_SLOTS:
+            self.load_list.draw(surface)
+        
+        if self.state == GameState.PLAYING:
             # Draw animations
             for animation in self.animations:
                 animation.draw(surface)
@@ -1642,101 +1912,8 @@ class Game:
             
             # Draw power-up notification
             if self.show_power_up_notification:
-                notification_surf = pygame.Surface((400, 60), pygame.SRCALPHA)
-                notification_surf.fill((255, 215, 0, 200))  # Gold with transparency
-                notification_rect = notification_surf.get_rect(center=(SCREEN_WIDTH // 2, 150))
-                surface.blit(notification_surf, notification_rect)
-                
-                notification_text = font.render(self.power_up_notification_text, True, BLACK)
-                notification_text_rect = notification_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-                surface.blit(notification_text, notification_text_rect)
-        
-        elif self.state == GameState.GAME_OVER:
-            # Draw game board area
-            pygame.draw.rect(surface, LIGHT_BLUE, (0, 0, BOARD_AREA_WIDTH, SCREEN_HEIGHT))
-            
-            # Draw board
-            self.draw_board(surface)
-            
-            # Draw players
-            self.draw_players(surface)
-            
-            # Draw sidebar
-            self.draw_sidebar(surface)
-            
-            # Draw game over overlay
-            overlay_surf = pygame.Surface((400, 300), pygame.SRCALPHA)
-            overlay_surf.fill((255, 255, 255, 240))
-            overlay_rect = overlay_surf.get_rect(center=(BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2))
-            surface.blit(overlay_surf, overlay_rect)
-            
-            # Draw winner text
-            winner = self.players[self.winner_index]
-            win_text = title_font.render(f"{winner.name} Wins!", True, BLACK)
-            win_text_rect = win_text.get_rect(center=(BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2 - 80))
-            surface.blit(win_text, win_text_rect)
-            
-            # Draw winner avatar
-            winner_avatar = pygame.transform.scale(winner.avatar_surface, (80, 80))
-            winner_avatar_rect = winner_avatar.get_rect(center=(BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2))
-            surface.blit(winner_avatar, winner_avatar_rect)
-            
-            # Draw game mode specific information
-            if self.mode == GameMode.CHAMPIONSHIP:
-                # Show championship scores
-                score_text = subtitle_font.render("Championship Scores:", True, BLACK)
-                score_text_rect = score_text.get_rect(center=(BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-                surface.blit(score_text, score_text_rect)
-                
-                for i, (player, score) in enumerate(zip(self.players, self.championship_scores)):
-                    player_score_text = font.render(f"{player.name}: {score} wins", True, BLACK)
-                    player_score_rect = player_score_text.get_rect(center=(BOARD_AREA_WIDTH // 2, SCREEN_HEIGHT // 2 + 100 + i * 30))
-                    surface.blit(player_score_text, player_score_rect)
-            
-            # Draw buttons
-            self.game_over_play_again_button.draw(surface)
-            self.game_over_menu_button.draw(surface)
-        
-        elif self.state == GameState.TUTORIAL:
-            # Draw tutorial
-            title_rect = self.tutorial_title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(self.tutorial_title, title_rect)
-            
-            # Draw tutorial content
-            content_surf = pygame.Surface((700, 300), pygame.SRCALPHA)
-            content_surf.fill((255, 255, 255, 200))
-            content_rect = content_surf.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            surface.blit(content_surf, content_rect)
-            
-            # Split text into lines and render
-            lines = self.tutorial_pages[self.tutorial_current_page].split('\n')
-            for i, line in enumerate(lines):
-                text = font.render(line, True, BLACK)
-                text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60 + i * 40))
-                surface.blit(text, text_rect)
-            
-            # Draw navigation buttons
-            self.tutorial_prev_button.draw(surface)
-            self.tutorial_next_button.draw(surface)
-            self.tutorial_back_button.draw(surface)
-            
-            # Draw page indicator
-            page_text = font.render(f"Page {self.tutorial_current_page + 1} of {len(self.tutorial_pages)}", True, WHITE)
-            page_rect = page_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-            surface.blit(page_text, page_rect)
-        
-        elif self.state == GameState.SETTINGS:
-            # Draw settings
-            title_rect = self.settings_title.get_rect(center=(SCREEN_WIDTH // 2, 80))
-            surface.blit(self.settings_title, title_rect)
-            
-            # Draw settings options
-            self.settings_sounds_toggle.draw(surface)
-            self.settings_difficulty_dropdown.draw(surface)
-            self.settings_theme_dropdown.draw(surface)
-            
-            # Draw back button
-            self.settings_back_button.draw(surface)
+                self.power_up_banner.text = self.power_up_notification_text
+                self.power_up_banner.draw(surface)
 
 # Create the game instance
 game = Game()
@@ -1744,15 +1921,24 @@ game = Game()
 # Main game loop
 running = True
 while running:
+    if pending_assets:
+        apply_loaded_assets()
     for event in pygame.event.get():
         if not game.handle_event(event):
             running = False
     
     game.update()
+    audio.update()
     game.draw(screen)
     pygame.display.flip()
     clock.tick(60)
 
+asset_pool.shutdown(wait=False, cancel_futures=True)
+avatar_pipeline.shutdown()
+audio.stop_music(0)
+save_slots.shutdown()
+save_writer.close()
+
 # Clean up the tkinter root window when the game exits
 if tk_root:
     tk_root.destroy()
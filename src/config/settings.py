@@ -2,6 +2,14 @@ WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 980
 FPS = 60
 
+# "resizable": layout re-flows to the real window size and static layers are re-rasterized per size.
+# "scaled": draw at WINDOW_WIDTH x WINDOW_HEIGHT and let SDL upscale the frame on the GPU.
+WINDOW_MODE = "resizable"
+MIN_WINDOW_SIZE = (480, 490)
+
+# Upper bound for scaled image variants kept by AssetLoader (least recently used go first)
+SCALED_IMAGE_CACHE_BYTES = 32 * 1024 * 1024
+
 BOARD_SIZE = 700
 TILE_SIZE = 70
 BOARD_X = 130
@@ -32,6 +40,58 @@ COLOR_ACCENT = (102, 126, 234) # For highlighting selected options
 FONT_REGULAR = "assets/fonts/Nunito-Regular.ttf"
 FONT_BOLD = "assets/fonts/Nunito-Bold.ttf"
 
+# Built by `python -m src.services.bundle`; AssetLoader reads from it first when present
+ASSET_BUNDLE = "assets/assets.bundle"
+
+# Pre-scaled variants written by `python -m src.services.bake`, one set per window scale
+BAKED_DIR = "assets/baked"
+BAKE_SCALES = (1.0,)
+
+# Rendered static layers (board, background) kept between runs
+LAYER_CACHE_DIR = "cache/layers"
+LAYER_CACHE_BYTES = 64 * 1024 * 1024
+
+# Shared in-memory budget for all image, sound and layer caches (see CacheRegistry)
+CACHE_BUDGET_BYTES = 192 * 1024 * 1024
+
+# Mixer setup; a small buffer keeps effects in step with the animation
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = 512
+# Channels reserved per effect category (see AudioManager)
+AUDIO_CHANNELS = {"ui": 1, "dice": 1, "move": 2, "event": 3}
+# Seconds before the same effect may start again
+SFX_MIN_INTERVAL = {"ui": 0.05, "dice": 0.3, "move": 0.07, "event": 0.0}
+# Streamed with pygame.mixer.music when present
+MUSIC_TRACK = "assets/music/theme.ogg"
+MUSIC_VOLUME = 0.5
+# Synthesized effects for sounds without a file, cached as WAV
+SOUND_CACHE_DIR = "cache/sounds"
+
+# Save format v2 (src/services/savegame.py). Saves live in named slots listed by an index
+# file; the single-file saves from before slots are imported as the first slot.
+SAVE_SLOT_DIR = "saves/slots"
+# main.py's classic game keeps its own slots; its loose saves in saves/ are imported once
+CLASSIC_SAVE_SLOT_DIR = "saves/classic"
+LOOSE_SAVE_DIR = "saves"
+THUMBNAIL_SIZE = 120
+SAVE_FILE = "saves/game.sav"
+LEGACY_SAVE_FILE = "saves/game.json"
+AVATAR_BLOB_DIR = "saves/avatars"
+# Autosave: a snapshot plus a per-turn journal, folded into a new snapshot every N turns
+AUTOSAVE_DIR = "saves/autosave"
+AUTOSAVE_COMPACT_EVERY = 20
+# Finished games are kept as replays: seed, rolls and a full-state keyframe every N turns.
+# They are packed into segment files of up to REPLAY_SEGMENT_BYTES with a columnar index.
+REPLAY_DIR = "replays"
+REPLAY_KEYFRAME_EVERY = 100
+REPLAY_SEGMENT_BYTES = 32 * 1024 * 1024
+PROFILES_FILE = "profiles.json"
+# "sqlite" keeps profiles in PROFILES_DB (imported from PROFILES_FILE once); "json" uses the file directly
+PROFILE_BACKEND = "sqlite"
+PROFILES_DB = "profiles.db"
+# Seconds a changed save or profile waits before the writer thread flushes it
+WRITE_BEHIND_DELAY = 0.5
+
 PLAYER_COLORS = [
     (66, 135, 245), # Blue
     (255, 165, 0),  # Orange
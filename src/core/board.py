@@ -1,18 +1,21 @@
-import os
 import pygame
 from src.config import settings
+from src.ui.board_texture import render_board_texture
 
 class Board:
-    def __init__(self, assets=None):
-        self.origin = (settings.BOARD_X, settings.BOARD_Y)
-        self.size = settings.BOARD_SIZE
-        self.tile = settings.TILE_SIZE
-        self.rect = pygame.Rect(self.origin[0], self.origin[1], self.size, self.size)
+    def __init__(self, assets=None, origin=None, size=None):
+        self.place(origin or (settings.BOARD_X, settings.BOARD_Y), size or settings.BOARD_SIZE)
         self.snakes = settings.SNAKES.copy()
         self.ladders = settings.LADDERS.copy()
         self.special_tiles = settings.SPECIAL_TILES.copy()
         self.assets = assets
 
+    def place(self, origin, size):
+        self.origin = origin
+        self.size = size
+        self.tile = size // 10
+        self.rect = pygame.Rect(self.origin[0], self.origin[1], self.size, self.size)
+
     def square_pos(self, square):
         if square < 1:
             square = 1
@@ -39,12 +42,9 @@ class Board:
         return square, None
 
     def render(self, surface, font):
-        path = None
-        if self.assets:
-            path = self.assets.manifest["images"].get("board_bg")
-        if path and os.path.exists(path):
+        if self.assets and self.assets.has_image("board_bg"):
             img = self.assets.image("board_bg", (self.size, self.size))
-            surface.blit(img, self.origin)
+            surface.blit(img, self.origin, special_flags=self.assets.blend_flags("board_bg", (self.size, self.size)))
             # overlay numbers for clarity even with background image
             for r in range(10):
                 for c in range(10):
@@ -55,7 +55,12 @@ class Board:
                     y = self.origin[1] + (9 - r) * self.tile
                     s = font.render(str(n), True, (30,30,30))
                     surface.blit(s, (x + 6, y + 6))
-        
+        else:
+            # No background image: draw tiles, grid and numbers procedurally, once per size
+            build = lambda: render_board_texture(self.size, font)
+            img = self.assets.generated("board_bg", (self.size, self.size), build) if self.assets else build()
+            surface.blit(img, self.origin)
+
         # Draw special tiles
         for square, data in self.special_tiles["powerUps"].items():
             x, y = self.square_pos(square)
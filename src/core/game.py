@@ -1,71 +1,189 @@
-import os
+import zlib
 import pygame
-import base64 # Import base64 for image data handling
 from src.config import settings
 from src.services.assets import AssetLoader
-from src.services.persistence import save, load
+from src.services.preload import Preloader
+from src.services.disk_cache import DiskLayerCache
+from src.services.cache_budget import CacheRegistry
+from src.services.avatars import AvatarPipeline
+from src.services.audio import AudioManager
+from src.services.synth import SoundSynth
+from src.ui.layers import LayerCache, render_gradient
+from src.ui.viewport import Viewport
+from src.ui.debug_hud import DebugHud
+from src.ui.widgets import fonts, texts
+from src.services.savegame import BlobStore
+from src.services.slots import SaveSlots
+from src.services.journal import Journal
+from src.services.replay_archive import ReplayArchive
+from src.services.persistence import WriteBehind
+from src.services.profiles import ProfileStore
+from src.services.profile_db import SqliteProfileStore
 from src.scenes.menu_scene import MenuScene
 from src.scenes.board_scene import BoardScene
 from src.scenes.profile_scene import ProfileScene
+from src.scenes.multi_table_scene import MultiTableScene
+from src.scenes.loading_scene import LoadingScene
+from src.scenes.slot_picker_scene import SlotPickerScene
 
 class Game:
     def __init__(self):
+        pygame.mixer.pre_init(settings.AUDIO_FREQUENCY, -16, 2, settings.AUDIO_BUFFER)
         pygame.init()
-        pygame.mixer.init()
         self.width = settings.WINDOW_WIDTH
         self.height = settings.WINDOW_HEIGHT
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        flags = pygame.RESIZABLE
+        if settings.WINDOW_MODE == "scaled":
+            flags |= pygame.SCALED
+        self.screen = pygame.display.set_mode((self.width, self.height), flags)
+        self.view = Viewport((settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT), self.screen.get_size())
         pygame.display.set_caption("Snakes & Ladders")
         pygame.event.set_grab(True) # Ensure mouse events are captured
         pygame.mouse.set_visible(True) # Ensure mouse is visible
         self.clock = pygame.time.Clock()
-        self.assets = AssetLoader(settings.ASSET_MANIFEST)
+        self.caches = CacheRegistry(settings.CACHE_BUDGET_BYTES)
+        self.assets = AssetLoader(settings.ASSET_MANIFEST, registry=self.caches, synth=SoundSynth(settings.SOUND_CACHE_DIR))
+        self.audio = AudioManager(self.assets)
+        if self.assets.index.exists(settings.MUSIC_TRACK):
+            self.audio.play_music(settings.MUSIC_TRACK)
+        self.layers = LayerCache(DiskLayerCache(settings.LAYER_CACHE_DIR, settings.LAYER_CACHE_BYTES), self.caches)
+        texts.attach(self.caches)
+        fonts.attach(self.assets)
+        self.hud = DebugHud(self)
+        # Saves, avatars and profiles are written on a background thread
+        self.writer = WriteBehind(settings.WRITE_BEHIND_DELAY)
+        self.blobs = BlobStore(settings.AVATAR_BLOB_DIR, self.writer)
+        self.slots = SaveSlots(settings.SAVE_SLOT_DIR, self.blobs, self.writer)
+        if not self.slots.slots:
+            # Saves from before slots existed become the first slot
+            for path in (settings.SAVE_FILE, settings.LEGACY_SAVE_FILE):
+                try:
+                    if self.slots.import_file(path, "imported", "Earlier save"):
+                        break
+                except (OSError, ValueError, KeyError, IndexError, TypeError, zlib.error, pygame.error) as e:
+                    # A malformed old save is left where it is; the game starts without it
+                    print(f"Warning: could not import {path}: {e}")
+        if settings.PROFILE_BACKEND == "sqlite":
+            self.profiles = SqliteProfileStore(settings.PROFILES_DB, legacy_json=settings.PROFILES_FILE)
+        else:
+            self.profiles = ProfileStore(settings.PROFILES_FILE, self.writer)
+        self.avatars = AvatarPipeline((settings.TILE_SIZE,))
+        self.preloader = Preloader(self.assets)
+        self.autosave = Journal(settings.AUTOSAVE_DIR, settings.AUTOSAVE_COMPACT_EVERY)
+        self.replays = ReplayArchive(settings.REPLAY_DIR, settings.REPLAY_SEGMENT_BYTES)
         self.scenes = []
         self.paused = False
-        self.push(MenuScene(self))
+        # A game cut short by a crash or reboot picks up where it stopped
+        try:
+            recovered = self.autosave.recover(self.blobs)
+            if recovered is not None:
+                self.load_state(recovered)
+        except (OSError, ValueError, KeyError, IndexError, TypeError, zlib.error) as e:
+            # A damaged autosave, or one from a newer game, must not stop the game starting
+            print(f"Warning: discarding autosave: {e}")
+            self.autosave.clear()
+            recovered = None
+        if recovered is None:
+            self.goto_menu()
+        # Missing effects are synthesized (or read back from the WAV cache) in the background
+        self.preloader.submit({"sounds": [k for k in settings.ASSET_MANIFEST["sounds"] if k in self.assets.synth]})
 
     def push(self, scene):
         self.scenes.append(scene)
 
     def pop(self):
-        self.scenes.pop()
+        self.scenes.pop().close()
+
+    def show(self, manifest, build):
+        # Switch to build()'s scene, behind a loading screen if its assets are still on disk
+        self.preloader.submit(manifest)
+        # Closed first, so the old scene's caches are gone before the new one registers its own
+        for scene in self.scenes:
+            scene.close()
+        if self.preloader.busy():
+            self.scenes = [LoadingScene(self, build)]
+        else:
+            self.scenes = [build()]
 
     def start_board(self, names, player_images, sound_on, mode):
-        self.scenes = [BoardScene(self, names, player_images, sound_on, mode)]
+        def build():
+            scene = BoardScene(self, names, player_images, sound_on, mode)
+            self.autosave.begin(scene.serialize())
+            return scene
+        self.show(BoardScene.manifest(self), build)
 
     def goto_menu(self):
-        self.scenes = [MenuScene(self)]
+        self.show(MenuScene.manifest(self), lambda: MenuScene(self))
 
     def goto_profiles(self):
-        self.scenes = [ProfileScene(self)]
+        self.show(ProfileScene.manifest(self), lambda: ProfileScene(self))
+
+    def goto_slots(self):
+        self.show(SlotPickerScene.manifest(self), lambda: SlotPickerScene(self))
 
-    def save_state(self, data):
-        save(os.path.join("saves", "game.json"), data)
+    def goto_tables(self, count=8):
+        self.show(MultiTableScene.manifest(self), lambda: MultiTableScene(self, count))
 
-    def load_saved(self):
-        data = load(os.path.join("saves", "game.json"))
-        if not data:
+    def resize(self, size):
+        # pygame 2 resizes the display surface itself; we only re-flow onto it
+        self.screen = pygame.display.get_surface()
+        if self.screen.get_size() != tuple(size):
+            self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        size = self.screen.get_size()
+        if size == (self.width, self.height):
             return
+        self.width, self.height = size
+        self.view.resize((max(size[0], settings.MIN_WINDOW_SIZE[0]), max(size[1], settings.MIN_WINDOW_SIZE[1])))
+        # Static layers are re-rasterized lazily at the new size, once
+        self.layers.clear()
+        for scene in self.scenes:
+            scene.layout()
+
+    def background(self):
+        size = (self.width, self.height)
+        colors = (settings.COLOR_BG_TOP, settings.COLOR_BG_BOTTOM)
+        return self.layers.get(("background", size), lambda: render_gradient(size, *colors), lambda: colors)
+
+    def save_state(self, data, slot_id=None, name=None, thumbnail=None):
+        """Write data to slot_id (a new slot when None) and return the slot id."""
+        slot_id = slot_id or self.slots.new_id()
+        return self.slots.save(slot_id, name or "Saved game", data, thumbnail)
+
+    def load_saved(self, slot_id=None):
+        slot_id = slot_id or self.slots.latest()
+        data = self.slots.load(slot_id) if slot_id else None
+        if data is not None:
+            self.load_state(data, slot_id)
+
+    def load_state(self, data, slot_id=None):
         players_data = data["players"]
         names = [p["name"] for p in players_data]
-        player_images = []
-        for p_data in players_data:
-            if "image_data" in p_data and p_data["image_data"]:
-                img_bytes = base64.b64decode(p_data["image_data"])
-                img_surface = pygame.image.fromstring(img_bytes, p_data["image_size"], 'RGBA')
-                player_images.append(img_surface)
-            else:
-                player_images.append(None) # Ensure None is appended if no image data
-
-        scene = BoardScene(self, names, player_images, True, data.get("mode","Classic"))
-        for i, pd in enumerate(players_data):
-            scene.players[i].square = pd["square"]
-        scene.turn = data["turn"]
-        scene.mode = data.get("mode", "classic")
-        scene.timed_remaining = data.get("timed_remaining", settings.TIMED_MODE_DURATION)
-        scene.endless_scores = data.get("endless_scores", [0]*len(names))
-        scene.start_mode_logic() # Restart mode logic after loading
-        self.scenes = [scene]
+        # Read now, so a malformed save fails here rather than later inside build()
+        turn = data["turn"]
+        squares = [pd["square"] for pd in players_data]
+
+        def build():
+            scene = BoardScene(self, names, None, True, data.get("mode","Classic"))
+            for i, pd in enumerate(players_data):
+                scene.players[i].square = scene.players[i].anim_from = scene.players[i].anim_to = squares[i]
+                for flag in ("doubleNext", "halfNext", "skipSnake", "loseTurn"):
+                    setattr(scene.players[i], flag, pd.get(flag, False))
+                # Avatars decode on the pipeline; tokens show the default until they are ready
+                if pd.get("avatar") and self.blobs.exists(pd["avatar"]):
+                    scene.load_avatar_later(i, self.avatars.load(self.blobs.path(pd["avatar"])))
+            scene.turn = turn
+            scene.mode = data.get("mode", "classic")
+            # The scene started its mode logic already; restore the clock and scores it reset
+            scene.timed_remaining = data.get("timed_remaining", settings.TIMED_MODE_DURATION)
+            scene.endless_scores = data.get("endless_scores", [0]*len(names))
+            scene.slot_id = slot_id
+            scene.start_recording()
+            self.autosave.begin(scene.serialize())
+            return scene
+        self.show(BoardScene.manifest(self), build)
+
+    def keep_replay(self, recording):
+        self.replays.submit(recording)
 
     def run(self):
         running = True
@@ -76,9 +194,27 @@ class Game:
                 print(f"Game event: {event.type}") # Debug print for all events
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == pygame.VIDEORESIZE and settings.WINDOW_MODE != "scaled":
+                    self.resize(event.size)
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    self.hud.toggle()
                 else:
                     self.scenes[-1].handle(event)
             self.scenes[-1].update(dt)
+            self.audio.update()
             self.scenes[-1].render(self.screen)
+            self.hud.update(dt)
+            self.hud.draw(self.screen)
             pygame.display.flip()
+        if isinstance(self.scenes[-1], BoardScene):
+            # The autosave resumes the game next launch; its replay so far is kept now
+            self.scenes[-1].end_recording()
+        self.preloader.shutdown()
+        self.avatars.shutdown()
+        self.slots.shutdown()
+        self.replays.shutdown()
+        self.autosave.close()
+        self.profiles.close()
+        self.writer.close()
+        self.audio.stop_music(0)
         pygame.quit()
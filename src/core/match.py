@@ -0,0 +1,66 @@
+import random
+from src.config import settings
+from src.core.board import Board
+from src.core.player import Player, pack_flags, unpack_flags
+from src.core.rules import resolve_landing, next_turn
+
+class Match:
+    """Headless game state driven by whole turns, without animation or UI."""
+
+    def __init__(self, names, mode="classic", seed=None, board=None):
+        self.board = board or Board()
+        self.players = [Player(n, settings.PLAYER_COLORS[i % len(settings.PLAYER_COLORS)], None) for i, n in enumerate(names)]
+        self.mode = mode
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.turn = 0
+        self.turns_played = 0
+        self.winner = None
+        self.endless_scores = [0] * len(names)
+
+    def roll(self):
+        return self.rng.randint(1, 6)
+
+    def play_turn(self, face=None):
+        """Move the current player by face (rolled if omitted) and resolve the landing."""
+        if face is None:
+            face = self.roll()
+        idx = self.turn
+        p = self.players[idx]
+        p.enqueue_steps(face)
+        while p.step():
+            pass
+        kind, before = resolve_landing(self.board, p)
+        self.turns_played += 1
+        event = {"player": idx, "roll": face, "kind": kind, "from": before, "square": p.square}
+        if p.square == 100:
+            if self.mode == "endless":
+                self.endless_scores[idx] += 1
+                for other in self.players:
+                    other.square = 1
+            else:
+                self.winner = p
+            event["won"] = True
+        else:
+            self.turn = next_turn(self.players, self.turn)
+        return event
+
+    def snapshot(self):
+        """Full turn state as plain data (a replay keyframe). The RNG is not included."""
+        return {
+            "turn": self.turn,
+            "played": self.turns_played,
+            "players": [[p.square, pack_flags(p)] for p in self.players],
+            "scores": list(self.endless_scores),
+            "winner": self.players.index(self.winner) if self.winner else None,
+        }
+
+    def restore(self, state):
+        for p, (square, flags) in zip(self.players, state["players"]):
+            p.square = p.anim_from = p.anim_to = square
+            p.move_queue = []
+            unpack_flags(p, flags)
+        self.turn = state["turn"]
+        self.turns_played = state["played"]
+        self.endless_scores = list(state["scores"])
+        self.winner = None if state["winner"] is None else self.players[state["winner"]]
@@ -0,0 +1,42 @@
+import math
+from bisect import bisect_right
+
+class ArcLengthPath:
+    """Polyline resampled at equal arc-length steps so lookups are O(1)."""
+
+    def __init__(self, points, samples=64):
+        self.points = [(float(x), float(y)) for x, y in points]
+        cumulative = [0.0]
+        for i in range(1, len(self.points)):
+            x0, y0 = self.points[i - 1]
+            x1, y1 = self.points[i]
+            cumulative.append(cumulative[-1] + math.hypot(x1 - x0, y1 - y0))
+        self.cumulative = cumulative
+        self.length = cumulative[-1]
+        self.samples = max(1, samples)
+        self.table = [self._locate(self.length * i / self.samples) for i in range(self.samples + 1)]
+
+    def _locate(self, distance):
+        # Binary search on the cumulative lengths; only used while building the table
+        if len(self.points) == 1 or self.length == 0:
+            return self.points[0]
+        i = min(bisect_right(self.cumulative, distance), len(self.points) - 1)
+        seg_start = self.cumulative[i - 1]
+        seg_len = self.cumulative[i] - seg_start
+        t = 0.0 if seg_len == 0 else (distance - seg_start) / seg_len
+        x0, y0 = self.points[i - 1]
+        x1, y1 = self.points[i]
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+    def at(self, distance):
+        if self.length == 0:
+            return self.table[0]
+        u = min(max(distance / self.length, 0.0), 1.0) * self.samples
+        i = min(int(u), self.samples - 1)
+        t = u - i
+        x0, y0 = self.table[i]
+        x1, y1 = self.table[i + 1]
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+
+    def at_fraction(self, f):
+        return self.at(f * self.length)
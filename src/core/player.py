@@ -1,6 +1,16 @@
 import pygame # Import pygame to handle default image creation
 from src.config import settings
 
+# Power-up/down flags, in the order saves and replays pack them
+FLAGS = ("doubleNext", "halfNext", "skipSnake", "loseTurn")
+
+def pack_flags(player):
+    return sum(1 << i for i, f in enumerate(FLAGS) if getattr(player, f))
+
+def unpack_flags(player, bits):
+    for i, f in enumerate(FLAGS):
+        setattr(player, f, bool(bits >> i & 1))
+
 class Player:
     def __init__(self, name, color, image=None):
         self.name = name
@@ -30,6 +40,11 @@ class Player:
         self.animated_x = None
         self.animated_y = None
 
+        # Snake/ladder path following (pixels per second along the path)
+        self.path = None
+        self.path_dist = 0.0
+        self.path_speed = 280.0
+
     def enqueue_steps(self, steps):
         for _ in range(steps):
             self.move_queue.append(1)
@@ -51,3 +66,21 @@ class Player:
     def advance_anim(self, dt):
         if self.anim_t < 1.0:
             self.anim_t = min(1.0, self.anim_t + dt * self.anim_speed)
+        if self.path is not None:
+            self.path_dist += dt * self.path_speed
+            if self.path_dist >= self.path.length:
+                self.path = None
+
+    def follow(self, path):
+        self.path = path
+        self.path_dist = 0.0
+        self.anim_from = self.square
+        self.anim_to = self.square
+        self.anim_t = 1.0
+
+    def following_path(self):
+        return self.path is not None
+
+    def path_pos(self):
+        return self.path.at(self.path_dist)
+
@@ -0,0 +1,110 @@
+import bisect
+import json
+import struct
+import zlib
+from src.core.match import Match
+
+# Recording layout: MAGIC, then zlib of (header length, JSON header, one byte per roll)
+MAGIC = b"SLR1"
+KEYFRAME_EVERY = 100
+
+class Recording:
+    """A game as its seed, starting players and the stream of rolls.
+
+    keyframes are Match.snapshot() dicts keyed by "i", the number of rolls
+    already applied; the first one is the starting state.
+    """
+
+    def __init__(self, names, mode, seed, rolls=None, keyframes=None):
+        self.names = list(names)
+        self.mode = mode
+        self.seed = seed
+        self.rolls = bytearray(rolls or b"")
+        self.keyframes = keyframes or []
+
+    def __len__(self):
+        return len(self.rolls)
+
+    def dumps(self):
+        header = json.dumps({"names": self.names, "mode": self.mode, "seed": self.seed, "keyframes": self.keyframes},
+                            separators=(",", ":")).encode("utf-8")
+        return MAGIC + zlib.compress(struct.pack("<I", len(header)) + header + bytes(self.rolls), 6)
+
+    @classmethod
+    def loads(cls, data):
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError("not a replay")
+        raw = zlib.decompress(data[len(MAGIC):])
+        size = struct.unpack_from("<I", raw)[0]
+        header = json.loads(raw[4:4 + size].decode("utf-8"))
+        return cls(header["names"], header["mode"], header["seed"], raw[4 + size:], header["keyframes"])
+
+class Recorder:
+    """Builds a Recording by running every roll through a Match of its own.
+
+    The Match keeps the keyframes honest: they are the engine's state, not
+    the caller's. Pass start (a Match.snapshot()) for a game resumed midway.
+    """
+
+    def __init__(self, names, mode="classic", seed=None, start=None, every=KEYFRAME_EVERY):
+        self.match = Match(names, mode, seed)
+        if start is not None:
+            self.match.restore(start)
+        self.every = every
+        self.recording = Recording(names, mode, seed, keyframes=[dict(self.match.snapshot(), i=0)])
+
+    def record(self, face):
+        event = self.match.play_turn(face)
+        self.recording.rolls.append(face)
+        if len(self.recording.rolls) % self.every == 0:
+            self.recording.keyframes.append(dict(self.match.snapshot(), i=len(self.recording.rolls)))
+        return event
+
+class ReplayPlayer:
+    """Plays a Recording back through Match at any speed, with seeking.
+
+    seek(n) restores the last keyframe at or before roll n and replays only
+    the rolls after it, so a jump into a long endless session costs at most
+    one keyframe interval of turns.
+    """
+
+    def __init__(self, recording, board=None):
+        self.recording = recording
+        self.match = Match(recording.names, recording.mode, recording.seed, board)
+        self.marks = [k["i"] for k in recording.keyframes]
+        self.position = None
+        self.clock = 0.0
+        self.seek(0)
+
+    def done(self):
+        return self.position >= len(self.recording.rolls)
+
+    def step(self):
+        """Play the next recorded roll; returns Match.play_turn's event, or None at the end."""
+        if self.done():
+            return None
+        event = self.match.play_turn(self.recording.rolls[self.position])
+        self.position += 1
+        return event
+
+    def seek(self, position):
+        position = max(0, min(position, len(self.recording.rolls)))
+        k = bisect.bisect_right(self.marks, position) - 1
+        keyframe = self.recording.keyframes[k]
+        # Stepping on is cheaper when we are already between that keyframe and the target
+        if self.position is None or not keyframe["i"] <= self.position <= position:
+            self.match.restore(keyframe)
+            self.position = keyframe["i"]
+        while self.position < position:
+            self.step()
+        self.clock = 0.0
+        return self.match
+
+    def advance(self, dt, turns_per_second):
+        """Play as many turns as dt seconds hold at the given speed; returns their events."""
+        self.clock += dt * turns_per_second
+        events = []
+        while self.clock >= 1.0 and not self.done():
+            self.clock -= 1.0
+            events.append(self.step())
+        return events
@@ -0,0 +1,33 @@
+def resolve_landing(board, player):
+    """Apply the tile the player finished on, once. Returns (kind, before)."""
+    before = player.square
+    new, kind = board.apply_collision(player.square)
+    if kind == "snake":
+        if player.skipSnake:
+            player.skipSnake = False
+            kind = "snake_avoided"
+        else:
+            player.snake_hits += 1
+            player.square = new
+    elif kind == "ladder":
+        player.climbed += max(0, new - player.square)
+        player.square = new
+    elif kind == "power_up":
+        power_up_type = board.special_tiles["powerUps"][player.square]["type"]
+        if power_up_type == 'forward5':
+            player.square = min(100, player.square + 5)
+    elif kind == "power_down":
+        power_down_type = board.special_tiles["powerDowns"][player.square]["type"]
+        if power_down_type == 'backward6':
+            player.square = max(1, player.square - 6)
+        elif power_down_type == 'loseTurn':
+            player.loseTurn = True
+    return kind, before
+
+def next_turn(players, turn):
+    """Index of the player who rolls next; consumes a pending lost turn."""
+    p = players[turn]
+    if p.loseTurn:
+        p.loseTurn = False
+        return turn
+    return (turn + 1) % len(players)
@@ -2,6 +2,24 @@ class Scene:
     def __init__(self, game):
         self.game = game
 
+    @classmethod
+    def manifest(cls, game):
+        # Assets to load in the background before the scene is built
+        return {}
+
+    @classmethod
+    def image_sizes(cls, view):
+        # {image key: [(w, h)]} this scene scales to under view; read by the bake command
+        return {}
+
+    def layout(self):
+        # Called after the window changes size; rebuild anything positioned in window pixels
+        pass
+
+    def close(self):
+        # Called when the game leaves the scene; give back anything it charged to game.caches
+        pass
+
     def handle(self, event):
         pass
 
@@ -1,23 +1,32 @@
 import pygame
+from src.ui.widgets import Widget
 
-class Button:
+class Button(Widget):
     def __init__(self, rect, color, text_surf, value=None):
-        self.rect = pygame.Rect(rect)
+        super().__init__(rect)
         self.color = color
         self.text_surf = text_surf
         self.enabled = True
         self.value = value # Added value attribute
 
+    def state(self):
+        return (self.color, id(self.text_surf))
+
+    def set_label(self, text_surf):
+        self.text_surf = text_surf
+        self.invalidate()
+
     def handle(self, event):
-        if not self.enabled:
+        if not self.enabled or not self.visible:
             return False
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.rect.collidepoint(event.pos):
                 return True
         return False
 
-    def draw(self, surface):
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=12)
-        pygame.draw.rect(surface, (0,0,0), self.rect, width=2, border_radius=12)
-        r = self.text_surf.get_rect(center=self.rect.center)
+    def paint(self, surface):
+        local = surface.get_rect()
+        pygame.draw.rect(surface, self.color, local, border_radius=12)
+        pygame.draw.rect(surface, (0,0,0), local, width=2, border_radius=12)
+        r = self.text_surf.get_rect(center=local.center)
         surface.blit(self.text_surf, r)
@@ -1,11 +1,12 @@
 import random
 import math
-import os
 import pygame
 
 class Dice:
-    def __init__(self, asset_loader):
+    def __init__(self, asset_loader, rng=None):
         self.asset_loader = asset_loader
+        # Only the settled face comes from rng, so a seeded game rolls the same however fast it renders
+        self.rng = rng or random.Random()
         self.face = 1
         self.time = 0.0
         self.rolling = False
@@ -20,12 +21,6 @@ class Dice:
         self.time = 0.0
         self.angle = 0.0
         self.offset = 0.0
-        s = self.asset_loader.sound("roll")
-        if s:
-            try:
-                s.play()
-            except Exception:
-                pass
 
     def update(self, dt):
         if not self.rolling:
@@ -36,23 +31,29 @@ class Dice:
         self.offset = 6 * math.sin(self.time * 18)
         if self.time >= self.duration:
             self.rolling = False
-            self.face = random.randint(1, 6)
+            self.face = self.rng.randint(1, 6)
             return True
         return False
 
-    def draw(self, surface, rect):
+    def draw(self, surface, rect, atlas=None):
         base = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
         shade = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
         pygame.draw.rect(shade, (0,0,0,60), (6,8,rect[2]-12,rect[3]-12), border_radius=12)
         base.blit(shade, (0,0))
-        custom_path = self.asset_loader.manifest["images"].get("dice_custom")
-        use_custom = custom_path and os.path.exists(custom_path)
-        src = self.asset_loader.image("dice_custom", (rect[2] - 16, rect[3] - 16)) if use_custom else self.asset_loader.image(f"dice_{self.face}", (rect[2] - 16, rect[3] - 16))
+        use_custom = self.asset_loader.has_image("dice_custom")
+        name = "dice_custom" if use_custom else f"dice_{self.face}"
+        face = (rect[2] - 16, rect[3] - 16)
+        if atlas is not None and name in atlas:
+            src = atlas.surface(name)
+            flags = pygame.BLEND_PREMULTIPLIED
+        else:
+            src = self.asset_loader.image(name, face)
+            flags = self.asset_loader.blend_flags(name, face)
         img = pygame.transform.rotate(src, self.angle if self.rolling else 0)
         r = img.get_rect(center=(rect[0] + rect[2] // 2, rect[1] + rect[3] // 2 + int(self.offset)))
         pygame.draw.rect(surface, (240,240,255), rect, border_radius=12)
         pygame.draw.rect(surface, (0, 0, 0), rect, width=3, border_radius=12)
-        surface.blit(img, r)
+        surface.blit(img, r, special_flags=flags)
         if not self.rolling:
             if self.face == 6:
                 glow = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
@@ -1,10 +1,21 @@
+import math
 import pygame
 from src.config import settings
+from src.core.path import ArcLengthPath
 
 class Ladder:
     def __init__(self, bottom_square, top_square):
         self.bottom_square = bottom_square
         self.top_square = top_square
+        self._path = None
+        self._path_key = None
+
+    def path(self, board):
+        # Climb along the centre line between the rails, bottom to top
+        if self._path is None or self._path_key != (board.origin, board.tile):
+            self._path = ArcLengthPath([board.square_pos(self.bottom_square), board.square_pos(self.top_square)], samples=16)
+            self._path_key = (board.origin, board.tile)
+        return self._path
 
     def draw(self, surface, board):
         s_coord = board.square_pos(self.bottom_square)
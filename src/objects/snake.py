@@ -1,6 +1,7 @@
 import math
 import pygame
 from src.config import settings
+from src.core.path import ArcLengthPath
 
 class Snake:
     def __init__(self, head_square, tail_square):
@@ -10,6 +11,8 @@ class Snake:
         self.eat_time = 0.0
         self.amplitude = 10.0
         self.frequency = 2.0
+        self._path = None
+        self._path_key = None
 
     def update(self, dt):
         self.time += dt
@@ -49,6 +52,13 @@ class Snake:
             pts.append((x, y))
         return pts
 
+    def path(self, board):
+        # Head-to-tail body as an arc-length table, rebuilt only if the board moves
+        if self._path is None or self._path_key != (board.origin, board.tile):
+            self._path = ArcLengthPath(self._path_points(board))
+            self._path_key = (board.origin, board.tile)
+        return self._path
+
     def draw(self, surface, board):
         pts = self._path_points(board)
         
@@ -170,6 +180,7 @@ class Snake:
         pygame.draw.line(surface, (211, 47, 47), (int(tongue_start_x), int(tongue_start_y)), (int(tongue_end_x2), int(tongue_end_y2)), int(tongue_width))
         
         # Draw snake tail
+        e_coord = pts[-1]
         tail_size = int(board.tile * 0.25)
         pygame.draw.circle(surface, settings.COLOR_SNAKE, (int(e_coord[0]), int(e_coord[1])), tail_size)
         pygame.draw.circle(surface, settings.COLOR_SNAKE_DARK, (int(e_coord[0]), int(e_coord[1])), tail_size, int(board.tile * 0.05))
@@ -1,19 +1,28 @@
 import pygame
 from src.ui.draw import pill
+from src.ui.widgets import Widget
 
-class StatusBar:
+class StatusBar(Widget):
     def __init__(self, rect, color1, color2, font):
-        self.rect = pygame.Rect(rect)
+        super().__init__(rect)
         self.c1 = color1
         self.c2 = color2
         self.font = font
         self.text = ""
+        self.color_text = (0, 0, 0)
+
+    def state(self):
+        return (self.text, self.color_text)
 
     def set_text(self, s):
         self.text = s
 
+    def paint(self, surface):
+        pill(surface, surface.get_rect(), self.c1, self.c2)
+        img = self.label(self.font, self.text, self.color_text)
+        r = img.get_rect(center=surface.get_rect().center)
+        surface.blit(img, r)
+
     def draw(self, surface, color_text):
-        pill(surface, self.rect, self.c1, self.c2)
-        img = self.font.render(self.text, True, color_text)
-        r = img.get_rect(center=self.rect.center)
-        surface.blit(img, r)
\ No newline at end of file
+        self.color_text = color_text
+        super().draw(surface)
@@ -1,9 +1,11 @@
+import random
 import pygame
 from src.core.scene import Scene
 from src.config import settings
 from src.core.board import Board
-from src.core.player import Player
-from src.objects.token import Token
+from src.core.player import Player, pack_flags
+from src.core.replay import Recorder
+from src.core.rules import resolve_landing, next_turn
 from src.objects.dice import Dice
 from src.objects.button import Button
 from src.objects.status_bar import StatusBar
@@ -11,37 +13,50 @@ from src.objects.snake import Snake
 from src.objects.ladder import Ladder
 from src.objects.zombie import ZombieSnake
 from src.objects.confetti import Confetti # Import Confetti
-from src.ui.draw import vertical_gradient
+from src.ui.widgets import WidgetLayer, Label
+from src.ui.atlas import TextureAtlas
+from src.ui.layers import render_board_layer, board_layer_margin, board_layer_inputs
+from src.services.slots import render_thumbnail
+from src.services.journal import turn_record
 
 class BoardScene(Scene):
-    def __init__(self, game, names, player_images, sound_on, mode):
+    @classmethod
+    def manifest(cls, game):
+        v = game.view
+        return {
+            "images": [f"dice_{i}" for i in range(1, 7)] + ["dice_custom", "token", "board_bg"],
+            "sounds": ["roll", "step", "snake", "ladder", "win"],
+            "fonts": [(settings.FONT_REGULAR, v.size(18)), (settings.FONT_BOLD, v.size(24)), (settings.FONT_BOLD, v.size(20))],
+        }
+
+    @classmethod
+    def image_sizes(cls, view):
+        board = view.size(settings.BOARD_SIZE) // 10 * 10
+        token = (board // 20, board // 20)
+        face = (view.size(80) - 16, view.size(80) - 16)
+        sizes = {f"dice_{i}": [face] for i in range(1, 7)}
+        sizes.update({"dice_custom": [face], "token": [token], "avatar": [token], "board_bg": [(board, board)]})
+        return sizes
+
+    def __init__(self, game, names, player_images, sound_on, mode, seed=None):
         super().__init__(game)
         self.board = Board(game.assets)
         self.players = []
+        self.token_sources = []
         for i, n in enumerate(names):
-            player_img_surface = None
             if player_images and i < len(player_images) and player_images[i]:
-                player_img_surface = pygame.transform.scale(player_images[i], (settings.TILE_SIZE // 2, settings.TILE_SIZE // 2))
+                self.token_sources.append(player_images[i])
             else:
                 # Fallback to a default token image if no custom image or if it failed to load
-                default_token = game.assets.image("token", (settings.TILE_SIZE // 2, settings.TILE_SIZE // 2))
-                player_img_surface = default_token
-            self.players.append(Player(n, settings.PLAYER_COLORS[i % len(settings.PLAYER_COLORS)], player_img_surface))
+                self.token_sources.append(None)
+            self.players.append(Player(n, settings.PLAYER_COLORS[i % len(settings.PLAYER_COLORS)], None))
         
         self.turn = 0
-        self.dice = Dice(game.assets)
-        self.font = game.assets.font(settings.FONT_REGULAR, 18)
-        self.big_font = game.assets.font(settings.FONT_BOLD, 24)
-        self.status = StatusBar((130, 820, 700, 45), settings.COLOR_STATUS_BG1, settings.COLOR_STATUS_BG2, self.big_font)
-        
-        self.roll_btn = Button((130, 880, 120, 44), settings.COLOR_BUTTON_ROLL, self.big_font.render("Roll", True, settings.COLOR_BUTTON_TEXT))
-        self.pause_btn = Button((260, 880, 120, 44), settings.COLOR_BUTTON_PAUSE, self.big_font.render("Pause", True, settings.COLOR_BUTTON_TEXT))
-        self.resume_btn = Button((260, 880, 120, 44), settings.COLOR_BUTTON_RESUME, self.big_font.render("Resume", True, settings.COLOR_BUTTON_TEXT))
-        self.save_btn = Button((390, 880, 120, 44), settings.COLOR_BUTTON_SAVE, self.big_font.render("Save", True, settings.COLOR_BUTTON_TEXT))
-        self.restart_btn = Button((520, 880, 120, 44), settings.COLOR_BUTTON_RESTART, self.big_font.render("Restart", True, settings.COLOR_BUTTON_TEXT))
-        self.menu_btn = Button((650, 880, 120, 44), settings.COLOR_BUTTON_MENU, self.big_font.render("Menu", True, settings.COLOR_BUTTON_TEXT))
-        
-        self.dice_rect = pygame.Rect(30, 820, 80, 80)
+        self.pending_landing = False
+        # Every roll comes from one seeded RNG, so the game can be recorded and replayed
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.dice = Dice(game.assets, random.Random(self.seed))
+        self.status = StatusBar((0, 0, 1, 1), settings.COLOR_STATUS_BG1, settings.COLOR_STATUS_BG2, None)
         self.sound_on = sound_on
         self.mode = mode
         self.winner = None
@@ -57,14 +72,120 @@ class BoardScene(Scene):
         self.timed_total_seconds = settings.TIMED_MODE_DURATION # Default 2 minutes
         self.timed_remaining = self.timed_total_seconds
         self.timed_interval = None
-        self.timer_font = game.assets.font(settings.FONT_BOLD, 20)
 
         # Endless mode variables
         self.endless_scores = [0] * len(self.players)
         self.confetti_particles = [] # Initialize confetti particles list
+        self.pending_avatars = {}
+        self.slot_id = None
 
+        self.layout()
         self.status.set_text(f"Player {self.turn+1} to roll")
         self.start_mode_logic()
+        self.start_recording()
+
+    def layout(self):
+        v = self.game.view
+        self.board.place(v.point((settings.BOARD_X, settings.BOARD_Y)), v.size(settings.BOARD_SIZE) // 10 * 10)
+        # Arc-length tables are built once per layout; tokens only look positions up while sliding
+        self.snake_paths = {s.head_square: s.path(self.board) for s in self.snakes}
+        self.ladder_paths = {l.bottom_square: l.path(self.board) for l in self.ladders}
+
+        self.font = self.game.assets.font(settings.FONT_REGULAR, v.size(18))
+        self.big_font = self.game.assets.font(settings.FONT_BOLD, v.size(24))
+        self.timer_font = self.game.assets.font(settings.FONT_BOLD, v.size(20))
+        self.status.rect = v.rect((130, 820, 700, 45))
+        self.status.font = self.big_font
+        self.status.invalidate()
+        
+        self.roll_btn = Button(v.rect((130, 880, 120, 44)), settings.COLOR_BUTTON_ROLL, self.big_font.render("Roll", True, settings.COLOR_BUTTON_TEXT))
+        self.pause_btn = Button(v.rect((260, 880, 120, 44)), settings.COLOR_BUTTON_PAUSE, self.big_font.render("Pause", True, settings.COLOR_BUTTON_TEXT))
+        self.resume_btn = Button(v.rect((260, 880, 120, 44)), settings.COLOR_BUTTON_RESUME, self.big_font.render("Resume", True, settings.COLOR_BUTTON_TEXT))
+        self.save_btn = Button(v.rect((390, 880, 120, 44)), settings.COLOR_BUTTON_SAVE, self.big_font.render("Save", True, settings.COLOR_BUTTON_TEXT))
+        self.restart_btn = Button(v.rect((520, 880, 120, 44)), settings.COLOR_BUTTON_RESTART, self.big_font.render("Restart", True, settings.COLOR_BUTTON_TEXT))
+        self.menu_btn = Button(v.rect((650, 880, 120, 44)), settings.COLOR_BUTTON_MENU, self.big_font.render("Menu", True, settings.COLOR_BUTTON_TEXT))
+        self.ui = WidgetLayer()
+        self.ui.add(self.roll_btn, self.pause_btn, self.resume_btn, self.save_btn, self.restart_btn, self.menu_btn)
+        
+        self.dice_rect = v.rect((30, 820, 80, 80))
+        self.build_atlas()
+        self.dice_label = Label((self.game.width//2, v.point((0, 60))[1]), self.big_font, "", (255,255,255), anchor="center")
+        self.timer_label = Label(v.point((settings.WINDOW_WIDTH - 100, 60)), self.timer_font, "", settings.COLOR_TEXT, anchor="center")
+        self.score_labels = [Label(v.point((settings.WINDOW_WIDTH - 20, 100 + i * 25)), self.font, "", settings.COLOR_TEXT, anchor="topright") for i in range(len(self.players))]
+
+    def build_atlas(self):
+        # Dice faces and player tokens at their on-screen sizes, packed into one page
+        assets = self.game.assets
+        face = (self.dice_rect.width - 16, self.dice_rect.height - 16)
+        keys = [f"dice_{i}" for i in range(1, 7)] + (["dice_custom"] if assets.has_image("dice_custom") else [])
+        sprites = {k: assets.image(k, face) for k in keys}
+        self.atlas = TextureAtlas(registry=self.game.caches)
+        self.atlas.build(sprites, [k for k in keys if assets.blend_flags(k, face)])
+        for i in range(len(self.players)):
+            self.set_player_image(i, self.token_sources[i])
+
+    def close(self):
+        self.game.caches.unregister("atlas")
+
+    def set_player_image(self, index, src):
+        # Replacing an avatar redraws its atlas slot in place; no repack needed
+        self.token_sources[index] = src
+        token_size = (self.board.tile // 2, self.board.tile // 2)
+        p = self.players[index]
+        p.image = pygame.transform.scale(src, token_size) if src else self.game.assets.image("token", token_size)
+        self.atlas.add(f"player_{index}", p.image, not src and self.game.assets.blend_flags("token", token_size))
+
+    def load_avatar_later(self, index, ticket):
+        # ticket comes from game.avatars; update() swaps the token in once it is decoded
+        self.pending_avatars[index] = ticket
+
+    def poll_avatars(self):
+        for i, ticket in list(self.pending_avatars.items()):
+            try:
+                avatar = self.game.avatars.ready(ticket)
+            except Exception:
+                del self.pending_avatars[i]
+                continue
+            if avatar is not None:
+                del self.pending_avatars[i]
+                self.set_player_image(i, avatar.source)
+
+    def thumbnail(self):
+        # Take the cached board layer and token squares now; scaling and drawing run on the writer thread
+        layer = self.game.layers.layers.get(("board", self.board.size))
+        if layer is None:
+            return None
+        tokens = [(p.square, p.color) for p in self.players]
+        margin, size = board_layer_margin(self.board.tile), self.board.size
+        return lambda: render_thumbnail(layer, margin, size, tokens, settings.THUMBNAIL_SIZE)
+
+    def serialize(self):
+        """Save record for savegame.write_save; avatars go to the blob store by hash."""
+        players = []
+        for p, src in zip(self.players, self.token_sources):
+            players.append({"name": p.name, "square": p.square, "avatar": self.game.blobs.put(src) if src else None,
+                            "doubleNext": p.doubleNext, "halfNext": p.halfNext, "skipSnake": p.skipSnake, "loseTurn": p.loseTurn})
+        return {"app": "board", "mode": self.mode, "turn": self.turn, "players": players,
+                "timed_remaining": self.timed_remaining, "endless_scores": self.endless_scores}
+
+    def start_recording(self):
+        """Record from the current state; called again after a saved game is restored."""
+        start = {"turn": self.turn, "played": 0, "players": [[p.square, pack_flags(p)] for p in self.players],
+                 "scores": list(self.endless_scores), "winner": None}
+        self.recorder = Recorder([p.name for p in self.players], self.mode, self.seed, start, settings.REPLAY_KEYFRAME_EVERY)
+
+    def end_recording(self):
+        if self.recorder is not None and len(self.recorder.recording):
+            self.game.keep_replay(self.recorder.recording)
+        self.recorder = None
+
+    def journal_turn(self, index, p, kind, won=False):
+        # One autosave line per turn; the journal applies it to its own copy of the state to compact
+        clock = self.timed_remaining if self.mode == 'timed' else None
+        rec = turn_record(index, self.last_dice_face, p, kind, self.turn, won, clock)
+        self.game.autosave.record(rec)
+        if self.recorder is not None:
+            self.recorder.record(self.last_dice_face)
 
     def start_mode_logic(self):
         if self.mode == 'timed':
@@ -92,20 +213,27 @@ class BoardScene(Scene):
         pass
 
     def handle(self, event):
-        if self.roll_btn.handle(event):
-            if not self.winner and not self.game.paused:
+        clicked = self.ui.handle(event)
+        if clicked is self.roll_btn:
+            if not self.winner and not self.game.paused and not self.tokens_moving():
                 self.dice.start()
-        if self.pause_btn.handle(event):
+        elif clicked is self.pause_btn:
             self.game.paused = True
-        if self.resume_btn.handle(event):
+        elif clicked is self.resume_btn:
             self.game.paused = False
-        if self.save_btn.handle(event):
-            self.game.save_state(self.serialize())
-        if self.restart_btn.handle(event):
+        elif clicked is self.save_btn:
+            # Saving again in the same game overwrites its slot
+            self.slot_id = self.game.save_state(self.serialize(), self.slot_id, ", ".join(p.name for p in self.players), self.thumbnail())
+            self.status.set_text("Game saved")
+        elif clicked is self.restart_btn:
             self.stop_mode_logic()
+            self.end_recording()
             self.__init__(self.game, [p.name for p in self.players], self.sound_on, self.mode)
-        if self.menu_btn.handle(event):
+            self.game.autosave.begin(self.serialize())
+        elif clicked is self.menu_btn:
             self.stop_mode_logic()
+            self.game.autosave.clear()
+            self.end_recording()
             self.game.goto_menu()
         
         if self.mode == 'timed' and event.type == pygame.USEREVENT + 1:
@@ -122,11 +250,15 @@ class BoardScene(Scene):
             if self.players[i].square > self.players[best_idx].square:
                 best_idx = i
         self.winner = self.players[best_idx]
+        self.game.autosave.clear()
+        self.end_recording()
         self.status.set_text(f"⏰ Time's up! {self.winner.name} wins with {self.winner.square}!")
         # Play win sound and confetti (to be implemented)
         self.game.paused = True # Prevent further rolls
 
     def update(self, dt):
+        if self.pending_avatars:
+            self.poll_avatars()
         if self.game.paused:
             return
         
@@ -147,142 +279,133 @@ class BoardScene(Scene):
                 self.zombie.enqueue_steps(steps)
             
             if self.sound_on:
-                s = self.game.assets.sound("roll")
-                if s: s.play()
+                self.game.audio.play("roll", "dice")
 
         p = self.players[self.turn]
         moved = p.step()
         if moved:
+            self.pending_landing = True
             p.advance_anim(dt)
             if self.sound_on:
-                s = self.game.assets.sound("step")
-                if s: s.play()
-        else:
-            before = p.square
-            new, kind = self.board.apply_collision(p.square)
+                self.game.audio.play("step", "move")
+        elif self.pending_landing:
+            # The move is complete: apply the landing tile once, then pass the turn
+            self.pending_landing = False
+            index = self.turn
+            kind, before = resolve_landing(self.board, p)
             
             # Handle snakes and ladders
-            if kind == "snake":
-                if p.skipSnake:
-                    p.skipSnake = False
-                    self.status.set_text(f"{p.name} avoided a snake!")
-                else:
-                    p.snake_hits += 1
-                    p.square = new
-                    for s in self.snakes:
-                        if s.head_square == before and s.tail_square == new:
-                            s.trigger_eat()
-                    self.status.set_text(f"{p.name} hit a snake: {before} → {new}")
-                    if self.sound_on:
-                        s = self.game.assets.sound("snake")
-                        if s: s.play()
+            if kind == "snake_avoided":
+                self.status.set_text(f"{p.name} avoided a snake!")
+            elif kind == "snake":
+                if before in self.snake_paths:
+                    p.follow(self.snake_paths[before])
+                for s in self.snakes:
+                    if s.head_square == before and s.tail_square == p.square:
+                        s.trigger_eat()
+                self.status.set_text(f"{p.name} hit a snake: {before} → {p.square}")
+                if self.sound_on:
+                    self.game.audio.play("snake", "event")
             elif kind == "ladder":
-                p.climbed += max(0, new - p.square)
-                p.square = new
-                self.status.set_text(f"{p.name} climbed a ladder: {before} → {new}")
+                if before in self.ladder_paths:
+                    p.follow(self.ladder_paths[before])
+                self.status.set_text(f"{p.name} climbed a ladder: {before} → {p.square}")
                 if self.sound_on:
-                    s = self.game.assets.sound("ladder")
-                    if s: s.play()
+                    self.game.audio.play("ladder", "event")
             elif kind == "power_up":
-                power_up_type = self.board.special_tiles["powerUps"][p.square]["type"]
-                self.status.set_text(f"{p.name} got a Power Up: {settings.POWER_UP_TEXTS[power_up_type]}!")
-                if power_up_type == 'forward5':
-                    p.square = min(100, p.square + 5)
-                    self.status.set_text(f"{p.name} moved 5 spaces forward!")
+                p.anim_from, p.anim_to, p.anim_t = before, p.square, 0.0
+                self.status.set_text(f"{p.name} moved 5 spaces forward!")
             elif kind == "power_down":
-                power_down_type = self.board.special_tiles["powerDowns"][p.square]["type"]
-                self.status.set_text(f"{p.name} got a Power Down: {settings.POWER_DOWN_TEXTS[power_down_type]}!")
-                if power_down_type == 'backward6':
-                    p.square = max(1, p.square - 6)
-                    self.status.set_text(f"{p.name} moved 6 spaces backward!")
-                elif power_down_type == 'loseTurn':
-                    p.loseTurn = True
+                p.anim_from, p.anim_to, p.anim_t = before, p.square, 0.0
+                if p.loseTurn:
                     self.status.set_text(f"{p.name} loses next turn!")
+                else:
+                    self.status.set_text(f"{p.name} moved 6 spaces backward!")
 
             if p.square == 100:
                 self.winner = p
                 self.status.set_text(f"🎉 {p.name} WINS! 🎉")
                 if self.sound_on:
-                    s = self.game.assets.sound("win")
-                    if s: s.play()
+                    self.game.audio.play("win", "event")
                 self.launch_confetti() # Launch confetti
                 self.stop_mode_logic()
                 self.game.paused = True
                 
                 if self.mode == 'endless':
+                    self.journal_turn(index, p, kind, won=True)
                     self.endless_scores[self.turn] += 1
                     self.update_scores_ui()
                     for player_reset in self.players:
                         player_reset.square = 1
+                        player_reset.anim_from = player_reset.anim_to = 1
                     self.status.set_text(f"Round scored! {p.name} to play next.")
                     pygame.time.set_timer(pygame.USEREVENT + 2, 800) # Delay for 0.8 seconds
+                else:
+                    # The game is over; there is nothing left to recover
+                    self.game.autosave.clear()
+                    if self.recorder is not None:
+                        self.recorder.record(self.last_dice_face)
+                    self.end_recording()
                     
             else:
-                if p.loseTurn:
-                    p.loseTurn = False
+                lost = p.loseTurn
+                self.turn = next_turn(self.players, self.turn)
+                self.journal_turn(index, p, kind)
+                if lost:
                     self.status.set_text(f"{p.name} lost a turn. Next: {self.players[(self.turn + 1) % len(self.players)].name}")
                 else:
-                    self.turn = (self.turn + 1) % len(self.players)
                     self.status.set_text(f"Next: {self.players[self.turn].name}")
 
     def render(self, surface):
-        vertical_gradient(surface, (0,0,self.game.width,self.game.height), settings.COLOR_BG_TOP, settings.COLOR_BG_BOTTOM)
-        self.board.render(surface, self.font)
-        for l in self.ladders:
-            l.draw(surface, self.board)
-        for s in self.snakes:
-            s.draw(surface, self.board) # Draw snakes
+        surface.blit(self.game.background(), (0, 0))
+        # Board, ladders and snakes never change during play, so they come from one cached layer
+        layer = self.game.layers.get(("board", self.board.size),
+                                     lambda: render_board_layer(self.game.assets, self.snakes, self.ladders, self.font, self.board.size),
+                                     lambda: board_layer_inputs(self.game.assets, self.board.size, self.font))
+        m = board_layer_margin(self.board.tile)
+        surface.blit(layer, (self.board.origin[0] - m, self.board.origin[1] - m))
         
         if not self.zombie_frozen and self.show_zombie:
             self.zombie.update(self.game.clock.get_time()/1000.0)
             self.zombie.draw(surface)
         
-        for p in self.players:
+        if self.atlas.evicted:
+            # The cache budget dropped the packed sprites; pack them again
+            self.build_atlas()
+        tokens = []
+        for i, p in enumerate(self.players):
             p.advance_anim(self.game.clock.get_time()/1000.0)
-            a = self.board.square_pos(p.anim_from)
-            b = self.board.square_pos(p.anim_to)
-            x = a[0] + (b[0] - a[0]) * p.anim_t
-            y = a[1] + (b[1] - a[1]) * p.anim_t
-            
-            # Draw player image instead of generic token
-            # Assuming player.image is a pygame.Surface
-            if p.image:
-                img_rect = p.image.get_rect(center=(x, y))
-                surface.blit(p.image, img_rect)
+            if p.following_path():
+                x, y = p.path_pos()
             else:
-                # Fallback to generic token if no image
-                Token(self.game.assets.image("token", (32,32)), p.color).draw(surface, (x, y))
+                a = self.board.square_pos(p.anim_from)
+                b = self.board.square_pos(p.anim_to)
+                x = a[0] + (b[0] - a[0]) * p.anim_t
+                y = a[1] + (b[1] - a[1]) * p.anim_t
+            tokens.append((f"player_{i}", (x, y)))
+        self.atlas.draw_many(surface, tokens)
         
-        self.dice.draw(surface, self.dice_rect)
+        self.dice.draw(surface, self.dice_rect, self.atlas)
         self.status.draw(surface, settings.COLOR_TEXT)
         
-        self.roll_btn.draw(surface)
-        if self.game.paused:
-            self.resume_btn.draw(surface)
-        else:
-            self.pause_btn.draw(surface)
-        self.save_btn.draw(surface)
-        self.restart_btn.draw(surface)
-        self.menu_btn.draw(surface)
+        self.pause_btn.visible = not self.game.paused
+        self.resume_btn.visible = self.game.paused
+        self.ui.draw(surface)
         
         if self.last_dice_face is not None:
-            overlay = self.big_font.render(f"Dice: {self.last_dice_face}", True, (255,255,255))
-            r = overlay.get_rect(center=(self.game.width//2, 60))
-            surface.blit(overlay, r)
+            self.dice_label.set_text(f"Dice: {self.last_dice_face}")
+            self.dice_label.draw(surface)
 
         # Render timed mode timer
         if self.mode == 'timed':
-            timer_text = self.timer_font.render(self.format_time(self.timed_remaining), True, settings.COLOR_TEXT)
-            timer_rect = timer_text.get_rect(center=(self.game.width - 100, 60))
-            surface.blit(timer_text, timer_rect)
+            self.timer_label.set_text(self.format_time(self.timed_remaining))
+            self.timer_label.draw(surface)
         
         # Render endless mode scores
         if self.mode == 'endless':
-            score_y_start = 100
             for i, score in enumerate(self.endless_scores):
-                score_text = self.font.render(f"{self.players[i].name}: {score}", True, settings.COLOR_TEXT)
-                score_rect = score_text.get_rect(topright=(self.game.width - 20, score_y_start + i * 25))
-                surface.blit(score_text, score_rect)
+                self.score_labels[i].set_text(f"{self.players[i].name}: {score}")
+                self.score_labels[i].draw(surface)
 
         # Update and draw confetti
         for particle in list(self.confetti_particles):
@@ -292,6 +415,9 @@ class BoardScene(Scene):
             else:
                 particle.draw(surface)
 
+    def tokens_moving(self):
+        return any(p.following_path() for p in self.players)
+
     def format_time(self, seconds):
         minutes = seconds // 60
         seconds = seconds % 60
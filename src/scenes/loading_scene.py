@@ -0,0 +1,30 @@
+import pygame
+from src.core.scene import Scene
+from src.ui.widgets import Label, fonts
+
+class LoadingScene(Scene):
+    """Progress bar shown while the next scene's assets load in the background."""
+
+    def __init__(self, game, build):
+        super().__init__(game)
+        self.build = build
+        self.layout()
+
+    def layout(self):
+        v = self.game.view
+        self.bar = v.rect((280, 480, 400, 18))
+        self.label = Label((self.game.width // 2, v.point((0, 450))[1]), fonts.get(None, v.size(28)), "Loading…", (255,255,255), anchor="center")
+
+    def update(self, dt):
+        self.game.preloader.poll()
+        if not self.game.preloader.busy():
+            self.game.scenes = [self.build()]
+
+    def render(self, surface):
+        surface.blit(self.game.background(), (0, 0))
+        self.label.draw(surface)
+        pygame.draw.rect(surface, (255,255,255), self.bar, 2, border_radius=9)
+        fill = self.bar.inflate(-6, -6)
+        fill.width = int(fill.width * self.game.preloader.progress())
+        if fill.width > 0:
+            pygame.draw.rect(surface, (255,255,255), fill, border_radius=6)
@@ -0,0 +1,219 @@
+import math
+import pygame
+from src.core.scene import Scene
+from src.config import settings
+from src.core.board import Board
+from src.core.match import Match
+from src.objects.button import Button
+from src.objects.snake import Snake
+from src.objects.ladder import Ladder
+from src.ui.widgets import WidgetLayer, Label
+from src.services.cache_budget import surface_bytes
+from src.ui.layers import render_board_layer, board_layer_margin, board_layer_inputs
+
+class Table:
+    def __init__(self, index, names, seed=None):
+        self.index = index
+        self.names = names
+        self.seed = seed
+        self.match = Match(names, seed=seed)
+        self.timer = 0.0
+        self.pending = 0.0
+        self.last_roll = None
+        self.rest = 0.0
+
+    def update(self, dt, interval):
+        self.timer += dt
+        while self.timer >= interval:
+            self.timer -= interval
+            if self.match.winner:
+                # Hold the finished board for a moment, then start the next game
+                self.rest += interval
+                if self.rest >= interval * 4:
+                    self.match = Match(self.names)
+                    self.rest = 0.0
+                    self.last_roll = None
+                continue
+            self.last_roll = self.match.play_turn()["roll"]
+
+class MultiTableScene(Scene):
+    """Several concurrent games drawn from one shared, pre-scaled board layer."""
+
+    TURN_INTERVAL = 0.8
+    OFFSCREEN_STEP = 0.5
+
+    @classmethod
+    def manifest(cls, game):
+        v = game.view
+        return {
+            "images": ["board_bg"],
+            "fonts": [(settings.FONT_REGULAR, v.size(18)), (settings.FONT_REGULAR, v.size(14)), (settings.FONT_BOLD, v.size(32))],
+        }
+
+    @classmethod
+    def image_sizes(cls, view):
+        board = view.size(settings.BOARD_SIZE) // 10 * 10
+        return {"board_bg": [(board, board)]}
+
+    def __init__(self, game, table_count=8, players_per_table=4):
+        super().__init__(game)
+        self.snakes = [Snake(h, t) for h, t in settings.SNAKES.items()]
+        self.ladders = [Ladder(b, a) for b, a in settings.LADDERS.items()]
+        self.tables = []
+        for i in range(table_count):
+            names = [f"T{i+1}-P{j+1}" for j in range(players_per_table)]
+            self.tables.append(Table(i, names, seed=i))
+        self.zoomed = None
+        self.tokens = {}
+        self.dice_faces = {}
+        self.table_labels = {}
+        # Sprites are charged as (dict name, key), so one drop callback serves all three
+        game.caches.register("tables", lambda k: getattr(self, k[0]).pop(k[1], None))
+        self.layout()
+
+    def layout(self):
+        v = self.game.view
+        self.font = self.game.assets.font(settings.FONT_REGULAR, v.size(18))
+        self.small_font = self.game.assets.font(settings.FONT_REGULAR, v.size(14))
+        self.title_font = self.game.assets.font(settings.FONT_BOLD, v.size(32))
+        self.back_btn = Button(v.rect((30, 24, 120, 44)), settings.COLOR_BUTTON_MENU, self.font.render("Menu", True, settings.COLOR_BUTTON_TEXT))
+        self.ui = WidgetLayer()
+        self.ui.add(self.back_btn)
+        self.title = Label((self.game.width // 2, v.point((0, 46))[1]), self.title_font, f"{len(self.tables)} Tables", (255,255,255), anchor="center")
+        self.hint = Label((self.game.width // 2, self.game.height - v.size(30)), self.small_font, "Click a table to zoom in. Click or Esc to return.", (255,255,255), anchor="center")
+        for index in self.table_labels:
+            self.game.caches.release("tables", ("table_labels", index))
+        self.table_labels = {}
+
+        # Square centres in layer coordinates, shared by every table at every scale
+        self.board_size = v.size(settings.BOARD_SIZE) // 10 * 10
+        m = board_layer_margin(self.board_size // 10)
+        ref = Board(self.game.assets, origin=(m, m), size=self.board_size)
+        self.square_centres = [None] + [ref.square_pos(sq) for sq in range(1, 101)]
+        self.layer_size = self.board_size + 2 * m
+        bx, by = v.point((settings.BOARD_X, settings.BOARD_Y))
+        self.zoom_rect = pygame.Rect(bx - m, by - m, self.layer_size, self.layer_size)
+
+        n = len(self.tables)
+        cols = math.ceil(math.sqrt(n))
+        rows = math.ceil(n / cols)
+        area = pygame.Rect(v.size(20), v.size(90), self.game.width - v.size(40), self.game.height - v.size(140))
+        cell = min(area.width // cols, area.height // rows)
+        self.table_px = cell - 12
+        ox = area.x + (area.width - cols * cell) // 2
+        oy = area.y + (area.height - rows * cell) // 2
+        self.table_rects = []
+        for i in range(n):
+            r, c = divmod(i, cols)
+            self.table_rects.append(pygame.Rect(ox + c * cell + 6, oy + r * cell + 6, self.table_px, self.table_px))
+
+    def board_layer(self, size=None):
+        key = ("board", self.board_size)
+        build = lambda: render_board_layer(self.game.assets, self.snakes, self.ladders, self.font, self.board_size)
+        inputs = lambda: board_layer_inputs(self.game.assets, self.board_size, self.font)
+        if size is None:
+            return self.game.layers.get(key, build, inputs)
+        return self.game.layers.scaled(key, (size, size), build, inputs)
+
+    def token(self, color, radius):
+        k = (color, radius)
+        img = self.tokens.get(k)
+        if img is None:
+            img = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(img, color, (radius + 1, radius + 1), radius)
+            pygame.draw.circle(img, (0,0,0), (radius + 1, radius + 1), radius, max(1, radius // 6))
+            self.keep("tokens", k, img)
+        else:
+            self.game.caches.hit("tables", ("tokens", k))
+        return img
+
+    def dice_face(self, face, size):
+        k = (face, size)
+        img = self.dice_faces.get(k)
+        if img is None:
+            img = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.rect(img, (240,240,255), img.get_rect(), border_radius=size // 5)
+            pygame.draw.rect(img, (0,0,0), img.get_rect(), 2, border_radius=size // 5)
+            font = self.game.assets.font(settings.FONT_BOLD, max(10, int(size * 0.7)))
+            t = font.render(str(face), True, (30,30,30))
+            img.blit(t, t.get_rect(center=(size // 2, size // 2)))
+            self.keep("dice_faces", k, img)
+        else:
+            self.game.caches.hit("tables", ("dice_faces", k))
+        return img
+
+    def table_label(self, table):
+        img = self.table_labels.get(table.index)
+        if img is None:
+            img = self.small_font.render(f"Table {table.index + 1}", True, (255,255,255))
+            self.keep("table_labels", table.index, img)
+        else:
+            self.game.caches.hit("tables", ("table_labels", table.index))
+        return img
+
+    def keep(self, cache, key, img):
+        if self.game.caches.charge("tables", (cache, key), surface_bytes(img)):
+            getattr(self, cache)[key] = img
+
+    def close(self):
+        self.game.caches.unregister("tables")
+
+    def handle(self, event):
+        if self.ui.handle(event) is self.back_btn:
+            self.game.goto_menu()
+            return
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.zoomed = None
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.zoomed is not None:
+                self.zoomed = None
+            else:
+                for i, r in enumerate(self.table_rects):
+                    if r.collidepoint(event.pos):
+                        self.zoomed = i
+                        break
+
+    def update(self, dt):
+        for i, table in enumerate(self.tables):
+            on_screen = self.zoomed is None or self.zoomed == i
+            if on_screen:
+                table.update(dt, self.TURN_INTERVAL)
+            else:
+                # Hidden tables catch up in coarse steps; the outcome is the same, just batched
+                table.pending += dt
+                if table.pending >= self.OFFSCREEN_STEP:
+                    table.update(table.pending, self.TURN_INTERVAL)
+                    table.pending = 0.0
+
+    def draw_table(self, surface, table, rect):
+        scale = rect.width / self.layer_size
+        surface.blit(self.board_layer(rect.width) if rect.width != self.layer_size else self.board_layer(), rect.topleft)
+        radius = max(3, int(self.board_size // 10 * 0.22 * scale))
+        spread = radius * 0.7
+        for i, p in enumerate(table.match.players):
+            cx, cy = self.square_centres[p.square]
+            x = rect.x + cx * scale + (i % 2 * 2 - 1) * spread
+            y = rect.y + cy * scale + (i // 2 * 2 - 1) * spread
+            img = self.token(p.color, radius)
+            surface.blit(img, img.get_rect(center=(x, y)))
+        if table.last_roll:
+            size = max(16, rect.width // 9)
+            surface.blit(self.dice_face(table.last_roll, size), (rect.right - size - 4, rect.bottom - size - 4))
+        if table.match.winner:
+            pygame.draw.rect(surface, (255,215,0), rect, 3, border_radius=8)
+
+    def render(self, surface):
+        surface.blit(self.game.background(), (0, 0))
+        self.ui.draw(surface)
+        self.title.draw(surface)
+        if self.zoomed is not None:
+            table = self.tables[self.zoomed]
+            m = board_layer_margin(self.board_size // 10)
+            rect = self.zoom_rect
+            self.draw_table(surface, table, rect)
+            surface.blit(self.table_label(table), (rect.x + m, rect.bottom + 4))
+        else:
+            for table, rect in zip(self.tables, self.table_rects):
+                self.draw_table(surface, table, rect)
+                surface.blit(self.table_label(table), (rect.x + 4, rect.y + 2))
+        self.hint.draw(surface)
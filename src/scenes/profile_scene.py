@@ -1,48 +1,151 @@
 import pygame
 from src.core.scene import Scene
 from src.config import settings
-from src.services.profiles import ProfileStore
 from src.objects.button import Button
-from src.ui.draw import vertical_gradient, rounded_rect
+from src.ui.draw import rounded_rect
+from src.ui.widgets import WidgetLayer, Label
+from src.ui.list_view import VirtualList
 
 class ProfileScene(Scene):
+    @classmethod
+    def manifest(cls, game):
+        v = game.view
+        return {"fonts": [(settings.FONT_REGULAR, v.size(22)), (settings.FONT_REGULAR, v.size(18)), (settings.FONT_BOLD, v.size(36))]}
+
     def __init__(self, game):
         super().__init__(game)
-        self.store = ProfileStore()
-        self.font = game.assets.font(settings.FONT_REGULAR, 22)
-        self.title_font = game.assets.font(settings.FONT_BOLD, 36)
-        self.back_btn = Button((40, 40, 120, 44), settings.COLOR_BUTTON_MENU, self.font.render("Back", True, (255,255,255)))
-        self.save_btn = Button((800, 40, 120, 44), settings.COLOR_BUTTON_SAVE, self.font.render("Save", True, (255,255,255)))
+        self.store = game.profiles
+        self.sort = "wins"
+        self.search = ""
         self.name = "Player 1"
         self.color_idx = 0
         self.colors = [(66,135,245),(255,165,0),(16,185,129),(244,114,182)]
+        self.list = None
+        self.writes = getattr(self.store, "writes", None)
+        self.layout()
+        self.select(self.name)
+        self.update_search_label()
+
+    def layout(self):
+        v = self.game.view
+        self.font = self.game.assets.font(settings.FONT_REGULAR, v.size(22))
+        self.row_font = self.game.assets.font(settings.FONT_REGULAR, v.size(18))
+        self.title_font = self.game.assets.font(settings.FONT_BOLD, v.size(36))
+        self.back_btn = Button(v.rect((40, 40, 120, 44)), settings.COLOR_BUTTON_MENU, self.font.render("Back", True, (255,255,255)))
+        self.save_btn = Button(v.rect((800, 40, 120, 44)), settings.COLOR_BUTTON_SAVE, self.font.render("Save", True, (255,255,255)))
+        self.sort_options = [
+            Button(v.rect((420, 160, 110, 36)), settings.COLOR_BUTTON_MENU, self.row_font.render("Wins", True, (255,255,255)), value="wins"),
+            Button(v.rect((540, 160, 110, 36)), settings.COLOR_BUTTON_MENU, self.row_font.render("High score", True, (255,255,255)), value="high_score"),
+            Button(v.rect((660, 160, 110, 36)), settings.COLOR_BUTTON_MENU, self.row_font.render("Games", True, (255,255,255)), value="games_played"),
+        ]
+        previous = self.list
+        self.list = VirtualList(v.rect((180, 250, 600, 400)), v.size(32), self.fetch_rows, self.count_rows, self.paint_row, self.game.caches)
+        if previous:
+            self.list.selected = previous.selected
+            self.list.scroll = previous.scroll * self.list.row_height // previous.row_height
+        self.ui = WidgetLayer()
+        self.ui.add(self.back_btn, self.save_btn, *self.sort_options)
+        self.search_label = Label(v.point((180, 212)), self.row_font, "", (90,90,110))
+        self.name_label = Label(v.point((300, 690)), self.font, "", (30,30,40))
+        self.stats_label = Label(v.point((300, 725)), self.row_font, "", (60,60,70))
+        self.labels = [
+            Label(v.point((180, 160)), self.title_font, "Profiles", (40,40,60)),
+            Label(v.point((300, 770)), self.row_font, "Type to search, ↑ ↓ to browse, ← → to change color", (60,60,70)),
+        ]
+        if previous:
+            self.select(self.name)
+            self.update_search_label()
+
+    def close(self):
+        self.list.close()
+
+    def fetch_rows(self, offset, limit):
+        return self.store.page(offset, limit, self.sort, self.search)
+
+    def count_rows(self):
+        return self.store.count(self.sort, self.search)
+
+    def paint_row(self, surface, index, profile, selected):
+        w, h = surface.get_size()
+        if selected:
+            pygame.draw.rect(surface, settings.COLOR_ACCENT, (0, 0, w, h), border_radius=8)
+        elif index % 2 == 0:
+            pygame.draw.rect(surface, (240,240,248), (0, 0, w, h), border_radius=8)
+        color = (255,255,255) if selected else (30,30,40)
+        v = self.game.view
+        pygame.draw.circle(surface, profile.color, (v.size(56), h // 2), v.size(9))
+        for x, s in ((8, f"{index + 1}."), (76, profile.name), (340, str(profile.wins)), (430, str(profile.high_score)), (520, str(profile.games_played))):
+            img = self.row_font.render(s, True, color)
+            surface.blit(img, img.get_rect(midleft=(v.size(x), h // 2)))
+
+    def select(self, name):
+        self.name = name
+        p = self.store.find(name)
+        if p and p.color in self.colors:
+            self.color_idx = self.colors.index(p.color)
+        self.name_label.set_text(name)
+        if p:
+            self.stats_label.set_text(f"Wins {p.wins}  ·  High score {p.high_score}  ·  Games {p.games_played}")
+        else:
+            self.stats_label.set_text("New profile")
+
+    def update_search_label(self):
+        self.search_label.set_text(f"Search: {self.search}" if self.search else "Search: (type a name)")
+
+    def set_search(self, text):
+        self.search = text
+        self.update_search_label()
+        self.list.reset()
 
     def handle(self, event):
-        if self.back_btn.handle(event):
+        clicked = self.ui.handle(event)
+        if clicked is self.back_btn:
             self.game.goto_menu()
-        if self.save_btn.handle(event):
+        if clicked is self.save_btn:
             p = self.store.get(self.name)
             p.color = self.colors[self.color_idx]
             self.store.save()
+            self.list.refetch()
+        if clicked in self.sort_options:
+            self.sort = clicked.value
+            self.list.reset()
+        if self.list.handle(event) and self.list.selected is not None:
+            p = self.list.item(self.list.selected)
+            if p:
+                self.select(p.name)
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_LEFT:
                 self.color_idx = (self.color_idx - 1) % len(self.colors)
-            if event.key == pygame.K_RIGHT:
+            elif event.key == pygame.K_RIGHT:
                 self.color_idx = (self.color_idx + 1) % len(self.colors)
+            elif event.key == pygame.K_BACKSPACE:
+                self.set_search(self.search[:-1])
+            elif event.key == pygame.K_ESCAPE:
+                self.set_search("")
+            elif event.unicode and event.unicode.isprintable():
+                self.set_search(self.search + event.unicode)
 
     def update(self, dt):
-        pass
+        # The SQLite store writes on its own thread; show each write once it has landed
+        writes = getattr(self.store, "writes", None)
+        if writes != self.writes:
+            self.writes = writes
+            self.list.refetch()
+            self.select(self.name)
 
     def render(self, surface):
-        vertical_gradient(surface, (0,0,self.game.width,self.game.height), settings.COLOR_BG_TOP, settings.COLOR_BG_BOTTOM)
-        rounded_rect(surface, (160,140,640,680), (255,255,255), 16)
-        t = self.title_font.render("Profile", True, (40,40,60))
-        surface.blit(t, (180, 160))
-        self.back_btn.draw(surface)
-        self.save_btn.draw(surface)
-        name = self.font.render(self.name, True, (30,30,40))
-        surface.blit(name, (180, 220))
+        v = self.game.view
+        surface.blit(self.game.background(), (0, 0))
+        rounded_rect(surface, v.rect((160,140,640,680)), (255,255,255), 16)
+        self.ui.draw(surface)
+        self.list.draw(surface)
+        for btn in self.sort_options:
+            if btn.value == self.sort:
+                pygame.draw.rect(surface, settings.COLOR_ACCENT, btn.rect, 3, border_radius=10)
+        for label in self.labels:
+            label.draw(surface)
+        self.search_label.draw(surface)
+        self.name_label.draw(surface)
+        self.stats_label.draw(surface)
         color = self.colors[self.color_idx]
-        pygame.draw.circle(surface, color, (480, 400), 60)
-        stats = self.font.render("Use ← → to change color", True, (60,60,70))
-        surface.blit(stats, (330, 520))
\ No newline at end of file
+        pygame.draw.circle(surface, color, v.point((240, 730)), v.size(40))
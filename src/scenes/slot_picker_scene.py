@@ -0,0 +1,144 @@
+import time
+import pygame
+from src.core.scene import Scene
+from src.config import settings
+from src.objects.button import Button
+from src.ui.draw import rounded_rect
+from src.ui.widgets import WidgetLayer, Label
+from src.ui.list_view import VirtualList
+from src.services.cache_budget import surface_bytes
+
+class SlotPickerScene(Scene):
+    """Lists save slots from the slot index; thumbnails stream in as they decode."""
+
+    @classmethod
+    def manifest(cls, game):
+        v = game.view
+        return {"fonts": [(settings.FONT_REGULAR, v.size(22)), (settings.FONT_REGULAR, v.size(18)), (settings.FONT_BOLD, v.size(36))]}
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.entries = game.slots.list()
+        self.thumbs = {}
+        self.loading = {}
+        self.scaled = {}
+        self.list = None
+        # Charged as (dict name, slot id); a dropped thumbnail is read again when its row is fetched
+        game.caches.register("thumbnails", lambda k: getattr(self, k[0]).pop(k[1], None))
+        self.layout()
+
+    def layout(self):
+        v = self.game.view
+        self.font = self.game.assets.font(settings.FONT_REGULAR, v.size(22))
+        self.row_font = self.game.assets.font(settings.FONT_REGULAR, v.size(18))
+        self.title_font = self.game.assets.font(settings.FONT_BOLD, v.size(36))
+        self.back_btn = Button(v.rect((40, 40, 120, 44)), settings.COLOR_BUTTON_MENU, self.font.render("Back", True, (255,255,255)))
+        self.load_btn = Button(v.rect((520, 740, 120, 44)), settings.COLOR_BUTTON_SAVE, self.font.render("Load", True, (255,255,255)))
+        self.delete_btn = Button(v.rect((660, 740, 120, 44)), settings.COLOR_BUTTON_MENU, self.font.render("Delete", True, (255,255,255)))
+        previous = self.list
+        self.list = VirtualList(v.rect((180, 220, 600, 500)), v.size(settings.THUMBNAIL_SIZE // 2 + 16), self.fetch_rows, self.count_rows, self.paint_row, self.game.caches)
+        if previous:
+            self.list.selected = previous.selected
+            self.list.scroll = previous.scroll * self.list.row_height // previous.row_height
+        self.ui = WidgetLayer()
+        self.ui.add(self.back_btn, self.load_btn, self.delete_btn)
+        self.labels = [Label(v.point((180, 160)), self.title_font, "Saved games", (40,40,60))]
+        if not self.entries:
+            self.labels.append(Label(v.point((180, 240)), self.font, "No saved games yet", (90,90,110)))
+        # Thumbnails are scaled per row height, so a new layout scales them again
+        for slot_id in self.scaled:
+            self.game.caches.release("thumbnails", ("scaled", slot_id))
+        self.scaled = {}
+
+    def fetch_rows(self, offset, limit):
+        rows = self.entries[offset:offset + limit]
+        for meta in rows:
+            slot_id = meta["id"]
+            if slot_id not in self.thumbs and slot_id not in self.loading:
+                self.loading[slot_id] = self.game.slots.load_thumbnail(slot_id)
+        return rows
+
+    def count_rows(self):
+        return len(self.entries)
+
+    def thumbnail(self, slot_id, size):
+        img = self.scaled.get(slot_id)
+        if img is not None:
+            self.game.caches.hit("thumbnails", ("scaled", slot_id))
+        elif self.thumbs.get(slot_id) is not None:
+            img = pygame.transform.smoothscale(self.thumbs[slot_id], (size, size))
+            self.keep("scaled", slot_id, img)
+        return img
+
+    def keep(self, cache, slot_id, img):
+        if img is None or self.game.caches.charge("thumbnails", (cache, slot_id), surface_bytes(img)):
+            getattr(self, cache)[slot_id] = img
+
+    def close(self):
+        self.list.close()
+        self.game.caches.unregister("thumbnails")
+
+    def paint_row(self, surface, index, meta, selected):
+        w, h = surface.get_size()
+        if selected:
+            pygame.draw.rect(surface, settings.COLOR_ACCENT, (0, 0, w, h), border_radius=8)
+        elif index % 2 == 0:
+            pygame.draw.rect(surface, (240,240,248), (0, 0, w, h), border_radius=8)
+        v = self.game.view
+        size = h - v.size(12)
+        box = pygame.Rect(v.size(6), v.size(6), size, size)
+        img = self.thumbnail(meta["id"], size)
+        if img is not None:
+            surface.blit(img, box)
+        else:
+            pygame.draw.rect(surface, (210,210,220), box, border_radius=6)
+        color = (255,255,255) if selected else (30,30,40)
+        detail = (255,255,255) if selected else (90,90,110)
+        x = box.right + v.size(14)
+        name = self.font.render(meta["name"], True, color)
+        surface.blit(name, (x, box.y))
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(meta["saved_at"]))
+        info = f"{(meta.get('mode') or 'classic').title()}  ·  {len(meta['players'])} players  ·  Turn {meta['turn'] + 1}  ·  {when}"
+        surface.blit(self.row_font.render(info, True, detail), (x, box.y + name.get_height() + v.size(4)))
+
+    def selected_id(self):
+        if self.list.selected is None or self.list.selected >= len(self.entries):
+            return None
+        return self.entries[self.list.selected]["id"]
+
+    def handle(self, event):
+        clicked = self.ui.handle(event)
+        if clicked is self.back_btn or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+            self.game.goto_menu()
+        elif clicked is self.load_btn or (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN):
+            if self.selected_id():
+                self.game.load_saved(self.selected_id())
+        elif clicked is self.delete_btn:
+            slot_id = self.selected_id()
+            if slot_id:
+                self.game.slots.delete(slot_id)
+                self.entries = self.game.slots.list()
+                self.list.selected = None
+                self.list.refetch()
+        else:
+            self.list.handle(event)
+
+    def update(self, dt):
+        done = [k for k, f in self.loading.items() if f is None or f.done()]
+        for slot_id in done:
+            future = self.loading.pop(slot_id)
+            try:
+                self.keep("thumbs", slot_id, future.result().convert_alpha() if future else None)
+            except (OSError, pygame.error):
+                self.thumbs[slot_id] = None
+        if done:
+            self.list.refetch()
+
+    def render(self, surface):
+        v = self.game.view
+        surface.blit(self.game.background(), (0, 0))
+        rounded_rect(surface, v.rect((160,140,640,680)), (255,255,255), 16)
+        self.ui.draw(surface)
+        self.list.draw(surface)
+        for label in self.labels:
+            label.draw(surface)
@@ -0,0 +1,51 @@
+import os
+
+ASSET_DIRS = {
+    "images": (".png", ".jpg", ".jpeg"),
+    "sounds": (".wav", ".ogg", ".mp3"),
+    "music": (".ogg", ".mp3", ".wav"),
+    "fonts": (".ttf", ".otf"),
+}
+
+class AssetIndex:
+    """Directory listing of the asset folders, taken once.
+
+    Lookups (including misses) are answered from memory; call refresh()
+    after files are added or removed on disk.
+    """
+
+    def __init__(self, root="assets", dirs=ASSET_DIRS):
+        self.root = root
+        self.dirs = dirs
+        self.refresh()
+
+    def refresh(self):
+        self.files = {kind: [] for kind in self.dirs}
+        self.paths = set()
+        self.resolved = {}
+        for kind, exts in self.dirs.items():
+            base = os.path.join(self.root, kind)
+            if not os.path.isdir(base):
+                continue
+            for dirpath, _, names in os.walk(base):
+                for name in sorted(names):
+                    path = os.path.join(dirpath, name)
+                    self.paths.add(os.path.normpath(path))
+                    if os.path.splitext(name)[1].lower() in exts:
+                        self.files[kind].append((name.lower(), path))
+
+    def exists(self, path):
+        return bool(path) and os.path.normpath(path) in self.paths
+
+    def find(self, kind, prefixes):
+        """First file of this kind whose name starts with one of prefixes, or None."""
+        k = (kind, tuple(prefixes))
+        if k in self.resolved:
+            return self.resolved[k]
+        found = None
+        for name, path in self.files.get(kind, []):
+            if any(name.startswith(p) for p in prefixes):
+                found = path
+                break
+        self.resolved[k] = found
+        return found
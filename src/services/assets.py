@@ -1,83 +1,263 @@
+import io
 import os
+import time
+from collections import OrderedDict
 import pygame
+from src.config import settings
+from src.services.asset_index import AssetIndex
+from src.services.bundle import AssetBundle
+from src.services.bake import load_manifest
+from src.services.cache_budget import sound_bytes, surface_bytes
+
+PIPS = {1: [(1, 1)], 2: [(0, 0), (2, 2)], 3: [(0, 0), (1, 1), (2, 2)], 4: [(0, 0), (2, 0), (0, 2), (2, 2)],
+        5: [(0, 0), (2, 0), (1, 1), (0, 2), (2, 2)], 6: [(0, 0), (0, 1), (0, 2), (2, 0), (2, 1), (2, 2)]}
+
+def placeholder(key, side=64):
+    """Stand-in for a missing image that still reads as what it replaces."""
+    img = pygame.Surface((side, side), pygame.SRCALPHA)
+    face = key[5:] if key.startswith("dice_") else ""
+    if face.isdigit() and int(face) in PIPS:
+        pygame.draw.rect(img, (250, 250, 250), (2, 2, side - 4, side - 4), border_radius=side // 6)
+        step = side // 4
+        for cx, cy in PIPS[int(face)]:
+            pygame.draw.circle(img, (20, 20, 20), (step * (cx + 1), step * (cy + 1)), side // 10)
+    else:
+        # Tokens and avatars: a plain grey disc
+        pygame.draw.circle(img, (200, 200, 200), (side // 2, side // 2), side // 2 - 2)
+    return img
 
 class AssetLoader:
-    def __init__(self, manifest):
+    def __init__(self, manifest, scaled_budget=None, index=None, bundle=None, baked_dir=None, registry=None, synth=None):
         self.manifest = manifest
+        # Generates sounds that have no file (see SoundSynth)
+        self.synth = synth
+        self.index = index or AssetIndex()
+        self.bundle = bundle
+        if bundle is None and os.path.isfile(settings.ASSET_BUNDLE):
+            try:
+                self.bundle = AssetBundle(settings.ASSET_BUNDLE)
+            except (OSError, ValueError):
+                self.bundle = None
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        # (key, size, filter) -> scaled surface, oldest first
+        self.scaled = OrderedDict()
+        self.scaled_bytes = 0
+        self.scaled_budget = settings.SCALED_IMAGE_CACHE_BYTES if scaled_budget is None else scaled_budget
+        self.hits = 0
+        self.misses = 0
+        # Offline-scaled variants: loaded as-is, never rescaled at runtime
+        self.baked_dir = settings.BAKED_DIR if baked_dir is None else baked_dir
+        self.baked = load_manifest(self.baked_dir) or {"images": {}, "premultiplied": False}
+        self.premultiplied = set()
+        self.registry = registry
+        if registry is not None:
+            registry.register("images", lambda key: self.images.pop(key, None))
+            registry.register("scaled_images", self._drop_scaled)
+            registry.register("sounds", lambda key: self.sounds.pop(key, None))
 
     def _find_candidate(self, key):
-        base_dir = os.path.join("assets", "images")
-        if not os.path.isdir(base_dir):
-            return None
         candidates = {
             "dice_custom": ["dice_custom", "dice", "die"],
             "zombie_head": ["zombie_head", "zombie", "snake_zombie", "snakehead", "snake"],
             "board_bg": ["board_bg", "board", "background", "bg", "snakeboard"]
         }.get(key, [key])
-        exts = (".png", ".jpg", ".jpeg")
-        files = os.listdir(base_dir)
-        for name in files:
-            lower = name.lower()
-            for c in candidates:
-                if lower.startswith(c) and os.path.splitext(lower)[1] in exts:
-                    return os.path.join(base_dir, name)
+        return self.index.find("images", candidates)
+
+    def _bundled(self, name):
+        return self.bundle is not None and name in self.bundle
+
+    def has_image(self, key):
+        return self._bundled("images/" + key) or self.index.exists(self.manifest["images"].get(key))
+
+    def can_load_image(self, key):
+        return self._bundled("images/" + key) or self.image_path(key) is not None
+
+    def decode_image(self, key):
+        """Read and decode without touching the display, so it can run on a worker."""
+        if self._bundled("images/" + key):
+            return self.bundle.load_image("images/" + key)
+        path = self.image_path(key)
+        return pygame.image.load(path) if path else None
+
+    def has_sound(self, key):
+        if self._bundled("sounds/" + key) or self.index.exists(self.manifest["sounds"].get(key)):
+            return True
+        return self.synth is not None and key in self.synth
+
+    def decode_sound(self, key):
+        try:
+            if self._bundled("sounds/" + key):
+                return self.bundle.load_sound("sounds/" + key)
+            if self.index.exists(self.manifest["sounds"].get(key)):
+                return pygame.mixer.Sound(self.manifest["sounds"][key])
+            if self.synth is not None:
+                return self.synth.sound(key)
+        except Exception:
+            pass
         return None
 
-    def image(self, key, size=None):
-        if key in self.images:
-            img = self.images[key]
-        else:
-            path = self.manifest["images"].get(key)
-            if not path or not os.path.exists(path):
-                found = self._find_candidate(key)
-                if found:
-                    path = found
-                    self.manifest["images"][key] = path
-                else:
-                    # Fallback to snakeboard.png if no specific asset or candidate is found
-                    if os.path.exists("assets/images/snakeboard.png"):
-                        path = "assets/images/snakeboard.png"
-                        self.manifest["images"][key] = path # Cache this fallback
-            
-            if path and os.path.exists(path):
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                except Exception:
-                    # If loading fails, create a generic gray circle
-                    img = pygame.Surface((64, 64), pygame.SRCALPHA)
-                    pygame.draw.circle(img, (200, 200, 200), (32, 32), 30)
-            else:
-                # If no path is found or fallback fails, create a generic gray circle
-                img = pygame.Surface((64, 64), pygame.SRCALPHA)
-                pygame.draw.circle(img, (200, 200, 200), (32, 32), 30)
-            self.images[key] = img
+    def has_font(self, path):
+        return self._bundled("fonts/" + str(path)) or self.index.exists(path)
+
+    def font_bytes(self, path):
+        if self._bundled("fonts/" + path):
+            return bytes(self.bundle.view("fonts/" + path))
+        with open(path, "rb") as f:
+            return f.read()
+
+    def refresh(self):
+        """Re-scan the asset folders and drop everything resolved from them."""
+        self.index.refresh()
+        if self.registry:
+            for name, entries in (("images", self.images), ("sounds", self.sounds), ("scaled_images", self.scaled)):
+                for key in entries:
+                    self.registry.release(name, key)
+        self.images.clear()
+        self.sounds.clear()
+        self.scaled.clear()
+        self.scaled_bytes = 0
+        self.baked = load_manifest(self.baked_dir) or {"images": {}, "premultiplied": False}
+        self.premultiplied.clear()
+
+    def image(self, key, size=None, smooth=True):
         if size:
-            return pygame.transform.smoothscale(img, size)
+            return self._scaled(key, (int(size[0]), int(size[1])), smooth)
+        return self._source(key)
+
+    def _scaled(self, key, size, smooth):
+        k = (key, size, "smooth" if smooth else "nearest")
+        img = self.scaled.get(k)
+        if img is not None:
+            self.hits += 1
+            self.scaled.move_to_end(k)
+            if self.registry:
+                self.registry.hit("scaled_images", k)
+            return img
+        self.misses += 1
+        start = time.perf_counter()
+        img = self._baked(key, size)
+        if img is None:
+            src = self._source(key)
+            img = pygame.transform.smoothscale(src, size) if smooth else pygame.transform.scale(src, size)
+        elif self.baked["premultiplied"]:
+            self.premultiplied.add((key, size))
+        return self._keep_scaled(k, img, start)
+
+    def generated(self, key, size, build):
+        """Surface made by build() at exactly size, cached with the scaled images.
+
+        For assets drawn in code when no file exists, so they are never rescaled.
+        """
+        size = (int(size[0]), int(size[1]))
+        k = (key, size, "generated")
+        img = self.scaled.get(k)
+        if img is not None:
+            self.hits += 1
+            self.scaled.move_to_end(k)
+            if self.registry:
+                self.registry.hit("scaled_images", k)
+            return img
+        self.misses += 1
+        start = time.perf_counter()
+        img = build()
+        if pygame.display.get_surface() is not None:
+            img = img.convert_alpha()
+        return self._keep_scaled(k, img, start)
+
+    def _keep_scaled(self, k, img, start):
+        self.scaled[k] = img
+        self.scaled_bytes += surface_bytes(img)
+        while self.scaled_bytes > self.scaled_budget and len(self.scaled) > 1:
+            old_key, old = self.scaled.popitem(last=False)
+            self.scaled_bytes -= surface_bytes(old)
+            if self.registry:
+                self.registry.release("scaled_images", old_key)
+        if self.registry and not self.registry.charge("scaled_images", k, surface_bytes(img), time.perf_counter() - start):
+            self._drop_scaled(k)
+        return img
+
+    def _drop_scaled(self, k):
+        img = self.scaled.pop(k, None)
+        if img is not None:
+            self.scaled_bytes -= surface_bytes(img)
+
+    def _baked(self, key, size):
+        name = self.baked["images"].get(key, {}).get(f"{size[0]}x{size[1]}")
+        if not name:
+            return None
+        try:
+            return pygame.image.load(os.path.join(self.baked_dir, name)).convert_alpha()
+        except Exception:
+            return None
+
+    def blend_flags(self, key, size):
+        """special_flags to blit image(key, size) with."""
+        return pygame.BLEND_PREMULTIPLIED if (key, tuple(size)) in self.premultiplied else 0
+
+    def cache_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.scaled),
+                "bytes": self.scaled_bytes, "budget": self.scaled_budget}
+
+    def image_path(self, key):
+        path = self.manifest["images"].get(key)
+        if not self.index.exists(path):
+            found = self._find_candidate(key)
+            if found:
+                path = found
+                self.manifest["images"][key] = path
+        return path if self.index.exists(path) else None
+
+    def _source(self, key):
+        if key in self.images:
+            if self.registry:
+                self.registry.hit("images", key)
+            return self.images[key]
+        try:
+            img = self.decode_image(key)
+        except Exception:
+            img = None
+        return self.adopt_image(key, img)
+
+    def adopt_image(self, key, img):
+        """Store a decoded image, converting it for the display on this thread."""
+        try:
+            img = img.convert_alpha() if img is not None else None
+        except Exception:
+            img = None
+        if img is None:
+            img = placeholder(key)
+        self.images[key] = img
+        if self.registry and not self.registry.charge("images", key, surface_bytes(img)):
+            del self.images[key]
         return img
 
     def sound(self, key):
         if key in self.sounds:
             return self.sounds[key]
-        path = self.manifest["sounds"].get(key)
-        s = None
-        if path and os.path.exists(path):
-            try:
-                s = pygame.mixer.Sound(path)
-            except Exception:
-                s = None
+        return self.adopt_sound(key, self.decode_sound(key) if self.has_sound(key) else None)
+
+    def adopt_sound(self, key, s):
         self.sounds[key] = s
+        if self.registry and s is not None and not self.registry.charge("sounds", key, sound_bytes(s)):
+            del self.sounds[key]
         return s
 
-    def font(self, path, size):
+    def font(self, path, size, data=None):
         k = (path, size)
         if k in self.fonts:
             return self.fonts[k]
-        if path and os.path.exists(path):
+        if data is None and self._bundled("fonts/" + str(path)):
+            data = self.font_bytes(path)
+        if data is not None:
+            f = pygame.font.Font(io.BytesIO(data), size)
+        elif path is None:
+            f = pygame.font.Font(None, size)
+        elif self.index.exists(path):
             f = pygame.font.Font(path, size)
         else:
             f = pygame.font.SysFont("arial", size)
         self.fonts[k] = f
         return f
+
@@ -0,0 +1,139 @@
+import time
+import pygame
+from src.config import settings
+from src.services.cache_budget import sound_bytes
+
+def init_mixer():
+    """Start the mixer with a small buffer; False when there is no audio device."""
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init(settings.AUDIO_FREQUENCY, -16, 2, settings.AUDIO_BUFFER)
+    except pygame.error:
+        return False
+    return True
+
+class AudioManager:
+    """Plays effects on channels reserved per category and streams music.
+
+    play() only queues; update() (once per frame) starts the queue, so the
+    same effect requested several times in one frame plays once (coalesced).
+    An effect is also skipped if it started less than its category's
+    min_interval ago (throttled). When every channel of a category is busy
+    the one that started first is cut off. Effects are decoded on first use
+    through the AssetLoader and kept there.
+    """
+
+    def __init__(self, assets, channels=None, min_interval=None, clock=time.monotonic):
+        self.assets = assets
+        self.clock = clock
+        self.enabled = True
+        self.min_interval = settings.SFX_MIN_INTERVAL if min_interval is None else min_interval
+        self.queue = {}
+        self.last = {}
+        self.channels = {}
+        self.started = {}
+        self.music = None
+        self.counts = {"requested": 0, "played": 0, "coalesced": 0, "throttled": 0, "stolen": 0, "missing": 0}
+        self.ready = init_mixer()
+        if not self.ready:
+            return
+        layout = settings.AUDIO_CHANNELS if channels is None else channels
+        total = sum(layout.values())
+        if pygame.mixer.get_num_channels() < total + 2:
+            pygame.mixer.set_num_channels(total + 2)
+        # Reserved channels are never handed out by Sound.play(), only by us
+        pygame.mixer.set_reserved(total)
+        i = 0
+        for category, count in layout.items():
+            self.channels[category] = [pygame.mixer.Channel(i + n) for n in range(count)]
+            i += count
+
+    def play(self, key, category="event", volume=1.0):
+        if not self.enabled or not self.ready:
+            return
+        self.counts["requested"] += 1
+        queued = self.queue.get(key)
+        if queued is not None:
+            self.counts["coalesced"] += 1
+            self.queue[key] = (queued[0], max(queued[1], volume))
+            return
+        self.queue[key] = (category, volume)
+
+    def update(self):
+        if not self.queue:
+            return
+        now = self.clock()
+        for key, (category, volume) in self.queue.items():
+            last = self.last.get(key)
+            if last is not None and now - last < self.min_interval.get(category, 0.0):
+                self.counts["throttled"] += 1
+                continue
+            sound = self.assets.sound(key)
+            if sound is None:
+                self.counts["missing"] += 1
+                continue
+            channel = self._channel(category)
+            if channel is None:
+                continue
+            channel.set_volume(volume)
+            channel.play(sound)
+            self.started[channel] = now
+            self.last[key] = now
+            self.counts["played"] += 1
+        self.queue.clear()
+
+    def _channel(self, category):
+        pool = self.channels.get(category) or self.channels.get("event")
+        if not pool:
+            return None
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        self.counts["stolen"] += 1
+        oldest = min(pool, key=lambda c: self.started.get(c, 0.0))
+        oldest.stop()
+        return oldest
+
+    def play_music(self, path, loops=-1, fade_ms=500, volume=None):
+        """Stream a track from disk with pygame.mixer.music; nothing is held in memory."""
+        if not self.ready or path == self.music:
+            return
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(settings.MUSIC_VOLUME if volume is None else volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except pygame.error:
+            self.music = None
+            return
+        self.music = path
+
+    def stop_music(self, fade_ms=300):
+        if self.ready and self.music:
+            pygame.mixer.music.fadeout(fade_ms)
+        self.music = None
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.queue.clear()
+        if not self.ready:
+            return
+        if not enabled:
+            for pool in self.channels.values():
+                for channel in pool:
+                    channel.stop()
+            pygame.mixer.music.pause()
+        elif self.music:
+            pygame.mixer.music.unpause()
+
+    def stats(self):
+        out = dict(self.counts, ready=self.ready, music=self.music, channels={})
+        if not self.ready:
+            return out
+        for category, pool in self.channels.items():
+            out["channels"][category] = (sum(1 for c in pool if c.get_busy()), len(pool))
+        out["mixer"] = pygame.mixer.get_init()
+        decoded = [s for s in self.assets.sounds.values() if s is not None]
+        out["decoded"] = len(decoded)
+        out["decoded_bytes"] = sum(sound_bytes(s) for s in decoded)
+        return out
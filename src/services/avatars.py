@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+def _rgba(surface):
+    if surface.get_flags() & pygame.SRCALPHA and surface.get_bitsize() == 32:
+        return surface
+    rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    rgba.blit(surface, (0, 0))
+    return rgba
+
+def circle_mask(surface):
+    """Copy of surface with everything outside the inscribed circle transparent."""
+    w, h = surface.get_size()
+    mask = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.circle(mask, (255, 255, 255, 255), (w // 2, h // 2), min(w, h) // 2)
+    out = surface.copy()
+    out.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    return out
+
+def prepare(surface, sizes, circle=True):
+    """Square-crop, downsample, mask once, then make each size from the result.
+
+    Pure surface work with no display calls, so it can run on a worker thread.
+    Returns {size: surface} without display conversion.
+    """
+    surface = _rgba(surface)
+    w, h = surface.get_size()
+    side = min(w, h)
+    square = surface.subsurface(((w - side) // 2, (h - side) // 2, side, side))
+    top = max(sizes)
+    # Halve while more than twice too big; smoothscale is cheaper and sharper in steps
+    while side >= top * 4:
+        side //= 2
+        square = pygame.transform.smoothscale(square, (side, side))
+    master = pygame.transform.smoothscale(square, (top, top)) if side != top else square.copy()
+    if circle:
+        master = circle_mask(master)
+    return {s: master if s == top else pygame.transform.smoothscale(master, (s, s)) for s in sizes}
+
+class Avatar:
+    """A player picture as pre-sized, pre-masked variants; drawing never scales."""
+
+    def __init__(self, variants):
+        self.variants = variants
+
+    @classmethod
+    def from_surface(cls, surface, sizes, circle=True):
+        return cls.adopt(prepare(surface, sizes, circle))
+
+    @classmethod
+    def adopt(cls, variants):
+        # Main thread only: convert for fast blits once the display exists
+        if pygame.display.get_surface() is not None:
+            variants = {s: img.convert_alpha() for s, img in variants.items()}
+        return cls(variants)
+
+    @property
+    def source(self):
+        """Largest variant; what gets saved."""
+        return self.variants[max(self.variants)]
+
+    def get(self, size):
+        img = self.variants.get(size)
+        if img is None:
+            # An unplanned size is made once, then kept
+            img = pygame.transform.smoothscale(self.source, (size, size))
+            self.variants[size] = img
+        return img
+
+class AvatarPipeline:
+    """Decodes and prepares avatars on a background thread.
+
+    load() returns a ticket; call ready(ticket) from the main loop, which
+    returns the finished Avatar (or None while it is still working).
+    """
+
+    def __init__(self, sizes, workers=2):
+        self.sizes = tuple(sorted(set(sizes)))
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="avatars")
+
+    def _load(self, path, circle):
+        return prepare(pygame.image.load(path), self.sizes, circle)
+
+    def load(self, path, circle=True):
+        return self.pool.submit(self._load, path, circle)
+
+    def submit(self, surface, circle=True):
+        return self.pool.submit(prepare, surface, self.sizes, circle)
+
+    def ready(self, ticket):
+        if not ticket.done():
+            return None
+        return Avatar.adopt(ticket.result())
+
+    def wait(self, ticket):
+        return Avatar.adopt(ticket.result())
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
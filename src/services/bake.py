@@ -0,0 +1,75 @@
+import json
+import os
+import sys
+import pygame
+
+BAKE_VERSION = 1
+
+def variant_name(key, size):
+    return f"{key}_{size[0]}x{size[1]}.png"
+
+def collect_sizes(scenes, views):
+    """Union of scene.image_sizes(view) over every scene and view: {key: {(w, h)}}."""
+    sizes = {}
+    for view in views:
+        for scene in scenes:
+            for key, wanted in scene.image_sizes(view).items():
+                sizes.setdefault(key, set()).update(tuple(s) for s in wanted)
+    return sizes
+
+def bake(out_dir, assets, sizes, premultiply=True):
+    """Write one PNG per (key, size) and a manifest.json describing them.
+
+    Needs a display mode (any size) so sources can be converted to 32-bit.
+    Keys whose source image is missing are skipped.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    images = {}
+    for key in sorted(sizes):
+        if not assets.can_load_image(key):
+            continue
+        src = assets.decode_image(key).convert_alpha()
+        for size in sorted(sizes[key]):
+            img = pygame.transform.smoothscale(src, size)
+            if premultiply:
+                img = img.premul_alpha()
+            name = variant_name(key, size)
+            pygame.image.save(img, os.path.join(out_dir, name))
+            images.setdefault(key, {})[f"{size[0]}x{size[1]}"] = name
+    manifest = {"version": BAKE_VERSION, "premultiplied": premultiply, "images": images}
+    tmp = os.path.join(out_dir, "manifest.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp, os.path.join(out_dir, "manifest.json"))
+    return manifest
+
+def load_manifest(out_dir):
+    try:
+        with open(os.path.join(out_dir, "manifest.json")) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != BAKE_VERSION:
+        return None
+    return manifest
+
+def main(argv=None):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from src.config import settings
+    from src.services.assets import AssetLoader
+    from src.ui.viewport import Viewport
+    from src.scenes.board_scene import BoardScene
+    from src.scenes.multi_table_scene import MultiTableScene
+    argv = sys.argv[1:] if argv is None else argv
+    out_dir = argv[0] if argv else settings.BAKED_DIR
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    logical = (settings.WINDOW_WIDTH, settings.WINDOW_HEIGHT)
+    views = [Viewport(logical, (int(logical[0] * s), int(logical[1] * s))) for s in settings.BAKE_SCALES]
+    sizes = collect_sizes([BoardScene, MultiTableScene], views)
+    manifest = bake(out_dir, AssetLoader(settings.ASSET_MANIFEST), sizes)
+    count = sum(len(v) for v in manifest["images"].values())
+    print(f"Baked {count} variants of {len(manifest['images'])} images into {out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import pygame
+
+MAGIC = b"SLB1"
+_HEAD = struct.Struct("<4sI")
+
+class AssetBundle:
+    """Read-only view of a packed asset file.
+
+    Layout: MAGIC, uint32 header length, JSON header, then the raw file bytes.
+    The header maps entry name -> [offset, length, type], offsets relative to
+    the end of the header. The file is memory-mapped, so opening the bundle
+    reads only the header and each entry is paged in when it is decoded.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_len = _HEAD.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not an asset bundle")
+        start = _HEAD.size
+        self.entries = json.loads(bytes(self.map[start:start + header_len]).decode("utf-8"))
+        self.data_start = start + header_len
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def view(self, name):
+        offset, length, _ = self.entries[name]
+        start = self.data_start + offset
+        return memoryview(self.map)[start:start + length]
+
+    def open(self, name):
+        # BytesIO copies just this entry, which the decoders need as a file object
+        return io.BytesIO(self.view(name))
+
+    def load_image(self, name):
+        return pygame.image.load(self.open(name), "x." + self.entries[name][2])
+
+    def load_sound(self, name):
+        return pygame.mixer.Sound(file=self.open(name))
+
+    def close(self):
+        self.map.close()
+        self.file.close()
+
+def build_bundle(out_path, manifest, fonts=()):
+    """Pack every existing file in manifest (plus fonts) into out_path.
+
+    Images and sounds are stored as "images/<key>" and "sounds/<key>";
+    fonts as "fonts/<path>" so lookups by font path stay unchanged.
+    """
+    sources = []
+    for kind in ("images", "sounds"):
+        for key, path in manifest.get(kind, {}).items():
+            sources.append((f"{kind}/{key}", path))
+    for path in fonts:
+        sources.append((f"fonts/{path}", path))
+    entries = {}
+    blobs = []
+    offset = 0
+    for name, path in sources:
+        if not path or not os.path.isfile(path):
+            continue
+        with open(path, "rb") as f:
+            blob = f.read()
+        entries[name] = [offset, len(blob), os.path.splitext(path)[1].lstrip(".").lower()]
+        blobs.append(blob)
+        offset += len(blob)
+    header = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+    tmp = out_path + ".tmp"
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    with open(tmp, "wb") as f:
+        f.write(_HEAD.pack(MAGIC, len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, out_path)
+    return len(entries)
+
+def main(argv=None):
+    from src.config import settings
+    argv = sys.argv[1:] if argv is None else argv
+    out = argv[0] if argv else settings.ASSET_BUNDLE
+    count = build_bundle(out, settings.ASSET_MANIFEST, (settings.FONT_REGULAR, settings.FONT_BOLD))
+    print(f"Packed {count} assets into {out}")
+
+if __name__ == "__main__":
+    main()
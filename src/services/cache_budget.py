@@ -0,0 +1,113 @@
+import heapq
+import itertools
+import pygame
+
+# Fallback rebuild cost when a cache cannot time it: roughly one decode pass
+DEFAULT_COST_PER_BYTE = 1e-9
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+def sound_bytes(sound):
+    # From the length and mixer format; get_raw() would copy the whole buffer to measure it
+    freq, fmt, chans = pygame.mixer.get_init() or (0, 0, 0)
+    return int(sound.get_length() * freq) * chans * abs(fmt) // 8
+
+class CacheRegistry:
+    """One memory budget shared by every surface cache.
+
+    Caches register a drop(key) callback, then report entries with charge()
+    when they build one, hit() when they serve one and release() when they
+    remove one themselves. An entry bigger than the whole budget is refused:
+    charge() returns False and the cache hands it out without keeping it.
+    Past the budget, the entry with the lowest
+    GreedyDual-Size priority L + cost / bytes is dropped, whichever cache holds
+    it: big, cheap-to-rebuild entries go before small, expensive ones, and
+    recently used entries outrank stale ones because L rises with each eviction.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.drops = {}
+        self.entries = {}
+        self.heap = []
+        self.seq = itertools.count()
+        self.clock = 0.0
+        self.total = 0
+        self.evictions = 0
+        self.counters = {}
+
+    def register(self, name, drop):
+        # A new owner of the name (a scene built again, say) takes over from the old one and its entries
+        self.unregister(name)
+        self.drops[name] = drop
+        self.counters.setdefault(name, {"hits": 0, "misses": 0, "evictions": 0})
+
+    def unregister(self, name):
+        for k in [k for k in self.entries if k[0] == name]:
+            self.total -= self.entries.pop(k)[1]
+        self.drops.pop(name, None)
+
+    def _push(self, k, priority):
+        heapq.heappush(self.heap, (priority, next(self.seq), k))
+        if len(self.heap) > 4 * len(self.entries) + 64:
+            # Hits leave stale heap items behind; rebuild from live entries
+            self.heap = [(e[0], next(self.seq), key) for key, e in self.entries.items()]
+            heapq.heapify(self.heap)
+
+    def charge(self, name, key, size, cost=None):
+        k = (name, key)
+        old = self.entries.pop(k, None)
+        if old:
+            self.total -= old[1]
+        if name not in self.drops:
+            # Unregistered (its owner closed): nothing could drop it later
+            return False
+        self.counters[name]["misses"] += 1
+        if size > self.budget:
+            # Keeping it would evict everything else and then itself
+            return False
+        if cost is None:
+            cost = size * DEFAULT_COST_PER_BYTE
+        priority = self.clock + cost / max(1, size)
+        self.entries[k] = (priority, size, cost)
+        self.total += size
+        self._push(k, priority)
+        self.enforce()
+        return True
+
+    def hit(self, name, key):
+        k = (name, key)
+        e = self.entries.get(k)
+        if e is None:
+            return
+        self.counters[name]["hits"] += 1
+        priority = self.clock + e[2] / max(1, e[1])
+        if priority != e[0]:
+            self.entries[k] = (priority, e[1], e[2])
+            self._push(k, priority)
+
+    def release(self, name, key):
+        e = self.entries.pop((name, key), None)
+        if e:
+            self.total -= e[1]
+
+    def enforce(self):
+        while self.total > self.budget and self.heap:
+            priority, _, k = heapq.heappop(self.heap)
+            e = self.entries.get(k)
+            if e is None or e[0] != priority:
+                continue
+            self.clock = priority
+            del self.entries[k]
+            self.total -= e[1]
+            self.evictions += 1
+            self.counters[k[0]]["evictions"] += 1
+            self.drops[k[0]](k[1])
+
+    def stats(self):
+        caches = {name: dict(c, bytes=0, entries=0) for name, c in self.counters.items()}
+        for (name, _), e in self.entries.items():
+            caches[name]["bytes"] += e[1]
+            caches[name]["entries"] += 1
+        return {"budget": self.budget, "bytes": self.total, "evictions": self.evictions, "caches": caches}
@@ -0,0 +1,99 @@
+import hashlib
+import os
+import struct
+import pygame
+
+# Bump when the drawing code behind any cached layer changes
+LAYER_CACHE_VERSION = 2
+
+_HEAD = struct.Struct("<4sIII")
+_MAGIC = b"SLL1"
+
+class DiskLayerCache:
+    """Rendered layers kept on disk as raw RGBA, keyed by a hash of their inputs.
+
+    Each blob is a small header (magic, version, width, height) followed by
+    the pixels, so loading is one read plus pygame.image.frombuffer.
+    Least recently used blobs are deleted once the directory exceeds max_bytes.
+    """
+
+    def __init__(self, root, max_bytes, version=LAYER_CACHE_VERSION):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+
+    def digest(self, *inputs):
+        return hashlib.sha1(repr((self.version,) + inputs).encode("utf-8")).hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.root, digest + ".rgba")
+
+    def load(self, digest):
+        path = self._path(digest)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        if len(data) < _HEAD.size:
+            self.misses += 1
+            return None
+        magic, version, w, h = _HEAD.unpack_from(data)
+        if magic != _MAGIC or version != self.version or len(data) != _HEAD.size + w * h * 4:
+            self.misses += 1
+            self._remove(path)
+            return None
+        self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        layer = pygame.image.frombuffer(memoryview(data)[_HEAD.size:], (w, h), "RGBA")
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert_alpha()
+        return layer
+
+    def store(self, digest, layer):
+        w, h = layer.get_size()
+        os.makedirs(self.root, exist_ok=True)
+        path = self._path(digest)
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(_HEAD.pack(_MAGIC, self.version, w, h))
+                f.write(pygame.image.tobytes(layer, "RGBA"))
+            os.replace(tmp, path)
+        except OSError:
+            self._remove(tmp)
+            return
+        self.evict()
+
+    def evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.root):
+            if not name.endswith(".rgba"):
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+        return total
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,391 @@
+import argparse
+import json
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pygame
+from src.config import settings
+from src.core.replay import ReplayPlayer
+
+# GIF frames share one 256-entry palette; the last entry is kept for "unchanged" pixels
+PALETTE_COLORS = 255
+TRANSPARENT = 255
+TOKEN_COLORS = settings.PLAYER_COLORS
+# Starting a spawned worker: a fresh interpreter importing numpy and pygame, before
+# it draws the board (which is timed in the parent)
+WORKER_SPAWN_SECONDS = 1.0
+# Frames rendered in the parent first; their time decides the worker count
+SAMPLE_FRAMES = 32
+
+def _walk(square, steps):
+    # Same stepping and bounce-back as Player.step
+    out = []
+    for _ in range(steps):
+        square += 1
+        if square > 100:
+            square = 100 - (square - 100)
+        out.append(square)
+    return out
+
+def frame_plan(recording, start=0, stop=None, hold=3):
+    """Token squares and a caption for every frame of turns [start, stop).
+
+    Only the replay is run here; nothing is drawn. Each turn walks the
+    mover one square per frame, then shows any snake, ladder or power tile
+    as a jump, then holds for `hold` frames.
+    """
+    player = ReplayPlayer(recording)
+    stop = len(recording) if stop is None else min(stop, len(recording))
+    match = player.seek(start)
+    frames = []
+    for t in range(start, stop):
+        squares = [p.square for p in match.players]
+        mover = match.turn
+        event = player.step()
+        caption = f"Turn {t + 1}: {recording.names[mover]} rolled {event['roll']}"
+        for square in _walk(squares[mover], event["roll"]):
+            squares[mover] = square
+            frames.append((tuple(squares), caption))
+        if event["kind"] in ("snake", "ladder", "power_up", "power_down"):
+            caption += f" ({event['kind'].replace('_', ' ')} {event['from']} → {event['square']})"
+        if event.get("won"):
+            caption += " and wins"
+        after = tuple(p.square for p in match.players)
+        frames.extend([(after, caption)] * hold)
+    return frames
+
+class FrameRenderer:
+    """Draws plan frames off-screen: the cached board layer, tokens and a caption strip."""
+
+    def __init__(self, size):
+        from src.core.board import Board
+        from src.objects.snake import Snake
+        from src.objects.ladder import Ladder
+        from src.services.assets import AssetLoader
+        from src.ui.layers import render_board_layer, board_layer_margin
+        pygame.display.init()
+        pygame.font.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1))
+        size = size // 10 * 10
+        assets = AssetLoader(settings.ASSET_MANIFEST)
+        font = assets.font(settings.FONT_REGULAR, max(10, size // 40))
+        self.caption_font = assets.font(settings.FONT_BOLD, max(12, size // 30))
+        snakes = [Snake(h, t) for h, t in settings.SNAKES.items()]
+        ladders = [Ladder(b, a) for b, a in settings.LADDERS.items()]
+        layer = render_board_layer(assets, snakes, ladders, font, size)
+        margin = board_layer_margin(size // 10)
+        self.board = Board(origin=(margin, margin), size=size)
+        strip = self.caption_font.get_height() + 8
+        self.base = pygame.Surface((layer.get_width(), layer.get_height() + strip))
+        self.base.fill((255, 255, 255))
+        self.base.blit(layer, (0, 0))
+        self.frame = self.base.copy()
+        # Rects of self.frame that differ from the bare board
+        self.dirty = []
+        self.caption_y = layer.get_height() + 4
+        self.radius = max(3, size // 40)
+        self.captions = {}
+
+    @property
+    def size(self):
+        return self.base.get_size()
+
+    def render(self, squares, caption):
+        """Draw a frame into self.frame, repainting only what the last one touched."""
+        surface = self.frame
+        for r in self.dirty:
+            surface.blit(self.base, r, r)
+        dirty = []
+        for i, square in enumerate(squares):
+            x, y = self.board.square_pos(square)
+            # Tokens sharing a square sit in the corners of it
+            x += (i % 2 * 2 - 1) * self.radius // 2
+            y += (i // 2 * 2 - 1) * self.radius // 2
+            dirty.append(pygame.draw.circle(surface, (20, 20, 30), (x, y), self.radius + 1))
+            pygame.draw.circle(surface, TOKEN_COLORS[i % len(TOKEN_COLORS)], (x, y), self.radius)
+        text = self.captions.get(caption)
+        if text is None:
+            text = self.captions[caption] = self.caption_font.render(caption, True, (30, 30, 40))
+        dirty.append(surface.blit(text, (8, self.caption_y)))
+        self.dirty = [r.clip(surface.get_rect()) for r in dirty]
+        return surface
+
+    def indices(self, base, lut):
+        """Palette indices of the current frame, quantizing only its dirty rects over base (the board's)."""
+        out = base.copy()
+        for r in self.dirty:
+            if r.width and r.height:
+                out[r.top:r.bottom, r.left:r.right] = quantize(self.frame.subsurface(r), lut)
+        return out
+
+def median_cut(pixels, colors=PALETTE_COLORS):
+    """Palette of at most `colors` RGB entries for an (n, 3) uint8 array."""
+    unique, counts = np.unique(pixels.reshape(-1, 3), axis=0, return_counts=True)
+    boxes = [(unique.astype(np.int32), counts)]
+    while len(boxes) < colors:
+        # Split the box with the widest channel range at its weighted median
+        ranges = [int(np.ptp(b[0], axis=0).max()) if len(b[0]) > 1 else -1 for b in boxes]
+        k = int(np.argmax(ranges))
+        if ranges[k] <= 0:
+            break
+        px, w = boxes.pop(k)
+        channel = int(np.argmax(np.ptp(px, axis=0)))
+        order = np.argsort(px[:, channel], kind="stable")
+        px, w = px[order], w[order]
+        cut = int(np.searchsorted(np.cumsum(w), w.sum() / 2))
+        cut = min(max(cut, 1), len(px) - 1)
+        boxes += [(px[:cut], w[:cut]), (px[cut:], w[cut:])]
+    palette = [np.round((px * w[:, None]).sum(axis=0) / w.sum()) for px, w in boxes]
+    return np.array(palette, np.uint8)
+
+def palette_lut(palette):
+    """Nearest palette entry for every 15-bit colour (5 bits a channel)."""
+    levels = (np.arange(32) * 8 + 4).astype(np.int32)
+    grid = np.stack(np.meshgrid(levels, levels, levels, indexing="ij"), axis=-1).reshape(-1, 3)
+    lut = np.empty(len(grid), np.uint8)
+    pal = palette.astype(np.int32)
+    for i in range(0, len(grid), 4096):
+        d = ((grid[i:i + 4096, None, :] - pal[None, :, :]) ** 2).sum(axis=2)
+        lut[i:i + 4096] = np.argmin(d, axis=1)
+    return lut
+
+def quantize(surface, lut):
+    """(h, w) palette indices for a surface."""
+    rgb = pygame.surfarray.pixels3d(surface).swapaxes(0, 1) >> 3
+    return lut[(rgb[..., 0].astype(np.int32) << 10) | (rgb[..., 1].astype(np.int32) << 5) | rgb[..., 2]]
+
+def lzw_encode(data, min_code_size=8):
+    """GIF-flavoured LZW of a bytes-like of palette indices (variable width, LSB first)."""
+    clear = 1 << min_code_size
+    end = clear + 1
+    out = bytearray()
+    acc = 0
+    nbits = 0
+    size = min_code_size + 1
+    table = {}
+    next_code = end + 1
+    acc |= clear << nbits
+    nbits += size
+    if not data:
+        data = b"\x00"
+    prefix = data[0]
+    for b in data[1:]:
+        key = prefix << 8 | b
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        acc |= prefix << nbits
+        nbits += size
+        while nbits >= 8:
+            out.append(acc & 0xFF)
+            acc >>= 8
+            nbits -= 8
+        if next_code < 4096:
+            table[key] = next_code
+            if next_code == 1 << size and size < 12:
+                size += 1
+            next_code += 1
+        else:
+            # Table full: start over so the codes keep matching the picture
+            acc |= clear << nbits
+            nbits += size
+            table.clear()
+            next_code = end + 1
+            size = min_code_size + 1
+        prefix = b
+    acc |= prefix << nbits
+    nbits += size
+    acc |= end << nbits
+    nbits += size
+    while nbits > 0:
+        out.append(acc & 0xFF)
+        acc >>= 8
+        nbits -= 8
+    return bytes(out)
+
+def _sub_blocks(data):
+    out = bytearray()
+    for i in range(0, len(data), 255):
+        chunk = data[i:i + 255]
+        out.append(len(chunk))
+        out += chunk
+    out.append(0)
+    return bytes(out)
+
+def write_gif(path, size, palette, frames, loop=0):
+    """frames: (x, y, w, h, lzw bytes, delay in 1/100 s); later frames draw over earlier ones."""
+    table = np.zeros((256, 3), np.uint8)
+    table[:len(palette)] = palette
+    out = bytearray(b"GIF89a")
+    out += struct.pack("<HHBBB", size[0], size[1], 0xF7, 0, 0)
+    out += table.tobytes()
+    out += b"\x21\xFF\x0BNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00"
+    for x, y, w, h, data, delay in frames:
+        # Disposal 1 (leave in place) plus the transparent index, so deltas only cover what changed
+        out += b"\x21\xF9\x04" + struct.pack("<BHBB", (1 << 2) | 1, delay, TRANSPARENT, 0)
+        out += b"\x2C" + struct.pack("<HHHHB", x, y, w, h, 0)
+        out += b"\x08" + _sub_blocks(data)
+    out += b"\x3B"
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(out)
+    os.replace(tmp, path)
+    return len(out)
+
+def delta(indices, previous):
+    """(x, y, w, h, pixels) covering what changed since previous, or None if nothing did.
+
+    Unchanged pixels inside the box become TRANSPARENT, which LZW packs into long runs.
+    """
+    if previous is None:
+        h, w = indices.shape
+        return 0, 0, w, h, indices
+    changed = indices != previous
+    rows = np.flatnonzero(changed.any(axis=1))
+    if not len(rows):
+        return None
+    cols = np.flatnonzero(changed.any(axis=0))
+    y0, y1, x0, x1 = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+    box = indices[y0:y1, x0:x1].copy()
+    box[~changed[y0:y1, x0:x1]] = TRANSPARENT
+    return int(x0), int(y0), int(x1 - x0), int(y1 - y0), box
+
+_renderer = None
+
+def _init_worker(size):
+    global _renderer
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    _renderer = FrameRenderer(size)
+
+def _render_chunk(frames, first, lut, out_dir):
+    """Plan frames from index first; after frame 0, frames starts with frame first - 1 as the delta baseline.
+
+    Workers get only their own slice of the plan. GIF (lut set): (x, y, w, h,
+    lzw) per changed frame. PNG: the file name per changed frame. None marks
+    a frame identical to the one before.
+    """
+    base = quantize(_renderer.base, lut) if lut is not None else None
+    previous = None
+    if first > 0:
+        surface = _renderer.render(*frames[0])
+        previous = _renderer.indices(base, lut) if lut is not None else pygame.surfarray.array3d(surface)
+        frames = frames[1:]
+    results = []
+    for i, frame in enumerate(frames, first):
+        surface = _renderer.render(*frame)
+        if lut is None:
+            pixels = pygame.surfarray.array3d(surface)
+            if previous is not None and np.array_equal(pixels, previous):
+                results.append(None)
+                continue
+            name = f"frame-{i:05d}.png"
+            pygame.image.save(surface, os.path.join(out_dir, name))
+            results.append(name)
+            previous = pixels
+            continue
+        indices = _renderer.indices(base, lut)
+        d = delta(indices, previous)
+        if d is None:
+            results.append(None)
+            continue
+        x, y, w, h, box = d
+        results.append((x, y, w, h, lzw_encode(np.ascontiguousarray(box).tobytes())))
+        previous = indices
+    return results
+
+def export(recording, path, start=0, stop=None, size=400, fps=20, workers=None, hold=3):
+    """Render turns [start, stop) of a recording to an animated GIF, or PNG frames.
+
+    A path ending in .gif gets a GIF; anything else is a directory for
+    frame-NNNNN.png files plus frames.json with each file's duration. The
+    first frames are rendered here; the rest are split into chunks rendered
+    by worker processes under the SDL dummy driver, as many as that timing
+    says will pay for their startup (workers overrides it). Frames identical to the previous one are dropped and their
+    time added to it. Returns a dict of counts and timings.
+    """
+    began = time.perf_counter()
+    plan = frame_plan(recording, start, stop, hold)
+    if not plan:
+        raise ValueError("no turns to export")
+    gif = path.lower().endswith(".gif")
+    out_dir = None if gif else path
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    # One palette for every frame, from a frame with the tokens on the board
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    t = time.perf_counter()
+    _init_worker(size)
+    init_seconds = time.perf_counter() - t
+    frame_size = _renderer.size
+    palette = median_cut(pygame.surfarray.array3d(_renderer.render(*plan[len(plan) // 2])).swapaxes(0, 1)) if gif else None
+    lut = palette_lut(palette) if gif else None
+    sample = min(len(plan), SAMPLE_FRAMES)
+    t = time.perf_counter()
+    parts = [_render_chunk(plan[:sample], 0, lut, out_dir)]
+    rest = len(plan) - sample
+    if workers is None:
+        # A worker has to save at least twice what it costs to start
+        remaining = rest * (time.perf_counter() - t) / sample
+        workers = max(1, min(os.cpu_count() or 1, int(remaining / (2 * (WORKER_SPAWN_SECONDS + init_seconds)))))
+    chunk = max(8, -(-rest // (workers * 4)))
+    jobs = [(plan[a - 1:min(a + chunk, len(plan))], a) for a in range(sample, len(plan), chunk)]
+    if workers == 1:
+        parts += [_render_chunk(frames, a, lut, out_dir) for frames, a in jobs]
+    elif jobs:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(size,)) as pool:
+            futures = [pool.submit(_render_chunk, frames, a, lut, out_dir) for frames, a in jobs]
+            parts += [f.result() for f in futures]
+    results = [r for part in parts for r in part]
+    # Dropped frames lengthen the frame shown before them
+    frame_cs = max(2, round(100 / fps))
+    kept = []
+    for r in results:
+        if r is None:
+            kept[-1][1] += 1
+        else:
+            kept.append([r, 1])
+    if gif:
+        written = write_gif(path, frame_size, palette, [(*r, n * frame_cs) for r, n in kept])
+    else:
+        timing = [{"file": name, "ms": n * 1000 // fps} for name, n in kept]
+        with open(os.path.join(out_dir, "frames.json"), "w") as f:
+            json.dump({"size": frame_size, "frames": timing}, f, indent=1)
+        written = sum(os.path.getsize(os.path.join(out_dir, name)) for name, _ in kept)
+    seconds = time.perf_counter() - began
+    return {"frames": len(plan), "written": len(kept), "bytes": written, "seconds": seconds,
+            "realtime": len(plan) / fps / seconds, "workers": workers}
+
+def main(argv=None):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from src.services.replay_archive import ReplayArchive
+    parser = argparse.ArgumentParser(description="Export a recorded game as a GIF or PNG frames.")
+    parser.add_argument("row", type=int, help="row in the replay archive (negative counts from the newest)")
+    parser.add_argument("out", help="output .gif, or a directory for PNG frames")
+    parser.add_argument("--start", type=int, default=0, help="first turn")
+    parser.add_argument("--turns", type=int, default=None, help="number of turns")
+    parser.add_argument("--size", type=int, default=400, help="board size in pixels")
+    parser.add_argument("--fps", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    archive = ReplayArchive(settings.REPLAY_DIR)
+    if not len(archive):
+        print("The replay archive is empty")
+        return 1
+    recording = archive.load(args.row % len(archive))
+    archive.shutdown()
+    stop = None if args.turns is None else args.start + args.turns
+    stats = export(recording, args.out, args.start, stop, args.size, args.fps, args.workers)
+    print(f"Wrote {stats['written']} of {stats['frames']} frames ({stats['bytes'] // 1024} KB) to {args.out} "
+          f"in {stats['seconds']:.1f}s, {stats['realtime']:.0f}x real time on {stats['workers']} workers")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
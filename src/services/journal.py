@@ -0,0 +1,196 @@
+import atexit
+import copy
+import json
+import os
+import queue
+import threading
+from src.core.player import FLAGS, pack_flags
+from src.services.persistence import atomic_write
+from src.services.savegame import read_save, write_save
+
+def turn_record(index, roll, player, effect, next_turn, won=False, clock=None):
+    """One finished turn: who rolled what, where they ended up and what the tile did."""
+    rec = {"p": index, "r": roll, "s": player.square, "n": next_turn}
+    flags = pack_flags(player)
+    if flags:
+        rec["f"] = flags
+    if effect:
+        rec["e"] = effect
+    if won:
+        rec["w"] = 1
+    if clock is not None:
+        rec["c"] = clock
+    return rec
+
+def apply_turn(state, rec):
+    """Replay one turn_record onto a save state (the dict BoardScene.serialize returns)."""
+    p = state["players"][rec["p"]]
+    p["square"] = rec["s"]
+    for i, f in enumerate(FLAGS):
+        p[f] = bool(rec.get("f", 0) >> i & 1)
+    state["turn"] = rec["n"]
+    if "c" in rec:
+        state["timed_remaining"] = rec["c"]
+    if rec.get("w") and state.get("mode") == "endless":
+        # An endless round scores the winner and sends everyone back to the start
+        scores = state.setdefault("endless_scores", [0] * len(state["players"]))
+        scores[rec["p"]] += 1
+        for q in state["players"]:
+            q["square"] = 1
+    return state
+
+class Journal:
+    """Autosave as a snapshot plus an append-only log of the turns since it.
+
+    Each turn is one JSON line, flushed and fsynced as it is written, so a
+    reboot loses at most the turns still being written. Every `every` turns
+    the state is written out as a fresh snapshot and the log starts over,
+    keeping recovery to the snapshot plus a few lines. Records carry a
+    sequence number that keeps growing across snapshots; a record at or below
+    the snapshot's is already in it and is skipped.
+
+    begin/record/clear only queue the work. The journal's own thread does the
+    writes in order and keeps a copy of the state current with apply_turn, so
+    compacting never calls back into the game. flush() waits for the queue;
+    close() drains it and stops the thread, and also runs at exit.
+    """
+
+    def __init__(self, root, every=20):
+        self.snapshot_path = os.path.join(root, "autosave.sav")
+        self.log_path = os.path.join(root, "autosave.log")
+        self.every = every
+        self.file = None
+        self.state = None
+        self.seq = 0
+        self.since = 0
+        self.records = 0
+        self.compactions = 0
+        self.errors = 0
+        self.ops = queue.Queue()
+        self.thread = None
+
+    def begin(self, state):
+        """Start journaling a game from state (a dict the caller may go on changing)."""
+        self._submit(self._begin, copy.deepcopy(state))
+
+    def record(self, rec):
+        """Append one turn_record."""
+        self._submit(self._record, dict(rec))
+
+    def clear(self):
+        """Forget the autosave, e.g. when the game ends."""
+        self._submit(self._clear)
+
+    def flush(self):
+        """Wait until everything queued is on disk."""
+        if self.thread is not None:
+            self.ops.join()
+
+    def close(self):
+        if self.thread is None:
+            return
+        self.ops.put(None)
+        self.thread.join()
+        self.thread = None
+        atexit.unregister(self.close)
+
+    def _submit(self, op, *args):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="journal", daemon=True)
+            self.thread.start()
+            atexit.register(self.close)
+        self.ops.put((op, args))
+
+    def _run(self):
+        while True:
+            item = self.ops.get()
+            try:
+                if item is None:
+                    self._close_log()
+                    return
+                op, args = item
+                op(*args)
+            except (OSError, ValueError) as e:
+                self.errors += 1
+                print(f"Warning: could not write autosave: {e}")
+            finally:
+                self.ops.task_done()
+
+    def _begin(self, state):
+        # Clear the old log first: a crash in between must not replay it onto the new snapshot
+        self._reset_log()
+        self.state = state
+        self._snapshot(state)
+
+    def _record(self, rec):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            self.file = open(self.log_path, "ab")
+        self.seq += 1
+        self.file.write(json.dumps(dict(rec, q=self.seq), separators=(",", ":")).encode("utf-8") + b"\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.records += 1
+        self.since += 1
+        if self.state is not None:
+            apply_turn(self.state, rec)
+            if self.since >= self.every:
+                self.compact()
+
+    def compact(self):
+        # Snapshot first, then drop the log; in between, the log's records are all <= the snapshot's seq
+        self._snapshot(self.state)
+        self._reset_log()
+        self.compactions += 1
+
+    def _snapshot(self, state):
+        write_save(self.snapshot_path, dict(state, seq=self.seq))
+        self.since = 0
+
+    def _close_log(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def _reset_log(self):
+        self._close_log()
+        if os.path.exists(self.log_path):
+            atomic_write(self.log_path, b"")
+
+    def _clear(self):
+        self._close_log()
+        self.state = None
+        for path in (self.snapshot_path, self.log_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self.since = 0
+
+    def recover(self, blobs):
+        """The autosaved state (snapshot plus log tail), or None when there is none."""
+        state = read_save(self.snapshot_path, blobs)
+        if state is None:
+            return None
+        seq = state.get("seq", 0)
+        self.seq = max(self.seq, seq)
+        for rec in self._read_log():
+            self.seq = max(self.seq, rec["q"])
+            if rec["q"] <= seq:
+                continue
+            apply_turn(state, rec)
+            state["seq"] = seq = rec["q"]
+        return state
+
+    def _read_log(self):
+        try:
+            with open(self.log_path, "rb") as f:
+                lines = f.read().split(b"\n")
+        except OSError:
+            return []
+        out = []
+        for line in lines:
+            try:
+                out.append(json.loads(line))
+            except ValueError:
+                # A torn last line from a crash mid-write; nothing after it is trusted
+                break
+        return out
@@ -1,13 +1,119 @@
+import atexit
 import json
 import os
+import threading
+import time
+
+def atomic_write(path, data):
+    """Replace path with data so a crash leaves either the old or the new file, never half of one."""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    if hasattr(os, "O_DIRECTORY"):
+        # Make the rename itself durable
+        fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
 
 def save(path, data):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write(path, json.dumps(data, separators=(",", ":")).encode("utf-8"))
 
 def load(path):
     if not os.path.exists(path):
         return None
     with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
\ No newline at end of file
+        return json.load(f)
+
+class WriteBehind:
+    """Coalesces file writes and performs them on one background thread.
+
+    put(path, data) takes bytes, or a callable returning bytes that is run on
+    the writer thread. Repeated puts to a path before it is written keep only
+    the last one. A batch is written delay seconds after its first put, each
+    file with atomic_write. flush() writes everything now; close() flushes and
+    stops the thread, and also runs at interpreter exit.
+    """
+
+    def __init__(self, delay=0.5):
+        self.delay = delay
+        self.pending = {}
+        self.due = None
+        self.busy = False
+        self.urgent = False
+        self.closed = False
+        self.writes = 0
+        self.errors = 0
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def put(self, path, data):
+        with self.cond:
+            if self.closed:
+                raise RuntimeError("WriteBehind is closed")
+            if not self.pending:
+                self.due = time.monotonic() + self.delay
+            self.pending[path] = data
+            self.cond.notify_all()
+
+    def dirty(self):
+        with self.cond:
+            return bool(self.pending) or self.busy
+
+    def _run(self):
+        while True:
+            with self.cond:
+                while not self.pending and not self.closed:
+                    self.cond.wait()
+                if not self.pending:
+                    return
+                while not (self.urgent or self.closed):
+                    left = self.due - time.monotonic()
+                    if left <= 0:
+                        break
+                    self.cond.wait(left)
+                batch, self.pending = self.pending, {}
+                self.busy = True
+            for path, data in batch.items():
+                try:
+                    atomic_write(path, data() if callable(data) else data)
+                    self.writes += 1
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Warning: could not write {path}: {e}")
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Write everything pending now and wait for it; False on timeout."""
+        with self.cond:
+            self.urgent = True
+            self.cond.notify_all()
+            done = self.cond.wait_for(lambda: not self.pending and not self.busy, timeout)
+            self.urgent = False
+            return done
+
+    def close(self):
+        with self.cond:
+            if self.closed:
+                return
+            self.closed = True
+            self.cond.notify_all()
+        self.thread.join()
+        atexit.unregister(self.close)
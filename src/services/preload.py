@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class Preloader:
+    """Reads and decodes assets on a thread pool.
+
+    pygame's image and sound decoders release the GIL, so files overlap.
+    Anything that touches the display (convert_alpha) or FreeType is
+    finished on the main thread in poll().
+    """
+
+    def __init__(self, assets, workers=4):
+        self.assets = assets
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload")
+        self.pending = []
+        self.queued = set()
+        self.total = 0
+        self.done = 0
+
+    def _add(self, kind, key, fn, arg):
+        if (kind, key) in self.queued:
+            return
+        self.queued.add((kind, key))
+        self.pending.append((kind, key, self.pool.submit(fn, arg)))
+        self.total += 1
+
+    def submit(self, manifest):
+        """Queue everything in manifest that is not already cached.
+
+        manifest: {"images": [key], "sounds": [key], "fonts": [(path, size)]}
+        """
+        a = self.assets
+        for key in manifest.get("images", ()):
+            if key not in a.images and a.can_load_image(key):
+                self._add("image", key, a.decode_image, key)
+        for key in manifest.get("sounds", ()):
+            if key not in a.sounds and a.has_sound(key):
+                self._add("sound", key, a.decode_sound, key)
+        for path, size in manifest.get("fonts", ()):
+            if (path, size) not in a.fonts and a.has_font(path):
+                self._add("font", (path, size), a.font_bytes, path)
+
+    def busy(self):
+        return bool(self.pending)
+
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def poll(self, budget=0.004):
+        """Hand finished items to the AssetLoader, spending at most budget seconds."""
+        start = time.perf_counter()
+        waiting = []
+        for item in self.pending:
+            kind, key, future = item
+            if not future.done() or time.perf_counter() - start > budget:
+                waiting.append(item)
+                continue
+            try:
+                value = future.result()
+            except Exception:
+                value = None
+            if kind == "image":
+                self.assets.adopt_image(key, value)
+            elif kind == "sound":
+                self.assets.adopt_sound(key, value)
+            elif value is not None:
+                self.assets.font(key[0], key[1], data=value)
+            self.queued.discard((kind, key))
+            self.done += 1
+        self.pending = waiting
+        if not self.pending:
+            self.total = self.done = 0
+        return self.progress()
+
+    def wait(self):
+        while self.pending:
+            self.poll(budget=1.0)
+            time.sleep(0.001)
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
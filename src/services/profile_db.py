@@ -0,0 +1,291 @@
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+from bisect import bisect_right
+from src.services.profiles import Profile, SORT_KEYS
+
+SCHEMA_VERSION = 1
+# Seek points kept per sort and search; scrolling adds one per window
+MAX_ANCHORS = 4096
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    name TEXT PRIMARY KEY,
+    color TEXT NOT NULL DEFAULT '[66,135,245]',
+    avatar TEXT,
+    games_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    items_collected INTEGER NOT NULL DEFAULT 0,
+    high_score INTEGER NOT NULL DEFAULT 0,
+    levels_completed INTEGER NOT NULL DEFAULT 0,
+    achievements TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS profiles_wins ON profiles (wins DESC, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS profiles_high_score ON profiles (high_score DESC, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS profiles_games_played ON profiles (games_played DESC, name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS profiles_name ON profiles (name COLLATE NOCASE);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+COLUMNS = ("name", "color", "avatar", "games_played", "wins", "items_collected", "high_score", "levels_completed", "achievements")
+
+def _row_to_profile(row):
+    p = Profile(row[0])
+    p.color = tuple(json.loads(row[1]))
+    p.avatar = row[2]
+    p.games_played, p.wins, p.items_collected, p.high_score, p.levels_completed = row[3:8]
+    p.achievements = json.loads(row[8])
+    return p
+
+def _profile_to_row(p):
+    return (p.name, json.dumps(list(p.color)), p.avatar, p.games_played, p.wins, p.items_collected,
+            p.high_score, p.levels_completed, json.dumps(p.achievements))
+
+class SqliteProfileStore:
+    """ProfileStore on SQLite, for venues with many players and several game processes.
+
+    Same get/update_win/update_play/save/query/count/page API as ProfileStore.
+    The database runs in WAL mode so readers never block the writer; every
+    write is one BEGIN IMMEDIATE transaction with a busy timeout, so processes
+    sharing the file queue up instead of failing. Counters are incremented in
+    SQL, never read-modify-written, so concurrent wins are not lost. Leaderboard
+    pages walk an index per sort key and seek from the key of the nearest row
+    already served (keyset pagination), so scrolling neither sorts nor skips
+    more than the rows in between.
+
+    save/update_win/update_play only queue the write: a thread with its own
+    connection runs the queue in order, so waiting on another process's lock
+    never stalls a frame. Reads see a write once it has run; flush() waits for
+    the queue, close() drains it and stops the thread, and also runs at exit.
+    """
+
+    def __init__(self, path="profiles.db", legacy_json=None, timeout=5.0):
+        self.path = path
+        self.timeout = timeout
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = self._connect()
+        # Profiles handed out by get(); save() writes these back
+        self.loaded = {}
+        self.ops = queue.Queue()
+        self.closed = False
+        self.writes = 0
+        self.errors = 0
+        # Per (sort, search): row counts, and offsets with the key of the row there
+        self._counts = {}
+        self._anchors = {}
+        self._version = None
+        with self._write():
+            if self.db.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        self.db.execute(statement)
+                self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        if legacy_json:
+            self.migrate_json(legacy_json)
+        self.thread = threading.Thread(target=self._run, name="profile-db", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        db.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        db.execute("PRAGMA journal_mode = WAL")
+        # WAL with NORMAL sync: commits are durable at checkpoints, without an fsync each
+        db.execute("PRAGMA synchronous = NORMAL")
+        return db
+
+    def _write(self):
+        return _Transaction(self.db)
+
+    def _submit(self, op, *args):
+        if self.closed:
+            raise RuntimeError("SqliteProfileStore is closed")
+        self.ops.put((op, args))
+
+    def _run(self):
+        db = self._connect()
+        try:
+            while True:
+                item = self.ops.get()
+                try:
+                    if item is None:
+                        return
+                    op, args = item
+                    with _Transaction(db):
+                        op(db, *args)
+                    self.writes += 1
+                except (sqlite3.Error, ValueError) as e:
+                    self.errors += 1
+                    print(f"Warning: could not write profiles to {self.path}: {e}")
+                finally:
+                    self.ops.task_done()
+        finally:
+            db.close()
+
+    def flush(self):
+        """Wait until every queued write has run."""
+        self.ops.join()
+
+    def migrate_json(self, path):
+        """Import a profiles.json once; names already in the database are left alone.
+
+        The import is recorded in the meta table, so the file is not read again.
+        """
+        key = "migrated:" + os.path.abspath(path)
+        if not os.path.exists(path) or self.db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        rows = [_profile_to_row(Profile.from_dict(dict(v, name=v.get("name", k)))) for k, v in raw.items()]
+        with self._write():
+            # Another process may have imported it while we were reading
+            if self.db.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+                return 0
+            before = self.db.total_changes
+            self.db.executemany(f"INSERT OR IGNORE INTO profiles ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", rows)
+            added = self.db.total_changes - before
+            self.db.execute("INSERT INTO meta (key, value) VALUES (?, ?)", (key, str(added)))
+        return added
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.ops.put(None)
+        self.thread.join()
+        self.db.close()
+        atexit.unregister(self.close)
+
+    def find(self, name):
+        row = self.db.execute(f"SELECT {', '.join(COLUMNS)} FROM profiles WHERE name = ?", (name,)).fetchone()
+        return _row_to_profile(row) if row else None
+
+    def get(self, name):
+        p = self.loaded.get(name)
+        if p is None:
+            p = self.find(name) or Profile(name)
+            self.loaded[name] = p
+        return p
+
+    def save(self):
+        # Counters are owned by update_win/update_play; saving never rolls them back
+        if not self.loaded:
+            return
+        self._submit(_save_rows, [_profile_to_row(p) for p in self.loaded.values()])
+        self.loaded.clear()
+
+    def update_win(self, name, score):
+        self._submit(_win, name, score)
+        self.loaded.pop(name, None)
+
+    def update_play(self, name):
+        self._submit(_play, name)
+        self.loaded.pop(name, None)
+
+    def _where(self, prefix):
+        if not prefix:
+            return [], []
+        # Range on the NOCASE index instead of LIKE, which cannot use it here
+        return ["name >= ? COLLATE NOCASE AND name < ? COLLATE NOCASE"], [prefix, prefix + "\uffff"]
+
+    def _order(self, sort):
+        if sort not in SORT_KEYS:
+            raise ValueError(f"unknown sort key {sort!r}")
+        # rowid last, as in the index, so every row has a distinct key to seek from
+        return f"ORDER BY {sort} DESC, name COLLATE NOCASE, rowid"
+
+    def _fresh(self):
+        # data_version moves whenever another connection commits, our writer thread's included
+        version = self.db.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._version:
+            self._version = version
+            self._counts = {}
+            self._anchors = {}
+
+    def query(self, sort="wins", prefix="", limit=None):
+        where, args = self._where(prefix)
+        sql = f"SELECT name FROM profiles {'WHERE ' + where[0] if where else ''} {self._order(sort)}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [r[0] for r in self.db.execute(sql, args)]
+
+    def count(self, sort="wins", prefix=""):
+        self._fresh()
+        k = (sort, prefix.lower())
+        if k not in self._counts:
+            where, args = self._where(prefix)
+            sql = f"SELECT COUNT(*) FROM profiles {'WHERE ' + where[0] if where else ''}"
+            self._counts[k] = self.db.execute(sql, args).fetchone()[0]
+        return self._counts[k]
+
+    def page(self, offset, limit, sort="wins", prefix=""):
+        offset, limit = int(offset), int(limit)
+        order = self._order(sort)
+        count = self.count(sort, prefix)
+        k = (sort, prefix.lower())
+        offsets, keys = self._anchors.setdefault(k, ([], []))
+        where, args = self._where(prefix)
+        # A search matching few rows reads them off the name index; otherwise walk the sort index
+        index = "profiles_name" if prefix and count * 8 < self.count(sort) else f"profiles_{sort}"
+        i = bisect_right(offsets, offset) - 1
+        skip = offset
+        if i >= 0:
+            value, name, rowid = keys[i]
+            where.append(f"{sort} <= ? AND ({sort} < ? OR name > ? COLLATE NOCASE OR (name = ? COLLATE NOCASE AND rowid >= ?))")
+            args += [value, value, name, name, rowid]
+            skip = offset - offsets[i]
+        sql = (f"SELECT rowid, {', '.join(COLUMNS)} FROM profiles INDEXED BY {index} "
+               f"{'WHERE ' + ' AND '.join(where) if where else ''} {order} LIMIT ? OFFSET ?")
+        rows = self.db.execute(sql, args + [limit, skip]).fetchall()
+        if rows and (i < 0 or offsets[i] != offset):
+            if len(offsets) >= MAX_ANCHORS:
+                del offsets[:], keys[:]
+            j = bisect_right(offsets, offset)
+            offsets.insert(j, offset)
+            keys.insert(j, (rows[0][COLUMNS.index(sort) + 1], rows[0][1], rows[0][0]))
+        return [_row_to_profile(r[1:]) for r in rows]
+
+    def top(self, n=10, sort="wins"):
+        return self.page(0, n, sort)
+
+def _save_rows(db, rows):
+    db.executemany(
+        f"INSERT INTO profiles ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))}) "
+        "ON CONFLICT(name) DO UPDATE SET color = excluded.color, avatar = excluded.avatar, "
+        "items_collected = excluded.items_collected, levels_completed = excluded.levels_completed, "
+        "high_score = MAX(high_score, excluded.high_score), achievements = excluded.achievements",
+        rows)
+
+def _win(db, name, score):
+    db.execute("INSERT OR IGNORE INTO profiles (name) VALUES (?)", (name,))
+    db.execute("UPDATE profiles SET games_played = games_played + 1, wins = wins + 1, "
+               "high_score = MAX(high_score, ?) WHERE name = ?", (score, name))
+    achievements = json.loads(db.execute("SELECT achievements FROM profiles WHERE name = ?", (name,)).fetchone()[0])
+    if "First Win" not in achievements:
+        achievements.append("First Win")
+        db.execute("UPDATE profiles SET achievements = ? WHERE name = ?", (json.dumps(achievements), name))
+
+def _play(db, name):
+    db.execute("INSERT OR IGNORE INTO profiles (name) VALUES (?)", (name,))
+    db.execute("UPDATE profiles SET games_played = games_played + 1 WHERE name = ?", (name,))
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error.
+
+    IMMEDIATE takes the write lock up front, so two processes cannot both
+    read and then fail to upgrade; the loser waits up to busy_timeout.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+        return self.db
+
+    def __exit__(self, kind, value, tb):
+        self.db.execute("COMMIT" if kind is None else "ROLLBACK")
+        return False
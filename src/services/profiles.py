@@ -1,5 +1,8 @@
 import os
 import json
+import threading
+from bisect import bisect_left, insort
+from src.services.persistence import atomic_write
 
 class Profile:
     def __init__(self, name):
@@ -23,7 +26,7 @@ class Profile:
             "items_collected": self.items_collected,
             "high_score": self.high_score,
             "levels_completed": self.levels_completed,
-            "achievements": self.achievements,
+            "achievements": list(self.achievements),
         }
 
     @staticmethod
@@ -39,10 +42,26 @@ class Profile:
         p.achievements = d.get("achievements",[])
         return p
 
+SORT_KEYS = ("wins", "high_score", "games_played")
+
 class ProfileStore:
-    def __init__(self, path="profiles.json"):
+    """Player profiles kept in memory and written out as one JSON file.
+
+    With a WriteBehind, save() only marks the store dirty; the file is
+    encoded and written on the writer thread.
+    """
+
+    def __init__(self, path="profiles.json", writer=None):
         self.path = path
+        self.writer = writer
+        # Held while the writer thread snapshots data
+        self.lock = threading.Lock()
         self.data = {}
+        self._order = {}
+        # Sort keys in step with each cached order, so one name can be moved by bisection
+        self._keys = {}
+        self._by_name = None
+        self._filtered = None
         self.load()
 
     def load(self):
@@ -52,27 +71,114 @@ class ProfileStore:
             self.data = {k: Profile.from_dict(v) for k,v in raw.items()}
         else:
             self.data = {}
+        self._invalidate()
+
+    def _invalidate(self):
+        self._order = {}
+        self._keys = {}
+        self._by_name = None
+        self._filtered = None
+
+    def _sort_key(self, sort):
+        return lambda n: (-getattr(self.data[n], sort), n.lower(), n)
+
+    def _place(self, name, before=None):
+        """Move name to its place in every cached order; before holds its old keys (None if new)."""
+        for sort, order in self._order.items():
+            keys = self._keys[sort]
+            if before is not None:
+                i = bisect_left(keys, before[sort])
+                del keys[i], order[i]
+            key = self._sort_key(sort)(name)
+            i = bisect_left(keys, key)
+            keys.insert(i, key)
+            order.insert(i, name)
+        if before is None and self._by_name is not None:
+            lowers, names = self._by_name
+            i = bisect_left(lowers, name.lower())
+            lowers.insert(i, name.lower())
+            names.insert(i, name)
+        self._filtered = None
+
+    def _current_keys(self, name):
+        return {sort: self._sort_key(sort)(name) for sort in self._order}
+
+    def query(self, sort="wins", prefix=""):
+        # Sorted name lists are cached per key; prefix matches come from a bisect on a name index
+        if sort not in self._order:
+            key = self._sort_key(sort)
+            self._order[sort] = sorted(self.data, key=key)
+            self._keys[sort] = [key(n) for n in self._order[sort]]
+        order = self._order[sort]
+        prefix = prefix.lower()
+        if not prefix:
+            return order
+        if self._filtered and self._filtered[0] == (sort, prefix):
+            return self._filtered[1]
+        if self._by_name is None:
+            pairs = sorted((n.lower(), n) for n in self.data)
+            self._by_name = ([p[0] for p in pairs], [p[1] for p in pairs])
+        lowers, names = self._by_name
+        lo = bisect_left(lowers, prefix)
+        hi = bisect_left(lowers, prefix + "\uffff", lo)
+        if hi - lo == len(order):
+            result = order
+        elif (hi - lo) * 8 < len(order):
+            result = sorted(names[lo:hi], key=self._sort_key(sort))
+        else:
+            wanted = set(names[lo:hi])
+            result = [n for n in order if n in wanted]
+        self._filtered = ((sort, prefix), result)
+        return result
+
+    def count(self, sort="wins", prefix=""):
+        return len(self.query(sort, prefix))
+
+    def page(self, offset, limit, sort="wins", prefix=""):
+        return [self.data[n] for n in self.query(sort, prefix)[offset:offset + limit]]
+
+    def encode(self):
+        with self.lock:
+            records = {k: v.to_dict() for k, v in self.data.items()}
+        return json.dumps(records, separators=(",", ":")).encode("utf-8")
 
     def save(self):
-        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump({k:v.to_dict() for k,v in self.data.items()}, f, indent=2)
+        if self.writer is not None:
+            self.writer.put(self.path, self.encode)
+        else:
+            atomic_write(self.path, self.encode())
+
+    def top(self, n=10, sort="wins"):
+        return self.page(0, n, sort)
+
+    def close(self):
+        # Nothing to release: pending writes belong to the WriteBehind, which its owner closes
+        pass
+
+    def find(self, name):
+        return self.data.get(name)
 
     def get(self, name):
         if name not in self.data:
-            self.data[name] = Profile(name)
+            with self.lock:
+                self.data[name] = Profile(name)
+            self._place(name)
         return self.data[name]
 
     def update_win(self, name, score):
         p = self.get(name)
+        before = self._current_keys(name)
         p.games_played += 1
         p.wins += 1
         p.high_score = max(p.high_score, score)
         if "First Win" not in p.achievements:
             p.achievements.append("First Win")
+        self._place(name, before)
         self.save()
 
     def update_play(self, name):
         p = self.get(name)
+        before = self._current_keys(name)
         p.games_played += 1
+        self._place(name, before)
         self.save()
\ No newline at end of file
@@ -0,0 +1,254 @@
+import glob
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from src.config import settings
+from src.core.replay import Recording, ReplayPlayer
+from src.services.persistence import atomic_write
+
+INDEX_VERSION = 1
+MODES = ("classic", "timed", "endless")
+
+def _columns(snakes, ladders):
+    # name: (dtype, row shape)
+    return {
+        "segment": (np.uint32, ()),
+        "offset": (np.uint64, ()),
+        "size": (np.uint32, ()),
+        "length": (np.uint32, ()),
+        "mode": (np.uint8, ()),
+        "players": (np.uint8, ()),
+        "winner": (np.int8, ()),
+        "snakes": (np.uint16, ()),
+        "ladders": (np.uint16, ()),
+        "snake_hits": (np.uint16, (len(snakes),)),
+        "winner_snake_hits": (np.uint16, (len(snakes),)),
+        "ladder_climbs": (np.uint16, (len(ladders),)),
+        "ended_at": (np.float64, ()),
+    }
+
+def summarize(recording, snakes, ladders):
+    """One index row for a recording, found by playing it through the engine."""
+    player = ReplayPlayer(recording)
+    n = len(recording.names)
+    hits = np.zeros((n, len(snakes)), np.uint16)
+    climbs = np.zeros(len(ladders), np.uint16)
+    snake_col = {head: i for i, head in enumerate(snakes)}
+    ladder_col = {bottom: i for i, bottom in enumerate(ladders)}
+    while not player.done():
+        event = player.step()
+        if event["kind"] == "snake" and event["from"] in snake_col:
+            hits[event["player"], snake_col[event["from"]]] += 1
+        elif event["kind"] == "ladder" and event["from"] in ladder_col:
+            climbs[ladder_col[event["from"]]] += 1
+    match = player.match
+    if match.winner is not None:
+        winner = match.players.index(match.winner)
+    elif max(match.endless_scores, default=0) > 0:
+        winner = int(np.argmax(match.endless_scores))
+    else:
+        winner = -1
+    mode = (recording.mode or "classic").lower()
+    return {
+        "length": len(recording),
+        "mode": MODES.index(mode) if mode in MODES else 0,
+        "players": n,
+        "winner": winner,
+        "snakes": int(hits.sum()),
+        "ladders": int(climbs.sum()),
+        "snake_hits": hits.sum(axis=0),
+        "winner_snake_hits": hits[winner] if winner >= 0 else np.zeros(len(snakes), np.uint16),
+        "ladder_climbs": climbs,
+    }
+
+class ReplayArchive:
+    """Replays packed into a few segment files, with a columnar index beside them.
+
+    Each recording is appended to the current segment-NNNN.bin; a segment is
+    closed once it passes segment_bytes. index/ holds one .npy file per
+    column (length, winner, mode, snake and ladder counts, ...), opened
+    memory-mapped and grown by doubling, plus meta.json with the row count.
+    Rows past the count (a crash between the write and the meta update) are
+    ignored, and so are segment bytes no row points at.
+
+    query() filters the columns with NumPy without touching a segment;
+    recordings() then decodes only the games asked for.
+    """
+
+    def __init__(self, root, segment_bytes=32 * 1024 * 1024, snakes=None, ladders=None):
+        self.root = root
+        self.index_dir = os.path.join(root, "index")
+        self.meta_path = os.path.join(self.index_dir, "meta.json")
+        self.segment_bytes = segment_bytes
+        self.lock = threading.RLock()
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replays")
+        meta = self._read_meta()
+        if meta is None:
+            snakes = sorted(settings.SNAKES if snakes is None else snakes)
+            ladders = sorted(settings.LADDERS if ladders is None else ladders)
+            meta = {"version": INDEX_VERSION, "count": 0, "capacity": 0, "snakes": snakes, "ladders": ladders}
+        self.count = meta["count"]
+        self.capacity = meta["capacity"]
+        # Column order of the per-snake and per-ladder columns
+        self.snakes = meta["snakes"]
+        self.ladders = meta["ladders"]
+        self.spec = _columns(self.snakes, self.ladders)
+        self.columns = {}
+        if self.capacity:
+            for name in self.spec:
+                self.columns[name] = np.load(self._column_path(name), mmap_mode="r+")
+        segments = sorted(glob.glob(os.path.join(root, "segment-*.bin")))
+        self.segment = len(segments) - 1 if segments else 0
+        self._import_loose()
+
+    def _read_meta(self):
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if meta.get("version") == INDEX_VERSION else None
+
+    def _write_meta(self):
+        meta = {"version": INDEX_VERSION, "count": self.count, "capacity": self.capacity,
+                "snakes": self.snakes, "ladders": self.ladders}
+        atomic_write(self.meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _column_path(self, name):
+        return os.path.join(self.index_dir, name + ".npy")
+
+    def segment_path(self, segment):
+        return os.path.join(self.root, f"segment-{segment:04d}.bin")
+
+    def _import_loose(self):
+        # Single-file replays written before the archive existed
+        paths, recordings = [], []
+        for path in sorted(glob.glob(os.path.join(self.root, "*.replay"))):
+            try:
+                with open(path, "rb") as f:
+                    recordings.append(Recording.loads(f.read()))
+            except (OSError, ValueError):
+                continue
+            paths.append(path)
+        if recordings:
+            self.add_many(recordings, [os.path.getmtime(p) for p in paths])
+            for path in paths:
+                os.remove(path)
+
+    def _grow(self):
+        capacity = max(1024, self.capacity * 2)
+        os.makedirs(self.index_dir, exist_ok=True)
+        for name, (dtype, shape) in self.spec.items():
+            path = self._column_path(name)
+            tmp = path + ".tmp"
+            grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=(capacity,) + shape)
+            if name in self.columns:
+                grown[:self.count] = self.columns[name][:self.count]
+            grown.flush()
+            del grown
+            self.columns.pop(name, None)
+            os.replace(tmp, path)
+            self.columns[name] = np.load(path, mmap_mode="r+")
+        self.capacity = capacity
+
+    def __len__(self):
+        return self.count
+
+    def add(self, recording, ended_at=None):
+        """Append recording to the archive and index it; returns its row."""
+        return self.add_many([recording], [ended_at])[0]
+
+    def add_many(self, recordings, ended_at=None):
+        """Append several recordings with one fsync per segment and one index update."""
+        ended_at = ended_at or [None] * len(recordings)
+        rows = []
+        for recording, when in zip(recordings, ended_at):
+            row = summarize(recording, self.snakes, self.ladders)
+            row.update(data=recording.dumps(), ended_at=when or time.time())
+            rows.append(row)
+        with self.lock:
+            os.makedirs(self.root, exist_ok=True)
+            f = None
+            try:
+                for row in rows:
+                    data = row.pop("data")
+                    path = self.segment_path(self.segment)
+                    size = f.tell() if f else (os.path.getsize(path) if os.path.exists(path) else 0)
+                    if size and size + len(data) > self.segment_bytes:
+                        self._sync(f)
+                        f = None
+                        self.segment += 1
+                        path = self.segment_path(self.segment)
+                    if f is None:
+                        f = open(path, "ab")
+                    row.update(segment=self.segment, offset=f.tell(), size=len(data))
+                    f.write(data)
+            finally:
+                self._sync(f)
+            while self.count + len(rows) > self.capacity:
+                self._grow()
+            first = self.count
+            for i, row in enumerate(rows, first):
+                for name, value in row.items():
+                    self.columns[name][i] = value
+            for column in self.columns.values():
+                column.flush()
+            # The rows exist only once the count says so
+            self.count += len(rows)
+            self._write_meta()
+            return list(range(first, self.count))
+
+    def _sync(self, f):
+        if f is not None:
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+
+    def submit(self, recording):
+        """add() on the archive's own thread, so the game does not wait for the write."""
+        return self.pool.submit(self.add, recording, time.time())
+
+    def column(self, name):
+        """The first len(self) rows of a column, still memory-mapped."""
+        with self.lock:
+            if not self.count:
+                dtype, shape = self.spec[name]
+                return np.zeros((0,) + shape, dtype)
+            return self.columns[name][:self.count]
+
+    def snake(self, head):
+        """Column of snake_hits / winner_snake_hits for the snake starting at head."""
+        return self.snakes.index(head)
+
+    def ladder(self, bottom):
+        return self.ladders.index(bottom)
+
+    def query(self, where=None, limit=None):
+        """Rows whose index entries match.
+
+        where gets a dict of the memory-mapped columns and returns a boolean
+        mask, e.g. lambda c: (c["mode"] == MODES.index("endless")) & (c["length"] > 500).
+        """
+        with self.lock:
+            cols = {name: self.column(name) for name in self.spec}
+            rows = np.arange(self.count) if where is None else np.flatnonzero(where(cols))
+        return rows[:limit] if limit is not None else rows
+
+    def load(self, row):
+        with self.lock:
+            segment, offset, size = int(self.columns["segment"][row]), int(self.columns["offset"][row]), int(self.columns["size"][row])
+        with open(self.segment_path(segment), "rb") as f:
+            f.seek(offset)
+            return Recording.loads(f.read(size))
+
+    def recordings(self, rows):
+        """(row, Recording) for each row, decoding nothing else."""
+        for row in rows:
+            yield int(row), self.load(row)
+
+    def shutdown(self):
+        # Wait: a replay still queued would otherwise be lost
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,124 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import zlib
+import pygame
+from src.services.persistence import atomic_write
+
+# Save record layout: MAGIC, then zlib-compressed compact JSON
+SAVE_VERSION = 2
+MAGIC = b"SLS2"
+
+class BlobStore:
+    """Avatar images stored once as PNG, named by a hash of their pixels.
+
+    Saving the same picture again only hashes it; nothing is re-encoded or
+    rewritten. Saves refer to avatars by digest.
+    """
+
+    def __init__(self, root, writer=None):
+        self.root = root
+        self.writer = writer
+        # Digests known to be on disk or queued, so repeat saves skip the stat
+        self.known = set()
+
+    def digest(self, surface):
+        w, h = surface.get_size()
+        return hashlib.sha1(b"%dx%d:" % (w, h) + pygame.image.tobytes(surface, "RGBA")).hexdigest()
+
+    def path(self, digest):
+        return os.path.join(self.root, digest[:2], digest + ".png")
+
+    def exists(self, digest):
+        return digest in self.known or os.path.exists(self.path(digest))
+
+    def put(self, surface):
+        digest = self.digest(surface)
+        if digest in self.known:
+            return digest
+        path = self.path(digest)
+        if self.writer is not None:
+            # PNG encoding and the write both happen on the writer thread
+            snapshot = surface.copy()
+            self.writer.put(path, lambda: png_bytes(snapshot))
+        elif not os.path.exists(path):
+            atomic_write(path, png_bytes(surface))
+        self.known.add(digest)
+        return digest
+
+    def put_file(self, path):
+        try:
+            return self.put(pygame.image.load(path))
+        except (OSError, pygame.error):
+            return None
+
+    def load(self, digest):
+        return pygame.image.load(self.path(digest))
+
+def png_bytes(surface):
+    out = io.BytesIO()
+    pygame.image.save(surface, out, "avatar.png")
+    return out.getvalue()
+
+def dumps(state):
+    state = dict(state, version=SAVE_VERSION)
+    return MAGIC + zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"), 6)
+
+def loads(data, blobs):
+    """Parse a save of any version; older JSON saves are migrated to v2."""
+    if data[:len(MAGIC)] == MAGIC:
+        state = json.loads(zlib.decompress(data[len(MAGIC):]).decode("utf-8"))
+    else:
+        state = json.loads(data.decode("utf-8"))
+    return migrate(state, blobs)
+
+def write_save(path, state, writer=None):
+    data = dumps(state)
+    if writer is not None:
+        writer.put(path, data)
+    else:
+        atomic_write(path, data)
+
+def read_save(path, blobs):
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return loads(f.read(), blobs)
+
+def migrate(state, blobs):
+    version = state.get("version", 1)
+    if version == SAVE_VERSION:
+        return state
+    if version > SAVE_VERSION:
+        raise ValueError(f"save version {version} is newer than this game")
+    if "current_player_index" in state:
+        return _from_classic(state, blobs)
+    return _from_board(state, blobs)
+
+def _from_board(state, blobs):
+    # src/ v1: raw RGBA avatars inlined as base64 next to image_size
+    players = []
+    for p in state.get("players", []):
+        avatar = None
+        if p.get("image_data"):
+            img = pygame.image.frombytes(base64.b64decode(p["image_data"]), tuple(p["image_size"]), "RGBA")
+            avatar = blobs.put(img)
+        players.append({"name": p["name"], "square": p.get("square", 1), "avatar": avatar})
+    out = {k: v for k, v in state.items() if k != "players"}
+    out.update(version=SAVE_VERSION, app="board", players=players, turn=state.get("turn", 0))
+    return out
+
+def _from_classic(state, blobs):
+    # main.py v1: one PNG per player next to the save, positions as pos
+    players = []
+    for p in state.get("players", []):
+        q = {k: v for k, v in p.items() if k not in ("pos", "avatar_path")}
+        q["square"] = p.get("pos", 0)
+        path = p.get("avatar_path")
+        q["avatar"] = blobs.put_file(path) if path and os.path.exists(path) else None
+        players.append(q)
+    out = {k: v for k, v in state.items() if k not in ("players", "current_player_index")}
+    out.update(version=SAVE_VERSION, app="classic", players=players, turn=state.get("current_player_index", 0))
+    return out
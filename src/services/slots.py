@@ -0,0 +1,161 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from src.services.persistence import atomic_write
+from src.services.savegame import png_bytes, read_save, write_save
+
+INDEX_VERSION = 1
+
+def render_thumbnail(layer, margin, board_size, tokens, size):
+    """Board layer scaled down with a dot per token. Display-free, so it runs on a worker.
+
+    tokens: [(square, color)]; margin and board_size locate the board inside layer.
+    """
+    scale = size / board_size
+    w, h = layer.get_size()
+    thumb = pygame.transform.smoothscale(layer, (max(1, int(w * scale)), max(1, int(h * scale))))
+    out = pygame.Surface((size, size), pygame.SRCALPHA)
+    m = int(margin * scale)
+    out.blit(thumb, (-m, -m))
+    tile = size / 10
+    for i, (square, color) in enumerate(tokens):
+        s = max(1, min(100, square)) - 1
+        row, col = divmod(s, 10)
+        if row % 2 == 1:
+            col = 9 - col
+        x = int((col + 0.5) * tile) + (i % 2) * 3 - 1
+        y = int((9 - row + 0.5) * tile) + (i // 2) * 3 - 1
+        pygame.draw.circle(out, (0, 0, 0), (x, y), max(3, int(tile * 0.3)))
+        pygame.draw.circle(out, color, (x, y), max(2, int(tile * 0.3) - 1))
+    return out
+
+class SaveSlots:
+    """Named save slots listed from one small index file.
+
+    index.json holds, per slot: name, mode, player names, turn, timestamp and
+    the thumbnail path. list() reads only the index (kept in memory after the
+    first read), never the save files. Saves, thumbnails and the index go
+    through the WriteBehind writer; thumbnails are scaled, drawn and
+    PNG-encoded on its thread. Thumbnails are read back on a small pool.
+    """
+
+    def __init__(self, root, blobs, writer=None):
+        self.root = root
+        self.blobs = blobs
+        self.writer = writer
+        self.index_path = os.path.join(root, "index.json")
+        self.slots, self.counter = self._read_index()
+        self.pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="thumbs")
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}, 0
+        if index.get("version") != INDEX_VERSION:
+            return {}, 0
+        slots = index.get("slots", {})
+        return slots, index.get("counter", len(slots))
+
+    def _write(self, path, data):
+        if self.writer is not None:
+            self.writer.put(path, data)
+        else:
+            atomic_write(path, data() if callable(data) else data)
+
+    def _write_index(self):
+        data = json.dumps({"version": INDEX_VERSION, "counter": self.counter, "slots": self.slots}, separators=(",", ":")).encode("utf-8")
+        self._write(self.index_path, data)
+
+    def save_path(self, slot_id):
+        return os.path.join(self.root, slot_id + ".sav")
+
+    def thumbnail_path(self, slot_id):
+        return os.path.join(self.root, slot_id + ".png")
+
+    def new_id(self):
+        # The counter only grows and is kept in the index, so a deleted slot's id is never handed out again
+        while True:
+            self.counter += 1
+            slot_id = time.strftime("slot-%Y%m%d-%H%M%S") + f"-{self.counter}"
+            if slot_id not in self.slots:
+                return slot_id
+
+    def save(self, slot_id, name, state, thumbnail=None):
+        """thumbnail: callable returning a Surface, run on the writer thread (see render_thumbnail)."""
+        write_save(self.save_path(slot_id), state, self.writer)
+        thumb = None
+        if thumbnail is not None:
+            thumb = self.thumbnail_path(slot_id)
+            self._write(thumb, lambda: png_bytes(thumbnail()))
+        self.slots[slot_id] = {
+            "name": name,
+            "mode": state.get("mode"),
+            "players": [p["name"] for p in state.get("players", [])],
+            "turn": state.get("turn", 0),
+            "saved_at": time.time(),
+            "thumbnail": thumb,
+        }
+        self._write_index()
+        return slot_id
+
+    def list(self):
+        """Slot entries, newest first, each with its "id"."""
+        return [dict(meta, id=k) for k, meta in sorted(self.slots.items(), key=lambda kv: -kv[1]["saved_at"])]
+
+    def latest(self):
+        slots = self.list()
+        return slots[0]["id"] if slots else None
+
+    def load(self, slot_id):
+        if slot_id not in self.slots:
+            return None
+        if self.writer is not None:
+            self.writer.flush()
+        return read_save(self.save_path(slot_id), self.blobs)
+
+    def delete(self, slot_id):
+        meta = self.slots.pop(slot_id, None)
+        if meta is None:
+            return
+        self._write_index()
+        self.pool.submit(self._remove, [self.save_path(slot_id), meta.get("thumbnail")])
+
+    def _remove(self, paths):
+        if self.writer is not None:
+            self.writer.flush()
+        for path in paths:
+            if path and os.path.exists(path):
+                os.remove(path)
+
+    def load_thumbnail(self, slot_id):
+        """Future with the decoded thumbnail (convert it on the main thread), or None."""
+        meta = self.slots.get(slot_id)
+        if not meta or not meta.get("thumbnail"):
+            return None
+        return self.pool.submit(self._read_thumbnail, meta["thumbnail"])
+
+    def _read_thumbnail(self, path):
+        if self.writer is not None and self.writer.dirty():
+            # Just saved: let the writer land it before reading
+            self.writer.flush()
+        return pygame.image.load(path)
+
+    def import_file(self, path, slot_id, name, app=None):
+        """Register an existing save file (any version) as a slot; used for pre-slot saves.
+
+        With app, a save written by a different app is left alone (None).
+        """
+        state = read_save(path, self.blobs)
+        if state is None or (app is not None and state.get("app") != app):
+            return None
+        self.save(slot_id, name, state)
+        self.slots[slot_id]["saved_at"] = os.path.getmtime(path)
+        self._write_index()
+        return slot_id
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,152 @@
+import os
+import wave
+import numpy as np
+import pygame
+
+# Bump when any recipe changes so cached WAVs are rebuilt
+SYNTH_VERSION = 1
+
+def _t(rate, seconds):
+    return np.arange(int(rate * seconds), dtype=np.float32) / rate
+
+def _decay(t, speed):
+    return np.exp(-t * speed)
+
+def _sweep(rate, seconds, f0, f1):
+    """Sine whose pitch glides from f0 to f1 (phase is the running sum of frequency)."""
+    freq = np.linspace(f0, f1, int(rate * seconds), dtype=np.float32)
+    return np.sin(2 * np.pi * np.cumsum(freq) / rate)
+
+def _tone(rate, seconds, freq, harmonics=(1.0,)):
+    t = _t(rate, seconds)
+    return sum(a * np.sin(2 * np.pi * freq * (i + 1) * t) for i, a in enumerate(harmonics))
+
+def _place(out, clip, rate, at):
+    start = int(rate * at)
+    end = min(len(out), start + len(clip))
+    out[start:end] += clip[:end - start]
+
+def roll(rate, rng):
+    # Dice rattling: a run of short, decaying noise clicks at uneven gaps
+    out = np.zeros(int(rate * 0.55), np.float32)
+    at = 0.0
+    while at < 0.45:
+        t = _t(rate, 0.03)
+        click = rng.uniform(-1, 1, len(t)).astype(np.float32) * _decay(t, 160)
+        _place(out, click * rng.uniform(0.4, 0.9), rate, at)
+        at += rng.uniform(0.025, 0.07)
+    return out
+
+def step(rate, rng):
+    t = _t(rate, 0.07)
+    blip = _sweep(rate, 0.07, 700, 420) * _decay(t, 55)
+    return blip + rng.uniform(-0.15, 0.15, len(t)).astype(np.float32) * _decay(t, 300)
+
+def ladder(rate, rng):
+    notes = (523.3, 659.3, 784.0, 1046.5, 1318.5)
+    out = np.zeros(int(rate * 0.5), np.float32)
+    for i, f in enumerate(notes):
+        t = _t(rate, 0.12)
+        _place(out, _tone(rate, 0.12, f, (1.0, 0.0, 0.3)) * _decay(t, 22), rate, i * 0.07)
+    return out
+
+def snake(rate, rng):
+    t = _t(rate, 0.7)
+    wobble = 1 + 0.08 * np.sin(2 * np.pi * 9 * t)
+    hiss = rng.uniform(-1, 1, len(t)).astype(np.float32) * 0.25
+    return (_sweep(rate, 0.7, 900, 140) * wobble + hiss) * _decay(t, 3.5)
+
+def win(rate, rng):
+    out = np.zeros(int(rate * 1.4), np.float32)
+    for i, f in enumerate((523.3, 659.3, 784.0)):
+        t = _t(rate, 0.16)
+        _place(out, _tone(rate, 0.16, f, (1.0, 0.4, 0.2)) * _decay(t, 12), rate, i * 0.13)
+    t = _t(rate, 1.0)
+    chord = sum(_tone(rate, 1.0, f, (1.0, 0.3)) for f in (523.3, 659.3, 784.0, 1046.5)) / 4
+    _place(out, chord * _decay(t, 3), rate, 0.4)
+    return out
+
+def zombie(rate, rng):
+    # Low sawtooth growl with a ragged, noisy amplitude
+    t = _t(rate, 0.9)
+    freq = 75 + 12 * np.sin(2 * np.pi * 3 * t)
+    phase = np.cumsum(freq) / rate
+    saw = 2 * (phase - np.floor(phase + 0.5))
+    rough = 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * 7 * t + rng.uniform(0, 6)))
+    attack = np.minimum(1.0, t / 0.05)
+    return saw * rough * attack * _decay(t, 2.5)
+
+def click(rate, rng):
+    t = _t(rate, 0.025)
+    return _tone(rate, 0.025, 1800) * _decay(t, 250)
+
+RECIPES = {"roll": roll, "step": step, "ladder": ladder, "snake": snake, "win": win, "zombie": zombie, "click": click}
+
+def render(name, rate, channels, seed=0, volume=0.6):
+    """int16 samples shaped (n, channels) for pygame.sndarray.make_sound."""
+    wave_ = RECIPES[name](rate, np.random.default_rng(seed)).astype(np.float32)
+    peak = float(np.max(np.abs(wave_))) or 1.0
+    pcm = (wave_ * (volume * 32767 / peak)).astype(np.int16)
+    if channels == 1:
+        return pcm
+    return np.repeat(pcm[:, None], channels, axis=1)
+
+class SoundSynth:
+    """Effects generated from NumPy waveforms, with the PCM cached as WAV files.
+
+    A cached file is read straight into a Sound buffer, so later launches
+    skip the synthesis. Files are keyed by mixer rate, channel count and
+    SYNTH_VERSION. Only 16-bit signed mixers are supported.
+    """
+
+    def __init__(self, root, recipes=None):
+        self.root = root
+        self.recipes = RECIPES if recipes is None else recipes
+        self.rendered = 0
+        self.loaded = 0
+
+    def __contains__(self, name):
+        return name in self.recipes
+
+    def _path(self, name, rate, channels):
+        return os.path.join(self.root, f"{name}-{rate}-{channels}ch-v{SYNTH_VERSION}.wav")
+
+    def sound(self, name):
+        init = pygame.mixer.get_init()
+        if init is None or name not in self.recipes or init[1] != -16:
+            return None
+        rate, _, channels = init
+        path = self._path(name, rate, channels)
+        frames = self._read(path, rate, channels)
+        if frames is not None:
+            self.loaded += 1
+            return pygame.mixer.Sound(buffer=frames)
+        pcm = render(name, rate, channels)
+        self.rendered += 1
+        self._write(path, pcm, rate, channels)
+        return pygame.sndarray.make_sound(pcm)
+
+    def _read(self, path, rate, channels):
+        try:
+            with wave.open(path, "rb") as w:
+                if (w.getframerate(), w.getnchannels(), w.getsampwidth()) != (rate, channels, 2):
+                    return None
+                return w.readframes(w.getnframes())
+        except (OSError, wave.Error, EOFError):
+            return None
+
+    def _write(self, path, pcm, rate, channels):
+        tmp = path + ".tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with wave.open(tmp, "wb") as w:
+                w.setnchannels(channels)
+                w.setsampwidth(2)
+                w.setframerate(rate)
+                w.writeframes(np.ascontiguousarray(pcm).tobytes())
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
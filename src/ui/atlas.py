@@ -0,0 +1,110 @@
+import time
+import pygame
+from src.services.cache_budget import surface_bytes
+
+class TextureAtlas:
+    """Packs small sprites into a few large pages using shelf packing.
+
+    regions[name] is (page index, rect). Draw a sprite with blit_args()
+    or draw many at once with draw_many(), which is one Surface.blits() call.
+    Pages hold premultiplied alpha, so blit them with BLEND_PREMULTIPLIED.
+
+    With a CacheRegistry each page is charged to it, costed at the time spent
+    packing it. The pages are the only copy, so when the budget drops one the
+    whole atlas is cleared and evicted is set; the owner builds it again.
+    """
+
+    def __init__(self, page_size=1024, padding=1, registry=None):
+        self.page_size = page_size
+        self.padding = padding
+        self.registry = registry
+        self.pages = []
+        self.clear()
+        if registry is not None:
+            registry.register("atlas", self._evict)
+
+    def clear(self):
+        if self.registry:
+            for index in range(len(self.pages)):
+                self.registry.release("atlas", index)
+        self.pages = []
+        self.costs = []
+        self.shelves = []
+        self.regions = {}
+        self.subsurfaces = {}
+        self.evicted = False
+
+    def _evict(self, index):
+        self.clear()
+        self.evicted = True
+
+    def __contains__(self, name):
+        return name in self.regions
+
+    def build(self, sprites, premultiplied=()):
+        """Repack from scratch; tallest first keeps the shelves tight."""
+        self.clear()
+        for name, surf in sorted(sprites.items(), key=lambda kv: -kv[1].get_height()):
+            self.add(name, surf, name in premultiplied)
+
+    def add(self, name, surface, premultiplied=False):
+        start = time.perf_counter()
+        w, h = surface.get_size()
+        old = self.regions.get(name)
+        if old and old[1].size == (w, h):
+            # Same footprint (e.g. a changed avatar): redraw in place
+            index, rect = old
+        else:
+            index, rect = self._allocate(w, h)
+            self.regions[name] = (index, rect)
+        page = self.pages[index]
+        page.fill((0, 0, 0, 0), rect)
+        page.blit(surface if premultiplied else premultiply(surface), rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.subsurfaces.pop(name, None)
+        self.costs[index] += time.perf_counter() - start
+        if self.registry:
+            self.registry.charge("atlas", index, surface_bytes(page), self.costs[index])
+        return rect
+
+    def _allocate(self, w, h):
+        pad, size = self.padding, self.page_size
+        if w > size or h > size:
+            raise ValueError(f"sprite {w}x{h} does not fit a {size}px atlas page")
+        for index, shelves in enumerate(self.shelves):
+            for shelf in shelves:
+                y, height, x = shelf
+                if h <= height and x + w <= size:
+                    shelf[2] = x + w + pad
+                    return index, pygame.Rect(x, y, w, h)
+            top = shelves[-1][0] + shelves[-1][1] + pad
+            if top + h <= size:
+                shelves.append([top, h, w + pad])
+                return index, pygame.Rect(0, top, w, h)
+        self.pages.append(pygame.Surface((size, size), pygame.SRCALPHA))
+        self.costs.append(0.0)
+        self.shelves.append([[0, h, w + pad]])
+        return len(self.pages) - 1, pygame.Rect(0, 0, w, h)
+
+    def surface(self, name):
+        """The sprite as a subsurface view into its page (no copy, premultiplied)."""
+        sub = self.subsurfaces.get(name)
+        if sub is None:
+            index, rect = self.regions[name]
+            sub = self.pages[index].subsurface(rect)
+            self.subsurfaces[name] = sub
+        return sub
+
+    def blit_args(self, name, center):
+        index, rect = self.regions[name]
+        return self.pages[index], (int(center[0]) - rect.width // 2, int(center[1]) - rect.height // 2), rect, pygame.BLEND_PREMULTIPLIED
+
+    def draw_many(self, target, items):
+        """items: (name, center) pairs, drawn in order with a single blits() call."""
+        target.blits([self.blit_args(name, center) for name, center in items], doreturn=False)
+
+def premultiply(surface):
+    if not surface.get_flags() & pygame.SRCALPHA or surface.get_bitsize() != 32:
+        rgba = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        rgba.blit(surface, (0, 0))
+        surface = rgba
+    return surface.premul_alpha()
@@ -0,0 +1,57 @@
+import numpy as np
+import pygame
+from src.config import settings
+
+NOISE_AMPLITUDE = 6
+NUMBER_COLOR = (30, 30, 30)
+
+def glyph_alphas(font, chars="0123456789"):
+    """Coverage of each character as a float (w, h) array, rendered once."""
+    glyphs = {}
+    for ch in chars:
+        g = font.render(ch, True, (255, 255, 255))
+        glyphs[ch] = pygame.surfarray.array_alpha(g).astype(np.float32) / 255.0
+    return glyphs
+
+def _number_mask(glyphs, size, tile, pad=6):
+    """Alpha of all 100 tile numbers, laid out like Board.square_pos."""
+    mask = np.zeros((size, size), np.float32)
+    for n in range(1, 101):
+        row, col = divmod(n - 1, 10)
+        if row % 2 == 1:
+            col = 9 - col
+        x = col * tile + pad
+        y = (9 - row) * tile + pad
+        for ch in str(n):
+            a = glyphs[ch]
+            w = min(a.shape[0], size - x)
+            h = min(a.shape[1], size - y)
+            if w > 0 and h > 0:
+                np.maximum(mask[x:x + w, y:y + h], a[:w, :h], out=mask[x:x + w, y:y + h])
+            x += a.shape[0]
+    return mask
+
+def render_board_texture(size, font, seed=0):
+    """Checkered 10x10 board with grid lines, light noise and numbers.
+
+    Every pixel is computed with NumPy in (x, y) order and written with one
+    blit_array, so it costs about as much as decoding an image of that size.
+    """
+    tile = size // 10
+    cells = np.minimum(np.arange(size) // tile, 9)
+    col = cells[:, None]
+    row = 9 - cells[None, :]
+    even = (col + row) % 2 == 0
+    orange = np.array(settings.COLOR_TILE_ORANGE, np.float32)
+    white = np.array(settings.COLOR_TILE_WHITE, np.float32)
+    pixels = np.where(even[..., None], orange, white)
+    rng = np.random.default_rng(seed)
+    pixels += rng.integers(-NOISE_AMPLITUDE, NOISE_AMPLITUDE + 1, (size, size, 1)).astype(np.float32)
+    a = _number_mask(glyph_alphas(font), size, tile)[..., None]
+    pixels = pixels * (1.0 - a) + np.array(NUMBER_COLOR, np.float32) * a
+    line = (np.arange(size) % tile == 0) | (np.arange(size) == size - 1)
+    pixels[line, :] = settings.COLOR_GRID
+    pixels[:, line] = settings.COLOR_GRID
+    surface = pygame.Surface((size, size))
+    pygame.surfarray.blit_array(surface, np.clip(pixels, 0, 255).astype(np.uint8))
+    return surface
@@ -0,0 +1,60 @@
+import pygame
+from src.ui.widgets import Label, fonts
+
+class DebugHud:
+    """F3 overlay with frame rate and per-cache memory from the CacheRegistry."""
+
+    REFRESH = 0.5
+
+    def __init__(self, game):
+        self.game = game
+        self.visible = False
+        self.timer = self.REFRESH
+        self.font = fonts.get(None, 18)
+        self.labels = []
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.timer = self.REFRESH
+
+    def lines(self):
+        st = self.game.caches.stats()
+        mb = 1024 * 1024
+        out = [f"{self.game.clock.get_fps():5.1f} fps",
+               f"caches {st['bytes'] / mb:.1f} / {st['budget'] / mb:.0f} MB, {st['evictions']} evicted"]
+        for name, c in sorted(st["caches"].items()):
+            looked = c["hits"] + c["misses"]
+            rate = 100 * c["hits"] / looked if looked else 0
+            out.append(f"{name}: {c['bytes'] / mb:.1f} MB, {c['entries']} items, {rate:.0f}% hit")
+        a = self.game.audio.stats()
+        if a["ready"]:
+            busy = " ".join(f"{k} {b}/{n}" for k, (b, n) in a["channels"].items())
+            out.append(f"audio: {a['decoded']} sfx {a['decoded_bytes'] / mb:.1f} MB, {a['played']} played, "
+                       f"{a['coalesced']} merged, {a['throttled']} throttled, {a['stolen']} cut")
+            out.append(f"channels: {busy}")
+        return out
+
+    def update(self, dt):
+        if not self.visible:
+            return
+        self.timer += dt
+        if self.timer < self.REFRESH:
+            return
+        self.timer = 0.0
+        lines = self.lines()
+        while len(self.labels) < len(lines):
+            self.labels.append(Label((8, 8 + 18 * len(self.labels)), self.font, "", (255,255,255)))
+        del self.labels[len(lines):]
+        for label, text in zip(self.labels, lines):
+            label.set_text(text)
+
+    def draw(self, surface):
+        if not self.visible or not self.labels:
+            return
+        w = max(l.rect.right for l in self.labels) + 8
+        h = self.labels[-1].rect.bottom + 6
+        shade = pygame.Surface((w, h), pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 160))
+        surface.blit(shade, (0, 0))
+        for label in self.labels:
+            label.draw(surface)
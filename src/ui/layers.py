@@ -0,0 +1,101 @@
+import os
+import time
+import pygame
+from src.config import settings
+from src.services.cache_budget import surface_bytes
+from src.core.board import Board
+from src.ui.draw import vertical_gradient
+
+class LayerCache:
+    """Static surfaces rendered once per key, plus scaled copies per size.
+
+    With a DiskLayerCache, layers that pass inputs (a callable returning
+    everything their pixels depend on) are also kept on disk, so the next
+    launch skips drawing them.
+    """
+
+    def __init__(self, disk=None, registry=None):
+        self.layers = {}
+        self.scaled_layers = {}
+        self.disk = disk
+        self.registry = registry
+        if registry is not None:
+            registry.register("layers", lambda key: self.layers.pop(key, None))
+            registry.register("scaled_layers", lambda k: self.scaled_layers.pop(k, None))
+
+    def get(self, key, build, inputs=None):
+        layer = self.layers.get(key)
+        if layer is not None and self.registry:
+            self.registry.hit("layers", key)
+        if layer is None:
+            start = time.perf_counter()
+            if self.disk is not None and inputs is not None:
+                digest = self.disk.digest(key, inputs())
+                layer = self.disk.load(digest)
+                if layer is None:
+                    layer = build()
+                    self.disk.store(digest, layer)
+            else:
+                layer = build()
+            self.layers[key] = layer
+            if self.registry and not self.registry.charge("layers", key, surface_bytes(layer), time.perf_counter() - start):
+                del self.layers[key]
+        return layer
+
+    def scaled(self, key, size, build, inputs=None):
+        k = (key, tuple(size))
+        layer = self.scaled_layers.get(k)
+        if layer is not None and self.registry:
+            self.registry.hit("scaled_layers", k)
+        if layer is None:
+            start = time.perf_counter()
+            layer = pygame.transform.smoothscale(self.get(key, build, inputs), size)
+            self.scaled_layers[k] = layer
+            if self.registry and not self.registry.charge("scaled_layers", k, surface_bytes(layer), time.perf_counter() - start):
+                del self.scaled_layers[k]
+        return layer
+
+    def clear(self):
+        if self.registry:
+            for key in self.layers:
+                self.registry.release("layers", key)
+            for k in self.scaled_layers:
+                self.registry.release("scaled_layers", k)
+        self.layers.clear()
+        self.scaled_layers.clear()
+
+def board_layer_margin(tile):
+    # Snake heads and ladder shadows spill a little past the board edge
+    return tile // 2
+
+def board_layer_inputs(assets, size, font):
+    """Everything render_board_layer's pixels depend on, for the disk cache key."""
+    bg = None
+    if assets is not None and assets.has_image("board_bg"):
+        path = assets.manifest["images"].get("board_bg")
+        bg = (path, os.path.getmtime(path) if path and os.path.exists(path) else None)
+    return (size, font.get_height(), font.size("100"), bg,
+            sorted(settings.SNAKES.items()), sorted(settings.LADDERS.items()), repr(settings.SPECIAL_TILES),
+            settings.POWER_UP_TEXTS, settings.POWER_DOWN_TEXTS,
+            settings.COLOR_TILE_ORANGE, settings.COLOR_TILE_WHITE, settings.COLOR_GRID,
+            settings.COLOR_SNAKE, settings.COLOR_SNAKE_DARK, settings.COLOR_LADDER_RAIL, settings.COLOR_LADDER_RUNG)
+
+def render_gradient(size, top_color, bottom_color):
+    layer = pygame.Surface(size)
+    vertical_gradient(layer, (0, 0, size[0], size[1]), top_color, bottom_color)
+    return layer
+
+def render_board_layer(assets, snakes, ladders, font, size=settings.BOARD_SIZE):
+    """Board, ladders and snakes drawn once into a transparent surface.
+
+    The board sits at (margin, margin) inside the layer.
+    """
+    margin = board_layer_margin(size // 10)
+    board = Board(assets, origin=(margin, margin), size=size)
+    layer = pygame.Surface((board.size + 2 * margin, board.size + 2 * margin), pygame.SRCALPHA)
+    board.render(layer, font)
+    for l in ladders:
+        l.draw(layer, board)
+    for s in snakes:
+        s.draw(layer, board)
+    return layer
@@ -0,0 +1,143 @@
+import pygame
+from src.services.cache_budget import surface_bytes
+from src.ui.widgets import Widget
+
+class VirtualList(Widget):
+    """Scrollable list that only fetches and paints the rows in view.
+
+    fetch(offset, limit) returns the items for a window, count() the total.
+    Both are asked again only after reset() or refetch(); call refetch()
+    when the data behind them changes. Row surfaces that scroll out of view
+    are recycled for the rows coming in.
+    With a CacheRegistry each row surface is charged to it under name; one
+    the budget drops is simply painted again on a new surface.
+    """
+
+    def __init__(self, rect, row_height, fetch, count, paint_row, registry=None, name="list_rows"):
+        super().__init__(rect)
+        self.row_height = row_height
+        self.fetch = fetch
+        self.count = count
+        self.paint_row = paint_row
+        self.scroll = 0
+        self.selected = None
+        self.enabled = True
+        self.rows = {}
+        self.free = []
+        self.window = None
+        self.items = []
+        self.total = None
+        # Bumped by refetch(); a painted row is reused only within its generation
+        self.generation = 0
+        self.registry = registry
+        self.name = name
+        if registry is not None:
+            registry.register(name, self._drop)
+
+    def reset(self):
+        self.scroll = 0
+        self.selected = None
+        self.refetch()
+
+    def refetch(self):
+        for surf, _ in self.rows.values():
+            self.free.append(surf)
+        self.rows = {}
+        self.window = None
+        self.total = None
+        self.generation += 1
+
+    def _count(self):
+        if self.total is None:
+            self.total = self.count()
+        return self.total
+
+    def _drop(self, key):
+        # Keys are surface ids: the surface is in a row or in the free pool
+        self.free = [surf for surf in self.free if id(surf) != key]
+        for i in [i for i, (surf, _) in self.rows.items() if id(surf) == key]:
+            del self.rows[i]
+
+    def _new_row(self):
+        surf = pygame.Surface((self.rect.width, self.row_height), pygame.SRCALPHA)
+        if self.registry:
+            self.registry.charge(self.name, id(surf), surface_bytes(surf))
+        return surf
+
+    def close(self):
+        if self.registry:
+            self.registry.unregister(self.name)
+
+    def visible_rows(self):
+        return self.rect.height // self.row_height + 2
+
+    def _clamp(self):
+        max_scroll = max(0, self._count() * self.row_height - self.rect.height)
+        self.scroll = max(0, min(self.scroll, max_scroll))
+
+    def scroll_to(self, index):
+        top = index * self.row_height
+        if top < self.scroll:
+            self.scroll = top
+        elif top + self.row_height > self.scroll + self.rect.height:
+            self.scroll = top + self.row_height - self.rect.height
+        self._clamp()
+
+    def item(self, index):
+        if self.window and self.window[0] <= index < self.window[0] + len(self.items):
+            return self.items[index - self.window[0]]
+        found = self.fetch(index, 1)
+        return found[0] if found else None
+
+    def _sync(self):
+        self._clamp()
+        first = self.scroll // self.row_height
+        last = min(self.total, first + self.visible_rows())
+        if self.window != (first, last):
+            self.items = self.fetch(first, last - first)
+            self.window = (first, last)
+            for i in [i for i in self.rows if not first <= i < last]:
+                self.free.append(self.rows.pop(i)[0])
+        return first, last
+
+    def draw(self, surface):
+        if not self.visible:
+            return
+        first, last = self._sync()
+        clip = surface.get_clip()
+        surface.set_clip(self.rect)
+        for i in range(first, last):
+            item = self.items[i - first]
+            key = (self.generation, i == self.selected)
+            row = self.rows.get(i)
+            if row is None or row[1] != key:
+                surf = row[0] if row else (self.free.pop() if self.free else self._new_row())
+                surf.fill((0, 0, 0, 0))
+                self.paint_row(surf, i, item, i == self.selected)
+                self.rows[i] = (surf, key)
+            elif self.registry:
+                self.registry.hit(self.name, id(row[0]))
+            surface.blit(self.rows[i][0], (self.rect.x, self.rect.y + i * self.row_height - self.scroll))
+        surface.set_clip(clip)
+
+    def handle(self, event):
+        if event.type == pygame.MOUSEWHEEL:
+            if self.rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll -= event.y * self.row_height * 3
+                self._clamp()
+                return True
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            index = (event.pos[1] - self.rect.y + self.scroll) // self.row_height
+            if index < self._count():
+                self.selected = index
+                return True
+        elif event.type == pygame.KEYDOWN and self._count():
+            step = {pygame.K_UP: -1, pygame.K_DOWN: 1,
+                    pygame.K_PAGEUP: -(self.rect.height // self.row_height),
+                    pygame.K_PAGEDOWN: self.rect.height // self.row_height}.get(event.key)
+            if step:
+                current = self.selected if self.selected is not None else -1 if step > 0 else self.total
+                self.selected = max(0, min(self.total - 1, current + step))
+                self.scroll_to(self.selected)
+                return True
+        return False
@@ -0,0 +1,30 @@
+import pygame
+
+class Viewport:
+    """Maps the design-space layout (settings.WINDOW_*) onto the current window.
+
+    Scenes keep their coordinates in design pixels and pass them through
+    rect()/point()/size() when they lay out, so a resize only re-runs layout.
+    """
+
+    def __init__(self, logical_size, window_size):
+        self.logical = logical_size
+        self.resize(window_size)
+
+    def resize(self, window_size):
+        self.window = tuple(window_size)
+        lw, lh = self.logical
+        ww, wh = self.window
+        self.scale = min(ww / lw, wh / lh)
+        self.offset = ((ww - lw * self.scale) / 2, (wh - lh * self.scale) / 2)
+
+    def size(self, n):
+        return max(1, int(round(n * self.scale)))
+
+    def point(self, p):
+        return int(round(self.offset[0] + p[0] * self.scale)), int(round(self.offset[1] + p[1] * self.scale))
+
+    def rect(self, r):
+        r = pygame.Rect(r)
+        x, y = self.point(r.topleft)
+        return pygame.Rect(x, y, self.size(r.width), self.size(r.height))
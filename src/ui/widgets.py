@@ -0,0 +1,189 @@
+import time
+import pygame
+from src.services.assets import AssetLoader
+from src.services.cache_budget import surface_bytes
+
+class FontPool:
+    """fonts.get(path, size) for code without an AssetLoader at hand.
+
+    An alias of AssetLoader.font: the game attaches its loader so both share
+    one cache; until then a default loader is made on first use.
+    """
+
+    def __init__(self):
+        self.loader = None
+
+    def attach(self, loader):
+        self.loader = loader
+
+    def get(self, path, size):
+        if self.loader is None:
+            self.loader = AssetLoader({"images": {}, "sounds": {}})
+        return self.loader.font(path, size)
+
+# One pool shared by main.py and the scene code
+fonts = FontPool()
+
+class TextCache:
+    """Rendered label text shared by every widget, keyed by font, text and colour.
+
+    Once attached to a CacheRegistry its surfaces count against the global
+    budget and are evicted with everything else; until then it is cleared
+    whenever it passes limit entries.
+    """
+
+    def __init__(self, limit=256):
+        self.limit = limit
+        self.surfaces = {}
+        self.registry = None
+
+    def attach(self, registry):
+        self.registry = registry
+        registry.register("text", lambda k: self.surfaces.pop(k, None))
+        for k, img in list(self.surfaces.items()):
+            if not registry.charge("text", k, surface_bytes(img)):
+                del self.surfaces[k]
+
+    def render(self, font, text, color):
+        # The font itself, not its id: a key holds it alive, so an id is never reused under us
+        k = (font, text, color)
+        img = self.surfaces.get(k)
+        if img is not None:
+            if self.registry:
+                self.registry.hit("text", k)
+            return img
+        if self.registry is None and len(self.surfaces) >= self.limit:
+            self.surfaces.clear()
+        start = time.perf_counter()
+        img = self.surfaces[k] = font.render(text, True, color)
+        if self.registry and not self.registry.charge("text", k, surface_bytes(img), time.perf_counter() - start):
+            del self.surfaces[k]
+        return img
+
+texts = TextCache()
+
+class Widget:
+    """Retained-mode base: the widget is painted into its own surface and only
+    repainted when state() changes, so idle frames are a single blit."""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.visible = True
+        self.dirty = True
+        self.image = None
+        self._state = None
+
+    def state(self):
+        return ()
+
+    def invalidate(self):
+        self.dirty = True
+
+    def label(self, font, text, color):
+        # Label surfaces are shared through texts until the text, colour or font changes
+        return texts.render(font, text, color)
+
+    def paint(self, surface):
+        pass
+
+    def refresh(self):
+        st = self.state()
+        if st != self._state:
+            self._state = st
+            self.dirty = True
+        if self.dirty or self.image is None or self.image.get_size() != self.rect.size:
+            self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            self.paint(self.image)
+            self.dirty = False
+        return self.image
+
+    def draw(self, surface):
+        if not self.visible:
+            return
+        surface.blit(self.refresh(), self.rect)
+
+    def handle(self, event):
+        return False
+
+class HitGrid:
+    def __init__(self, cell=64):
+        self.cell = cell
+        self.cells = {}
+
+    def _keys(self, rect):
+        c = self.cell
+        for gx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for gy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                yield gx, gy
+
+    def insert(self, widget):
+        for k in self._keys(widget.rect):
+            self.cells.setdefault(k, []).append(widget)
+
+    def remove(self, widget):
+        for k in self._keys(widget.rect):
+            bucket = self.cells.get(k)
+            if bucket and widget in bucket:
+                bucket.remove(widget)
+
+    def query(self, pos):
+        return self.cells.get((pos[0] // self.cell, pos[1] // self.cell), [])
+
+class WidgetLayer:
+    """Per-scene widget list with spatial-grid hit testing."""
+
+    def __init__(self, cell=64):
+        self.widgets = []
+        self.grid = HitGrid(cell)
+
+    def add(self, *widgets):
+        for w in widgets:
+            self.widgets.append(w)
+            self.grid.insert(w)
+        return widgets[0] if len(widgets) == 1 else widgets
+
+    def move(self, widget, rect):
+        self.grid.remove(widget)
+        widget.rect = pygame.Rect(rect)
+        widget.invalidate()
+        self.grid.insert(widget)
+
+    def hit(self, pos):
+        # Later widgets draw on top, so they win the hit test
+        for w in reversed(self.grid.query(pos)):
+            if w.visible and getattr(w, "enabled", True) and w.rect.collidepoint(pos):
+                return w
+        return None
+
+    def handle(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            w = self.hit(event.pos)
+            if w is not None and w.handle(event):
+                return w
+        return None
+
+    def draw(self, surface):
+        for w in self.widgets:
+            w.draw(surface)
+
+class Label(Widget):
+    """Text that is rasterized once per distinct string."""
+
+    def __init__(self, pos, font, text, color, anchor="topleft"):
+        super().__init__((pos, (0, 0)))
+        self.pos = pos
+        self.font = font
+        self.color = color
+        self.anchor = anchor
+        self.text = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        if text == self.text:
+            return
+        self.text = text
+        self.image = self.font.render(text, True, self.color)
+        self.rect = self.image.get_rect(**{self.anchor: self.pos})
+
+    def refresh(self):
+        return self.image
@@ -0,0 +1,21 @@
+from src.services.assets import AssetLoader
+
+def make_loader(budget=None):
+    return AssetLoader({"images": {}, "sounds": {}}, scaled_budget=budget)
+
+def test_repeated_scaled_lookup_is_a_hit():
+    a = make_loader()
+    first = a.image("token", (32, 32))
+    assert a.image("token", (32, 32)) is first
+    assert a.image("token", (32, 32), smooth=False) is not first
+    assert (a.hits, a.misses) == (1, 2)
+
+def test_lru_evicts_oldest_over_budget():
+    a = make_loader(budget=2 * 32 * 32 * 4)
+    a.image("a", (32, 32))
+    a.image("b", (32, 32))
+    a.image("a", (32, 32))
+    a.image("c", (32, 32))
+    keys = [k[0] for k in a.scaled]
+    assert keys == ["a", "c"]
+    assert a.cache_stats()["bytes"] <= a.scaled_budget
@@ -0,0 +1,27 @@
+import os
+from src.services.asset_index import AssetIndex
+
+def test_index_answers_misses_from_memory(tmp_path, monkeypatch):
+    images = tmp_path / "images"
+    images.mkdir()
+    (images / "Dice_Custom.png").write_bytes(b"")
+    idx = AssetIndex(str(tmp_path))
+    assert idx.find("images", ["dice"]) == os.path.join(str(images), "Dice_Custom.png")
+    assert idx.exists(os.path.join(str(images), "Dice_Custom.png"))
+
+    calls = []
+    monkeypatch.setattr(os, "listdir", lambda *a: calls.append(a) or [])
+    monkeypatch.setattr(os, "walk", lambda *a: calls.append(a) or iter(()))
+    for _ in range(3):
+        assert idx.find("images", ["zombie"]) is None
+        assert not idx.exists(os.path.join(str(images), "missing.png"))
+    assert calls == []
+
+def test_refresh_picks_up_new_files(tmp_path):
+    (tmp_path / "sounds").mkdir()
+    idx = AssetIndex(str(tmp_path))
+    assert idx.find("sounds", ["roll"]) is None
+    (tmp_path / "sounds" / "roll.wav").write_bytes(b"")
+    assert idx.find("sounds", ["roll"]) is None
+    idx.refresh()
+    assert idx.find("sounds", ["roll"]).endswith("roll.wav")
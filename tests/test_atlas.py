@@ -0,0 +1,29 @@
+import pygame
+from src.ui.atlas import TextureAtlas
+
+def solid(w, h, color):
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    s.fill(color)
+    return s
+
+def test_packs_without_overlap_and_draws_from_regions():
+    atlas = TextureAtlas(page_size=128)
+    sprites = {f"s{i}": solid(30 + i, 20 + i % 3 * 10, (i * 20, 0, 0, 255)) for i in range(10)}
+    atlas.build(sprites)
+    assert len(atlas.pages) == 1
+    rects = [atlas.regions[n] for n in sprites]
+    for i, (pa, a) in enumerate(rects):
+        for pb, b in rects[i + 1:]:
+            assert pa != pb or not a.colliderect(b)
+    target = pygame.Surface((64, 64), pygame.SRCALPHA)
+    atlas.draw_many(target, [("s3", (32, 32))])
+    assert target.get_at((32, 32)) == (60, 0, 0, 255)
+    assert atlas.surface("s3").get_size() == sprites["s3"].get_size()
+
+def test_same_size_replacement_reuses_slot():
+    atlas = TextureAtlas(page_size=64)
+    atlas.add("avatar", solid(16, 16, (255, 0, 0, 255)))
+    rect = atlas.regions["avatar"][1]
+    atlas.add("avatar", solid(16, 16, (0, 255, 0, 255)))
+    assert atlas.regions["avatar"][1] == rect
+    assert atlas.surface("avatar").get_at((0, 0)) == (0, 255, 0, 255)
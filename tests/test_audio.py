@@ -0,0 +1,59 @@
+import pygame
+import pytest
+from src.services.audio import AudioManager
+
+class FakeAssets:
+    def __init__(self):
+        self.sounds = {}
+        self.decoded = []
+
+    def sound(self, key):
+        if key not in self.sounds:
+            self.decoded.append(key)
+            self.sounds[key] = pygame.mixer.Sound(buffer=bytes(44100 * 4)) if key != "missing" else None
+        return self.sounds[key]
+
+def manager(now):
+    audio = AudioManager(FakeAssets(), channels={"move": 1, "event": 2}, min_interval={"move": 0.1}, clock=lambda: now[0])
+    if not audio.ready:
+        pytest.skip("no audio device")
+    return audio
+
+def test_coalesces_within_a_frame_and_throttles_across_frames():
+    now = [0.0]
+    audio = manager(now)
+    for _ in range(5):
+        audio.play("step", "move")
+    audio.update()
+    assert audio.counts["played"] == 1 and audio.counts["coalesced"] == 4
+    now[0] = 0.05
+    audio.play("step", "move")
+    audio.update()
+    assert audio.counts["throttled"] == 1
+    now[0] = 0.2
+    audio.play("step", "move")
+    audio.update()
+    assert audio.counts["played"] == 2
+    # Decoded once, on first use
+    assert audio.assets.decoded == ["step"]
+
+def test_busy_category_steals_its_oldest_channel_and_stats():
+    now = [0.0]
+    audio = manager(now)
+    for i, key in enumerate(["a", "b", "c"]):
+        now[0] = i
+        audio.play(key)
+        audio.update()
+    audio.play("missing")
+    audio.update()
+    st = audio.stats()
+    assert st["stolen"] == 1 and st["missing"] == 1
+    assert st["channels"]["event"][1] == 2
+    assert st["decoded"] == 3 and st["decoded_bytes"] > 0
+
+def test_disabled_drops_requests():
+    audio = manager([0.0])
+    audio.set_enabled(False)
+    audio.play("step")
+    audio.update()
+    assert audio.counts["requested"] == 0
@@ -0,0 +1,27 @@
+import pygame
+from src.services.avatars import Avatar, AvatarPipeline, prepare
+
+def test_prepare_downsamples_and_masks_once():
+    big = pygame.Surface((1600, 1200))
+    big.fill((200, 30, 30))
+    variants = prepare(big, (25, 40, 50, 80))
+    assert sorted(variants) == [25, 40, 50, 80]
+    assert variants[80].get_size() == (80, 80)
+    assert variants[80].get_at((0, 0))[3] == 0
+    # smoothscale rounds down a little on non-integer ratios
+    assert all(abs(a - b) <= 3 for a, b in zip(variants[80].get_at((40, 40)), (200, 30, 30, 255)))
+
+def test_pipeline_result_is_served_without_scaling(tmp_path, monkeypatch):
+    path = str(tmp_path / "me.png")
+    img = pygame.Surface((300, 300))
+    img.fill((0, 120, 240))
+    pygame.image.save(img, path)
+    pipeline = AvatarPipeline((25, 50))
+    avatar = pipeline.wait(pipeline.load(path))
+    pipeline.shutdown()
+    def no_scaling(*a):
+        raise AssertionError("scaled while drawing")
+    monkeypatch.setattr(pygame.transform, "smoothscale", no_scaling)
+    monkeypatch.setattr(pygame.transform, "scale", no_scaling)
+    assert avatar.get(25).get_size() == (25, 25)
+    assert avatar.get(50) is avatar.source
@@ -0,0 +1,37 @@
+import os
+import pygame
+from src.services.asset_index import AssetIndex
+from src.services.assets import AssetLoader
+from src.services.bake import bake, collect_sizes
+from src.ui.viewport import Viewport
+
+class FakeScene:
+    @classmethod
+    def image_sizes(cls, view):
+        return {"token": [(view.size(35), view.size(35))]}
+
+def test_baked_variants_load_without_runtime_scaling(tmp_path, monkeypatch):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    src = pygame.Surface((70, 70), pygame.SRCALPHA)
+    src.fill((200, 100, 50, 128))
+    pygame.image.save(src, str(tmp_path / "token.png"))
+    manifest = {"images": {"token": str(tmp_path / "token.png")}, "sounds": {}}
+    index = AssetIndex(str(tmp_path / "none"))
+    index.paths.add(os.path.normpath(str(tmp_path / "token.png")))
+
+    views = [Viewport((960, 980), (960, 980)), Viewport((960, 980), (1920, 1960))]
+    sizes = collect_sizes([FakeScene], views)
+    assert sizes == {"token": {(35, 35), (70, 70)}}
+    baked = bake(str(tmp_path / "baked"), AssetLoader(manifest, index=index, baked_dir=""), sizes)
+    assert baked["images"]["token"] == {"35x35": "token_35x35.png", "70x70": "token_70x70.png"}
+
+    def no_scaling(*a):
+        raise AssertionError("scaled at runtime")
+    monkeypatch.setattr(pygame.transform, "smoothscale", no_scaling)
+    assets = AssetLoader(manifest, index=index, baked_dir=str(tmp_path / "baked"))
+    img = assets.image("token", (35, 35))
+    assert img.get_size() == (35, 35)
+    assert img.get_at((5, 5))[3] == 128 and img.get_at((5, 5))[0] < 200
+    assert assets.blend_flags("token", (35, 35)) == pygame.BLEND_PREMULTIPLIED
@@ -0,0 +1,43 @@
+import pygame
+from src.config import settings
+from src.services.assets import AssetLoader, placeholder
+from src.services.asset_index import AssetIndex
+from src.ui.board_texture import render_board_texture
+
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 16)
+
+def near(a, b, tol=8):
+    return all(abs(x - y) <= tol for x, y in zip(a[:3], b[:3]))
+
+def test_checker_grid_and_numbers():
+    s = render_board_texture(400, font())
+    assert s.get_size() == (400, 400)
+    # Square 1 is bottom-left and orange, square 2 is white
+    assert near(s.get_at((30, 390)), settings.COLOR_TILE_ORANGE)
+    assert near(s.get_at((70, 390)), settings.COLOR_TILE_WHITE)
+    assert tuple(s.get_at((0, 200)))[:3] == settings.COLOR_GRID
+    assert tuple(s.get_at((40, 200)))[:3] == settings.COLOR_GRID
+    # Number glyphs sit in each tile's top-left corner
+    corner = [s.get_at((x, y)) for x in range(4, 20) for y in range(364, 376)]
+    assert any(sum(c[:3]) < 300 for c in corner)
+
+def test_same_seed_same_pixels():
+    f = font()
+    a = render_board_texture(200, f, seed=3)
+    b = render_board_texture(200, f, seed=3)
+    assert pygame.image.tobytes(a, "RGB") == pygame.image.tobytes(b, "RGB")
+
+def test_generated_images_are_cached_and_missing_keys_do_not_borrow_the_board(tmp_path):
+    manifest = {"images": {"dice_3": "nowhere/dice_3.png"}, "sounds": {}}
+    loader = AssetLoader(manifest, index=AssetIndex(str(tmp_path)), baked_dir=str(tmp_path))
+    calls = []
+    build = lambda: calls.append(1) or pygame.Surface((50, 50))
+    assert loader.generated("board_bg", (50, 50), build) is loader.generated("board_bg", (50, 50), build)
+    assert len(calls) == 1
+    assert loader.image_path("dice_3") is None
+    # A missing die face still shows its pips rather than a grey disc
+    die = loader.image("dice_3")
+    assert die.get_at((32, 32))[:3] == (20, 20, 20)
+    assert placeholder("token").get_at((32, 32))[:3] == (200, 200, 200)
@@ -0,0 +1,27 @@
+import os
+import pygame
+from src.services.asset_index import AssetIndex
+from src.services.assets import AssetLoader
+from src.services.bundle import AssetBundle, build_bundle
+
+def test_bundle_roundtrip_and_loader_prefers_it(tmp_path):
+    src = tmp_path / "dice_1.png"
+    img = pygame.Surface((6, 5))
+    img.fill((200, 10, 10))
+    pygame.image.save(img, str(src))
+    font = tmp_path / "Fake.ttf"
+    font.write_bytes(b"not really a font")
+    manifest = {"images": {"dice_1": str(src), "gone": str(tmp_path / "gone.png")}, "sounds": {}}
+    out = str(tmp_path / "assets.bundle")
+    assert build_bundle(out, manifest, [str(font)]) == 2
+
+    bundle = AssetBundle(out)
+    assert "images/dice_1" in bundle and "images/gone" not in bundle
+    assert bytes(bundle.view("fonts/" + str(font))) == b"not really a font"
+    assert bundle.load_image("images/dice_1").get_at((0, 0))[:3] == (200, 10, 10)
+
+    os.remove(src)
+    assets = AssetLoader(manifest, index=AssetIndex(str(tmp_path / "empty")), bundle=bundle)
+    assert assets.has_image("dice_1")
+    assert assets.decode_image("dice_1").get_size() == (6, 5)
+    bundle.close()
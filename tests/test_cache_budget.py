@@ -0,0 +1,71 @@
+import pygame
+import pytest
+from src.services.cache_budget import CacheRegistry, sound_bytes, surface_bytes
+from src.services.assets import AssetLoader
+from src.ui.atlas import TextureAtlas
+from src.ui.layers import LayerCache
+from src.ui.widgets import TextCache
+
+def test_greedy_dual_size_prefers_dropping_cheap_bytes():
+    reg = CacheRegistry(budget=300)
+    dropped = []
+    reg.register("a", lambda k: dropped.append(("a", k)))
+    reg.register("b", lambda k: dropped.append(("b", k)))
+    reg.charge("a", "big_cheap", 200, cost=1.0)
+    reg.charge("b", "small_costly", 50, cost=10.0)
+    reg.charge("b", "medium", 100, cost=5.0)
+    assert dropped == [("a", "big_cheap")]
+    assert reg.total == 150
+    st = reg.stats()
+    assert st["caches"]["b"]["entries"] == 2 and st["caches"]["a"]["evictions"] == 1
+
+def test_registry_bounds_assets_and_layers_together():
+    reg = CacheRegistry(budget=3 * 64 * 64 * 4)
+    assets = AssetLoader({"images": {}, "sounds": {}}, registry=reg)
+    layers = LayerCache(registry=reg)
+    layers.get("bg", lambda: pygame.Surface((64, 64), pygame.SRCALPHA))
+    for i in range(4):
+        assets.image(f"icon{i}", (64, 64))
+    assert reg.total <= reg.budget
+    assert len(assets.images) + len(assets.scaled) + len(layers.layers) == len(reg.entries)
+    assert reg.stats()["evictions"] > 0
+
+def test_oversized_entry_is_refused_not_cached():
+    reg = CacheRegistry(budget=64 * 64 * 4)
+    assets = AssetLoader({"images": {}, "sounds": {}}, registry=reg)
+    small = assets.image("icon", (32, 32))
+    big = assets.image("banner", (128, 128))
+    assert big.get_size() == (128, 128)
+    assert list(assets.scaled) == [("icon", (32, 32), "smooth")] and assets.scaled_bytes == 32 * 32 * 4
+    assert ("scaled_images", ("icon", (32, 32), "smooth")) in reg.entries and assets.image("icon", (32, 32)) is small
+
+def test_text_and_atlas_caches_are_budgeted():
+    pygame.font.init()
+    reg = CacheRegistry(budget=64 * 64 * 4 + 4096)
+    cache = TextCache()
+    cache.attach(reg)
+    font = pygame.font.Font(None, 20)
+    first = cache.render(font, "hello", (0, 0, 0))
+    assert cache.render(font, "hello", (0, 0, 0)) is first
+    assert reg.stats()["caches"]["text"]["bytes"] == surface_bytes(first)
+    atlas = TextureAtlas(page_size=64, registry=reg)
+    sprite = pygame.Surface((16, 16), pygame.SRCALPHA)
+    atlas.add("a", sprite)
+    atlas.add("b", sprite)
+    assert reg.stats()["caches"]["atlas"] == dict(reg.stats()["caches"]["atlas"], bytes=64 * 64 * 4, entries=1)
+    for i in range(40):
+        cache.render(font, f"line {i}", (0, 0, 0))
+    assert reg.total <= reg.budget
+    assert len(cache.surfaces) + len(atlas.pages) == len(reg.entries)
+    if atlas.evicted:
+        assert not atlas.regions
+
+def test_sounds_are_charged_without_copying_them():
+    from src.services.audio import init_mixer
+    if not init_mixer():
+        pytest.skip("no audio device")
+    reg = CacheRegistry(budget=10 ** 7)
+    assets = AssetLoader({"images": {}, "sounds": {}}, registry=reg)
+    sound = pygame.mixer.Sound(buffer=bytes(44100 * 4))
+    assets.adopt_sound("tone", sound)
+    assert reg.stats()["caches"]["sounds"]["bytes"] == sound_bytes(sound) == 44100 * 4
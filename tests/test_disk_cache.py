@@ -0,0 +1,31 @@
+import os
+import pygame
+from src.services.disk_cache import DiskLayerCache
+from src.ui.layers import LayerCache
+
+def test_layers_survive_a_restart(tmp_path):
+    builds = []
+    def build():
+        builds.append(1)
+        s = pygame.Surface((8, 6), pygame.SRCALPHA)
+        s.fill((10, 20, 30, 40))
+        return s
+    for _ in range(2):
+        cache = LayerCache(DiskLayerCache(str(tmp_path), 1 << 20))
+        layer = cache.get(("bg", 8), build, lambda: ("blue",))
+    assert len(builds) == 1
+    assert layer.get_size() == (8, 6) and layer.get_at((3, 3)) == (10, 20, 30, 40)
+
+def test_version_stamp_and_size_eviction(tmp_path):
+    disk = DiskLayerCache(str(tmp_path), 3 * (16 + 10 * 10 * 4))
+    surf = pygame.Surface((10, 10), pygame.SRCALPHA)
+    for i in range(5):
+        d = disk.digest("layer", i)
+        disk.store(d, surf)
+        os.utime(os.path.join(str(tmp_path), d + ".rgba"), (i, i))
+    disk.evict()
+    assert len(os.listdir(str(tmp_path))) == 3
+    assert disk.load(disk.digest("layer", 0)) is None
+    assert disk.load(disk.digest("layer", 4)) is not None
+    newer = DiskLayerCache(str(tmp_path), 1 << 20, version=disk.version + 1)
+    assert newer.digest("layer", 4) != disk.digest("layer", 4)
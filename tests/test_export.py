@@ -0,0 +1,61 @@
+import json
+import os
+import numpy as np
+import pygame
+from src.core.replay import Recorder
+from src.services.export import TRANSPARENT, delta, export, frame_plan, lzw_encode, median_cut, write_gif
+
+def recording(turns=12):
+    rec = Recorder(["A", "B"], "endless", 4)
+    for _ in range(turns):
+        rec.record(rec.match.roll())
+    return rec.recording
+
+def test_lzw_output_decodes(tmp_path):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    rng = np.random.default_rng(0)
+    palette = rng.integers(0, 256, (255, 3)).astype(np.uint8)
+    # Noise fills the code table several times over; the runs exercise long codes
+    img = np.where(rng.random((120, 200)) < 0.5, rng.integers(0, 255, (120, 200)), 7).astype(np.uint8)
+    path = str(tmp_path / "one.gif")
+    write_gif(path, (200, 120), palette, [(0, 0, 200, 120, lzw_encode(img.tobytes()), 10)])
+    back = pygame.surfarray.array3d(pygame.image.load(path)).swapaxes(0, 1)
+    assert np.array_equal(back, palette[img])
+
+def test_delta_covers_only_changes():
+    a = np.zeros((50, 60), np.uint8)
+    b = a.copy()
+    b[10, 20] = b[12, 25] = 3
+    x, y, w, h, box = delta(b, a)
+    assert (x, y, w, h) == (20, 10, 6, 3)
+    assert box[0, 0] == 3 and box[2, 5] == 3 and (box == TRANSPARENT).sum() == 16
+    assert delta(a, a) is None
+
+def test_plan_walks_each_square():
+    rec = recording()
+    plan = frame_plan(rec, 0, 1, hold=2)
+    assert len(plan) == rec.rolls[0] + 2
+    assert [f[0][0] for f in plan[:rec.rolls[0]]] == list(range(2, rec.rolls[0] + 2))
+
+def test_median_cut_keeps_distinct_colors():
+    px = np.array([[255, 0, 0]] * 50 + [[0, 0, 255]] * 30 + [[0, 255, 0]] * 20, np.uint8)
+    assert {tuple(c) for c in median_cut(px, 8)} == {(255, 0, 0), (0, 0, 255), (0, 255, 0)}
+
+def test_export_gif_and_png_frames(tmp_path):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    rec = recording()
+    stats = export(rec, str(tmp_path / "clip.gif"), 0, 6, size=200, workers=1)
+    assert 0 < stats["written"] < stats["frames"]
+    assert pygame.image.load(str(tmp_path / "clip.gif")).get_width() == 220
+    stats = export(rec, str(tmp_path / "frames"), 0, 2, size=200, fps=10, workers=1)
+    index = json.loads((tmp_path / "frames" / "frames.json").read_text())
+    assert len(index["frames"]) == stats["written"]
+    assert sum(f["ms"] for f in index["frames"]) == stats["frames"] * 100
+
+def test_worker_processes_write_the_same_gif(tmp_path):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    rec = recording(30)
+    one = export(rec, str(tmp_path / "one.gif"), size=160, workers=1)
+    two = export(rec, str(tmp_path / "two.gif"), size=160, workers=2)
+    assert one["frames"] > 40 and two["workers"] == 2
+    assert (tmp_path / "one.gif").read_bytes() == (tmp_path / "two.gif").read_bytes()
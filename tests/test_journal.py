@@ -0,0 +1,79 @@
+import os
+import threading
+from src.core.player import Player
+from src.services.journal import Journal, apply_turn, turn_record
+from src.services.savegame import BlobStore
+
+def start(mode="classic"):
+    return {"app": "board", "mode": mode, "turn": 0, "endless_scores": [0, 0],
+            "players": [{"name": "a", "square": 1, "avatar": None}, {"name": "b", "square": 1, "avatar": None}]}
+
+def play(journal, state, turns):
+    p = Player("x", (0, 0, 0), None)
+    for i in range(turns):
+        index = state["turn"]
+        p.square = state["players"][index]["square"] + 3
+        rec = turn_record(index, 3, p, None, (index + 1) % 2)
+        apply_turn(state, rec)
+        journal.record(rec)
+    journal.flush()
+
+def test_recovers_snapshot_plus_tail(tmp_path):
+    journal = Journal(str(tmp_path), every=100)
+    state = start()
+    journal.begin(state)
+    play(journal, state, 5)
+    back = Journal(str(tmp_path)).recover(BlobStore(str(tmp_path)))
+    assert [p["square"] for p in back["players"]] == [10, 7] and back["turn"] == 1
+
+def test_compaction_keeps_log_short(tmp_path):
+    journal = Journal(str(tmp_path), every=4)
+    state = start()
+    journal.begin(state)
+    play(journal, state, 10)
+    assert journal.compactions == 2
+    assert len((tmp_path / "autosave.log").read_bytes().splitlines()) == 2
+    back = Journal(str(tmp_path)).recover(BlobStore(str(tmp_path)))
+    assert back["players"] == state["players"] and back["seq"] == 10
+
+def test_torn_line_and_stale_records_are_ignored(tmp_path):
+    journal = Journal(str(tmp_path), every=100)
+    state = start()
+    journal.begin(state)
+    play(journal, state, 3)
+    with open(tmp_path / "autosave.log", "ab") as f:
+        f.write(b'{"p":0,"r":6,"s":9')
+    back = Journal(str(tmp_path)).recover(BlobStore(str(tmp_path)))
+    assert [p["square"] for p in back["players"]] == [7, 4]
+    # Crash mid-compaction: the new snapshot already holds every logged turn
+    journal._snapshot(dict(state, mode="endless"))
+    back = Journal(str(tmp_path)).recover(BlobStore(str(tmp_path)))
+    assert back["seq"] == 3 and back["mode"] == "endless"
+
+def test_endless_win_scores_and_resets():
+    state = start("endless")
+    p = Player("x", (0, 0, 0), None)
+    p.square = 100
+    apply_turn(state, turn_record(1, 4, p, "ladder", 1, won=True))
+    assert state["endless_scores"] == [0, 1] and all(q["square"] == 1 for q in state["players"])
+
+def test_clear(tmp_path):
+    journal = Journal(str(tmp_path))
+    journal.begin(start())
+    play(journal, start(), 1)
+    journal.clear()
+    journal.flush()
+    assert Journal(str(tmp_path)).recover(BlobStore(str(tmp_path))) is None
+
+def test_disk_work_stays_off_the_calling_thread(tmp_path, monkeypatch):
+    threads = set()
+    fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: threads.add(threading.current_thread().name) or fsync(fd))
+    journal = Journal(str(tmp_path), every=3)
+    state = start()
+    journal.begin(state)
+    play(journal, state, 7)
+    journal.close()
+    assert threads == {"journal"} and journal.compactions == 2
+    back = Journal(str(tmp_path)).recover(BlobStore(str(tmp_path)))
+    assert back["players"] == state["players"]
@@ -0,0 +1,29 @@
+from src.core.board import Board
+from src.core.match import Match
+from src.core.player import Player
+from src.core.rules import resolve_landing
+
+def test_landing_applies_once():
+    b = Board()
+    p = Player("A", (0,0,0), None)
+    p.square = 98
+    kind, before = resolve_landing(b, p)
+    assert (kind, before, p.square, p.snake_hits) == ("snake", 98, 78, 1)
+    assert resolve_landing(b, p)[0] is None
+
+def test_match_turns_are_deterministic_per_seed():
+    a = Match(["A", "B"], seed=7)
+    b = Match(["A", "B"], seed=7)
+    for _ in range(40):
+        assert a.play_turn() == b.play_turn()
+    assert [p.square for p in a.players] == [p.square for p in b.players]
+
+def test_match_ladder_and_win():
+    m = Match(["A", "B"])
+    e = m.play_turn(3)
+    assert e["kind"] == "ladder" and e["square"] == 14
+    assert m.turn == 1
+    m.players[0].square = 95
+    m.turn = 0
+    e = m.play_turn(5)
+    assert e.get("won") and m.winner is m.players[0]
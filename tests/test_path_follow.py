@@ -0,0 +1,34 @@
+from src.core.board import Board
+from src.core.path import ArcLengthPath
+from src.core.player import Player
+from src.objects.snake import Snake
+
+def test_straight_path_lookup():
+    path = ArcLengthPath([(0, 0), (30, 0), (30, 40)])
+    assert path.length == 70
+    assert path.at(0) == (0, 0)
+    x, y = path.at(15)
+    assert abs(x - 15) < 1e-6 and y == 0
+    x, y = path.at(50)
+    assert abs(x - 30) < 1e-6 and abs(y - 20) < 1e-6
+    assert path.at(1000) == (30, 40)
+
+def test_snake_path_runs_head_to_tail():
+    b = Board()
+    s = Snake(98, 78)
+    path = s.path(b)
+    assert path is s.path(b)
+    hx, hy = path.at(0)
+    tx, ty = path.at(path.length)
+    assert (round(hx), round(hy)) == b.square_pos(98)
+    assert (round(tx), round(ty)) == b.square_pos(78)
+
+def test_player_follows_path_until_end():
+    p = Player("A", (0,0,0), None)
+    path = ArcLengthPath([(0, 0), (100, 0)])
+    p.follow(path)
+    p.advance_anim(100 / p.path_speed / 2)
+    assert p.following_path()
+    assert abs(p.path_pos()[0] - 50) < 1e-6
+    p.advance_anim(1.0)
+    assert not p.following_path()
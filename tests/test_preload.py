@@ -0,0 +1,26 @@
+import os
+import pygame
+from src.services.asset_index import AssetIndex
+from src.services.assets import AssetLoader
+from src.services.preload import Preloader
+
+def test_preloader_decodes_in_background_and_adopts(tmp_path):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    (tmp_path / "images").mkdir()
+    img = pygame.Surface((8, 4))
+    img.fill((10, 20, 30))
+    pygame.image.save(img, str(tmp_path / "images" / "dice_1.png"))
+    manifest = {"images": {"dice_1": str(tmp_path / "images" / "dice_1.png")}, "sounds": {}}
+    assets = AssetLoader(manifest, index=AssetIndex(str(tmp_path)))
+    pre = Preloader(assets, workers=2)
+    pre.submit({"images": ["dice_1", "missing"], "sounds": ["roll"]})
+    assert pre.total == 1
+    pre.wait()
+    assert not pre.busy()
+    assert assets.images["dice_1"].get_size() == (8, 4)
+    assert assets.image("dice_1") is assets.images["dice_1"]
+    pre.submit({"images": ["dice_1"]})
+    assert not pre.busy()
+    pre.shutdown()
@@ -0,0 +1,106 @@
+import json
+import multiprocessing
+import sqlite3
+import time
+from src.services.profile_db import SqliteProfileStore
+
+def test_same_api_as_json_store(tmp_path):
+    store = SqliteProfileStore(str(tmp_path / "p.db"))
+    for i in range(200):
+        store.update_play(f"user{i:04d}")
+    for i in range(0, 200, 3):
+        store.update_win(f"user{i:04d}", i)
+    store.flush()
+    assert store.count() == 200
+    assert store.count("wins", "USER019") == 10
+    assert [p.high_score for p in store.top(3, "high_score")] == [198, 195, 192]
+    p = store.find("user0003")
+    assert (p.wins, p.games_played, p.achievements) == (1, 2, ["First Win"])
+    assert store.query("wins", "user01", limit=2) == ["user0102", "user0105"]
+    page = store.page(10, 5, "games_played", "user")
+    assert len(page) == 5 and all(x.games_played >= y.games_played for x, y in zip(page, page[1:]))
+
+def test_save_keeps_concurrent_counters(tmp_path):
+    path = str(tmp_path / "p.db")
+    a = SqliteProfileStore(path)
+    b = SqliteProfileStore(path)
+    p = a.get("Ann")
+    p.color = (1, 2, 3)
+    b.update_win("Ann", 10)
+    b.flush()
+    a.save()
+    a.flush()
+    q = b.find("Ann")
+    assert q.color == (1, 2, 3) and q.wins == 1 and q.high_score == 10
+
+def test_migrates_profiles_json_once(tmp_path):
+    legacy = tmp_path / "profiles.json"
+    legacy.write_text(json.dumps({"Bo": {"name": "Bo", "wins": 4, "color": [9, 9, 9]}}))
+    db = str(tmp_path / "p.db")
+    store = SqliteProfileStore(db, legacy_json=str(legacy))
+    assert store.find("Bo").wins == 4 and store.find("Bo").color == (9, 9, 9)
+    store.update_win("Bo", 1)
+    store.close()
+    assert SqliteProfileStore(db, legacy_json=str(legacy)).find("Bo").wins == 5
+
+def _win_many(path, name, n):
+    store = SqliteProfileStore(path)
+    for _ in range(n):
+        store.update_win(name, 1)
+    store.close()
+
+def test_concurrent_processes_do_not_lose_updates(tmp_path):
+    path = str(tmp_path / "p.db")
+    SqliteProfileStore(path)
+    # Spawned, like separate game processes: a fork could copy a lock held by a writer thread
+    procs = [multiprocessing.get_context("spawn").Process(target=_win_many, args=(path, "Shared", 40)) for _ in range(3)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(30)
+    assert SqliteProfileStore(path).find("Shared").wins == 120
+
+def test_writes_do_not_wait_for_the_lock(tmp_path):
+    path = str(tmp_path / "p.db")
+    store = SqliteProfileStore(path)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    start = time.perf_counter()
+    store.update_win("Ann", 3)
+    store.save()
+    assert time.perf_counter() - start < 0.1
+    other.execute("COMMIT")
+    store.close()
+    assert SqliteProfileStore(path).find("Ann").wins == 1
+
+def test_pages_follow_the_index_order_and_later_writes(tmp_path):
+    store = SqliteProfileStore(str(tmp_path / "p.db"))
+    for i in range(300):
+        store.update_play(f"user{i:04d}")
+    for i in range(0, 300, 7):
+        store.update_win(f"user{i:04d}", i)
+    store.update_play("User0001")
+    store.flush()
+    for sort, prefix in (("wins", ""), ("high_score", "USER01"), ("games_played", "user2"), ("wins", "user000")):
+        names = store.query(sort, prefix)
+        paged = [p.name for offset in range(0, len(names), 40) for p in store.page(offset, 40, sort, prefix)]
+        assert paged == names and store.count(sort, prefix) == len(names)
+        # Scrolling back up seeks from the rows served on the way down
+        for offset in range(len(names) - 1, -1, -13):
+            assert [p.name for p in store.page(offset, 5, sort, prefix)] == names[offset:offset + 5]
+    store.update_win("user0299", 1000)
+    store.flush()
+    assert store.page(0, 1, "high_score")[0].name == "user0299"
+    assert store.page(0, 1, "high_score", "user02")[0].name == "user0299"
+    store.close()
+
+def test_a_bad_row_does_not_stop_the_writer(tmp_path):
+    path = str(tmp_path / "p.db")
+    store = SqliteProfileStore(path)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("INSERT INTO profiles (name, achievements) VALUES ('Bad', 'not json')")
+    store.update_win("Bad", 1)
+    store.update_win("Ann", 2)
+    store.flush()
+    assert store.errors == 1 and store.find("Ann").wins == 1
+    store.close()
@@ -0,0 +1,69 @@
+import pygame
+from src.services.profiles import ProfileStore
+from src.ui.list_view import VirtualList
+
+def make_store(tmp_path, n):
+    store = ProfileStore(str(tmp_path / "profiles.json"))
+    for i in range(n):
+        p = store.get(f"user{i:04d}")
+        p.wins = i % 7
+        p.high_score = i
+    return store
+
+def test_store_sorts_pages_and_searches(tmp_path):
+    store = make_store(tmp_path, 200)
+    top = store.page(0, 3, "high_score")
+    assert [p.high_score for p in top] == [199, 198, 197]
+    wins = store.query("wins")
+    assert store.data[wins[0]].wins == 6
+    assert store.count("wins", "user01") == 100
+    assert store.count("wins", "USER019") == 10
+    assert store.count("wins", "nobody") == 0
+
+def test_virtual_list_fetches_only_visible_rows(tmp_path):
+    store = make_store(tmp_path, 1000)
+    fetched = []
+    def fetch(offset, limit):
+        fetched.append(limit)
+        return store.page(offset, limit, "high_score")
+    painted = []
+    lv = VirtualList((0, 0, 200, 100), 20, fetch, lambda: store.count("high_score"), lambda s, i, p, sel: painted.append(i))
+    surf = pygame.Surface((200, 100))
+    lv.draw(surf)
+    assert max(fetched) <= lv.visible_rows()
+    assert painted == list(range(7))
+    lv.scroll += 20
+    lv.draw(surf)
+    assert painted[-1] == 7 and len(painted) == 8
+    assert len(lv.rows) + len(lv.free) == 7
+
+def test_updates_move_one_name_without_resorting(tmp_path):
+    store = make_store(tmp_path, 300)
+    store.get("User0001")
+    orders = {sort: store.query(sort) for sort in ("wins", "high_score", "games_played")}
+    assert store.count("wins", "user00") == 101
+    store.update_win("user0100", 500)
+    store.update_play("User0001")
+    store.update_win("newcomer", 1000)
+    for sort, order in orders.items():
+        # The cached list is moved in place, not rebuilt
+        assert store.query(sort) is order
+        assert order == sorted(store.data, key=store._sort_key(sort))
+    assert orders["high_score"][:2] == ["newcomer", "user0100"]
+    assert store.count("wins", "user00") == 101 and store.count("wins", "new") == 1
+
+def test_idle_list_does_not_count_or_repaint(tmp_path):
+    store = make_store(tmp_path, 100)
+    counted, painted = [], []
+    def count():
+        counted.append(1)
+        return store.count("wins")
+    lv = VirtualList((0, 0, 200, 100), 20, lambda o, n: store.page(o, n, "wins"), count, lambda s, i, p, sel: painted.append(p.name))
+    surf = pygame.Surface((200, 100))
+    for _ in range(3):
+        lv.draw(surf)
+    assert len(counted) == 1 and len(painted) == 7
+    store.update_win(painted[3], 99)
+    lv.refetch()
+    lv.draw(surf)
+    assert len(counted) == 2 and painted[7] == store.query("wins")[0]
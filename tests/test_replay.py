@@ -0,0 +1,46 @@
+from src.core.match import Match
+from src.core.replay import Recorder, Recording, ReplayPlayer
+
+def record_endless(turns, seed=3, every=50):
+    rec = Recorder(["A", "B", "C"], "endless", seed, every=every)
+    m = Match(["A", "B", "C"], "endless", seed)
+    for _ in range(turns):
+        rec.record(m.roll())
+    return rec
+
+def test_recording_roundtrip_and_keyframes():
+    rec = record_endless(620)
+    data = rec.recording.dumps()
+    back = Recording.loads(data)
+    assert bytes(back.rolls) == bytes(rec.recording.rolls) and back.seed == 3
+    assert [k["i"] for k in back.keyframes] == list(range(0, 601, 50))
+
+def test_playback_matches_the_recorded_game():
+    rec = record_endless(300)
+    player = ReplayPlayer(rec.recording)
+    while not player.done():
+        player.step()
+    assert player.match.snapshot() == rec.match.snapshot()
+
+def test_seek_uses_nearest_keyframe():
+    rec = record_endless(620)
+    straight = ReplayPlayer(rec.recording)
+    for _ in range(517):
+        straight.step()
+    player = ReplayPlayer(rec.recording)
+    steps = []
+    player.step = lambda original=player.step: steps.append(1) or original()
+    player.seek(517)
+    assert len(steps) == 17 and player.match.snapshot() == straight.match.snapshot()
+    player.seek(3)
+    assert player.position == 3 and player.match.turns_played == 3
+
+def test_advance_at_speed_and_resumed_start():
+    start = Match(["A", "B"]).snapshot()
+    start["players"][1][0] = 40
+    rec = Recorder(["A", "B"], start=start)
+    for face in (1, 2, 3, 4):
+        rec.record(face)
+    player = ReplayPlayer(rec.recording)
+    assert player.match.players[1].square == 40
+    assert len(player.advance(0.5, 4)) == 2 and len(player.advance(10, 4)) == 2 and player.done()
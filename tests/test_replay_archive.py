@@ -0,0 +1,52 @@
+import numpy as np
+from src.core.replay import Recorder
+from src.services.replay_archive import MODES, ReplayArchive
+
+def record(seed, mode="classic", turns=2000):
+    rec = Recorder(["A", "B"], mode, seed)
+    for _ in range(turns):
+        if rec.match.winner:
+            break
+        rec.record(rec.match.roll())
+    return rec.recording, rec.match
+
+def test_index_columns_and_segments(tmp_path):
+    archive = ReplayArchive(str(tmp_path), segment_bytes=2000)
+    games = [record(seed) for seed in range(12)]
+    for recording, _ in games:
+        archive.add(recording)
+    archive.add(record(99, "endless", 300)[0])
+    assert len(archive) == 13 and len(list(tmp_path.glob("segment-*.bin"))) > 1
+    winners = archive.column("winner")
+    assert list(winners[:12]) == [m.players.index(m.winner) for _, m in games]
+    assert list(archive.column("length")[:12]) == [len(r) for r, _ in games]
+    assert archive.column("mode")[12] == MODES.index("endless")
+    assert archive.column("snakes").sum() == archive.column("snake_hits").sum()
+    assert archive.load(5).rolls == games[5][0].rolls
+
+def test_query_decodes_only_matches(tmp_path):
+    archive = ReplayArchive(str(tmp_path))
+    for seed in range(20):
+        archive.add(record(seed)[0])
+    s = archive.snake(98)
+    # Games where a losing player went down the 98 snake
+    decided = lambda c: (c["winner"] >= 0) & (c["snake_hits"][:, s] > c["winner_snake_hits"][:, s])
+    rows = archive.query(decided)
+    expected = [i for i in range(20) if archive.column("snake_hits")[i, s] > archive.column("winner_snake_hits")[i, s]]
+    assert list(rows) == expected
+    opened = []
+    archive.load = lambda row, original=archive.load: opened.append(row) or original(row)
+    found = list(archive.recordings(archive.query(lambda c: c["length"] > np.median(c["length"]), limit=3)))
+    assert len(opened) == len(found) <= 3 and all(len(r) > 0 for _, r in found)
+
+def test_reopen_and_grow(tmp_path):
+    archive = ReplayArchive(str(tmp_path))
+    recording = record(1)[0]
+    archive.add_many([recording] * 1029)
+    archive.add(recording)
+    archive.shutdown()
+    again = ReplayArchive(str(tmp_path))
+    assert len(again) == 1030 and again.capacity == 2048
+    assert again.load(1029).rolls == recording.rolls
+    (tmp_path / "old.replay").write_bytes(recording.dumps())
+    assert len(ReplayArchive(str(tmp_path))) == 1031 and not (tmp_path / "old.replay").exists()
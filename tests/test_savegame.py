@@ -0,0 +1,54 @@
+import base64
+import json
+import pygame
+import pytest
+from src.services.savegame import BlobStore, SAVE_VERSION, dumps, loads, read_save, write_save
+
+def avatar(color):
+    s = pygame.Surface((8, 8), pygame.SRCALPHA)
+    s.fill(color)
+    return s
+
+def test_roundtrip_is_compressed_and_versioned(tmp_path):
+    blobs = BlobStore(str(tmp_path / "blobs"))
+    state = {"app": "board", "turn": 1, "players": [{"name": "a" * 50, "square": 7, "avatar": None}] * 4}
+    data = dumps(state)
+    assert len(data) < len(json.dumps(state))
+    path = str(tmp_path / "game.sav")
+    write_save(path, state)
+    back = read_save(path, blobs)
+    assert back["version"] == SAVE_VERSION and back["players"][0]["square"] == 7
+
+def test_avatars_are_stored_once_by_content(tmp_path):
+    blobs = BlobStore(str(tmp_path))
+    a = blobs.put(avatar((255, 0, 0, 255)))
+    b = blobs.put(avatar((255, 0, 0, 255)))
+    c = blobs.put(avatar((0, 0, 255, 255)))
+    assert a == b != c
+    assert len(list(tmp_path.rglob("*.png"))) == 2
+    assert blobs.load(a).get_at((3, 3)) == (255, 0, 0, 255)
+
+def test_migrates_inline_base64_saves(tmp_path):
+    blobs = BlobStore(str(tmp_path))
+    img = avatar((0, 200, 0, 255))
+    old = {"players": [{"name": "p", "square": 12, "image_data": base64.b64encode(pygame.image.tobytes(img, "RGBA")).decode(),
+                        "image_size": [8, 8]}, {"name": "q", "square": 3}], "turn": 1, "mode": "classic"}
+    state = loads(json.dumps(old).encode(), blobs)
+    assert state["version"] == SAVE_VERSION and state["app"] == "board"
+    assert state["players"][0]["avatar"] == blobs.digest(img) and blobs.exists(state["players"][0]["avatar"])
+    assert state["players"][1]["avatar"] is None and state["turn"] == 1
+
+def test_migrates_avatar_path_saves(tmp_path):
+    blobs = BlobStore(str(tmp_path / "blobs"))
+    png = str(tmp_path / "avatar_p.png")
+    pygame.image.save(avatar((9, 9, 9, 255)), png)
+    old = {"mode": "Classic", "num_players": 1, "current_player_index": 0, "winner_index": None,
+           "players": [{"name": "p", "pos": 41, "shield": True, "avatar_path": png}]}
+    state = loads(json.dumps(old).encode(), blobs)
+    p = state["players"][0]
+    assert state["app"] == "classic" and state["turn"] == 0
+    assert p["square"] == 41 and p["shield"] and blobs.exists(p["avatar"])
+
+def test_rejects_saves_from_newer_versions(tmp_path):
+    with pytest.raises(ValueError):
+        loads(json.dumps({"version": SAVE_VERSION + 1}).encode(), BlobStore(str(tmp_path)))
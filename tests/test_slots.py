@@ -0,0 +1,57 @@
+import pygame
+from src.services.persistence import WriteBehind
+from src.services.savegame import BlobStore, write_save
+from src.services.slots import SaveSlots, render_thumbnail
+
+def state(turn):
+    return {"app": "board", "mode": "classic", "turn": turn, "players": [{"name": "a", "square": 5, "avatar": None}, {"name": "b", "square": 40, "avatar": None}]}
+
+def test_list_reads_only_the_index(tmp_path):
+    slots = SaveSlots(str(tmp_path), BlobStore(str(tmp_path / "blobs")))
+    slots.save("one", "First", state(1))
+    slots.save("two", "Second", state(2))
+    (tmp_path / "one.sav").unlink()
+    again = SaveSlots(str(tmp_path), None)
+    assert [s["id"] for s in again.list()] == ["two", "one"]
+    assert again.list()[0]["players"] == ["a", "b"] and again.latest() == "two"
+    assert again.load("two")["turn"] == 2
+    slots.shutdown()
+    again.shutdown()
+
+def test_thumbnail_is_written_behind_and_loaded(tmp_path):
+    pygame.init()
+    writer = WriteBehind(delay=5)
+    slots = SaveSlots(str(tmp_path), BlobStore(str(tmp_path / "blobs")), writer)
+    layer = pygame.Surface((120, 120))
+    layer.fill((200, 50, 50))
+    slots.save("s", "Game", state(0), lambda: render_thumbnail(layer, 10, 100, [(1, (0, 0, 255))], 40))
+    thumb = slots.load_thumbnail("s").result(timeout=10)
+    assert thumb.get_size() == (40, 40)
+    r, g, b = thumb.get_at((20, 10))[:3]
+    assert r > 150 and g < 80 and b < 80
+    assert slots.load("s")["turn"] == 0
+    slots.shutdown()
+    writer.close()
+
+def test_import_and_delete(tmp_path):
+    old = str(tmp_path / "savegame.json")
+    write_save(old, state(3))
+    slots = SaveSlots(str(tmp_path / "slots"), BlobStore(str(tmp_path / "blobs")))
+    assert slots.import_file(old, "imported", "Earlier save") == "imported"
+    assert slots.import_file(str(tmp_path / "missing.json"), "x", "x") is None
+    assert slots.import_file(old, "other", "Other app", app="classic") is None
+    assert slots.load("imported")["turn"] == 3
+    slots.delete("imported")
+    slots.pool.shutdown(wait=True)
+    assert slots.list() == [] and not (tmp_path / "slots" / "imported.sav").exists()
+
+def test_new_ids_are_not_reused_after_delete(tmp_path):
+    slots = SaveSlots(str(tmp_path), BlobStore(str(tmp_path / "blobs")))
+    first = slots.save(slots.new_id(), "A", state(1))
+    second = slots.save(slots.new_id(), "B", state(2))
+    slots.delete(first)
+    third = slots.save(slots.new_id(), "C", state(3))
+    fourth = SaveSlots(str(tmp_path), None).new_id()
+    assert len({first, second, third, fourth}) == 4
+    assert slots.load(second)["turn"] == 2
+    slots.pool.shutdown(wait=True)
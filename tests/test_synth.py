@@ -0,0 +1,23 @@
+import numpy as np
+import pygame
+import pytest
+from src.services.synth import RECIPES, SoundSynth, render
+
+def test_every_recipe_renders_bounded_int16():
+    for name in RECIPES:
+        pcm = render(name, 22050, 2)
+        assert pcm.dtype == np.int16 and pcm.ndim == 2 and pcm.shape[1] == 2
+        assert len(pcm) > 0 and np.abs(pcm).max() > 1000
+
+def test_second_launch_reads_the_wav_cache(tmp_path):
+    pygame.mixer.init(22050, -16, 2, 512)
+    if pygame.mixer.get_init()[1] != -16:
+        pytest.skip("mixer is not 16-bit")
+    first = SoundSynth(str(tmp_path))
+    a = first.sound("ladder")
+    assert first.rendered == 1 and len(list(tmp_path.iterdir())) == 1
+    second = SoundSynth(str(tmp_path))
+    b = second.sound("ladder")
+    assert second.rendered == 0 and second.loaded == 1
+    assert a.get_raw() == b.get_raw()
+    assert second.sound("nope") is None
@@ -0,0 +1,15 @@
+import pygame
+from src.ui.viewport import Viewport
+
+def test_identity_at_design_size():
+    v = Viewport((960, 1000), (960, 1000))
+    assert v.scale == 1
+    assert v.rect((130, 880, 120, 44)) == pygame.Rect(130, 880, 120, 44)
+
+def test_letterboxed_scale_keeps_aspect():
+    v = Viewport((960, 1000), (1920, 1000))
+    assert v.scale == 1
+    assert v.point((0, 0)) == (480, 0)
+    v.resize((1920, 2000))
+    assert v.size(700) == 1400
+    assert v.rect((0, 0, 960, 1000)) == pygame.Rect(0, 0, 1920, 2000)
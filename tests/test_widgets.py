@@ -0,0 +1,49 @@
+import pygame
+from src.services.assets import AssetLoader
+from src.ui.widgets import Widget, WidgetLayer, fonts
+
+class Counter(Widget):
+    def __init__(self, rect):
+        super().__init__(rect)
+        self.text = "a"
+        self.paints = 0
+
+    def state(self):
+        return (self.text,)
+
+    def paint(self, surface):
+        self.paints += 1
+
+def test_widget_repaints_only_on_state_change():
+    w = Counter((0, 0, 10, 10))
+    surf = pygame.Surface((20, 20))
+    for _ in range(3):
+        w.draw(surf)
+    assert w.paints == 1
+    w.text = "b"
+    w.draw(surf)
+    assert w.paints == 2
+
+def test_layer_hit_uses_topmost_visible():
+    layer = WidgetLayer(cell=32)
+    a = layer.add(Counter((0, 0, 100, 40)))
+    b = layer.add(Counter((0, 0, 100, 40)))
+    assert layer.hit((50, 20)) is b
+    b.visible = False
+    assert layer.hit((50, 20)) is a
+    assert layer.hit((150, 20)) is None
+
+def test_font_pool_shares_fonts():
+    pygame.font.init()
+    assert fonts.get(None, 20) is fonts.get(None, 20)
+
+def test_font_pool_is_the_asset_loader_cache():
+    pygame.font.init()
+    loader = AssetLoader({"images": {}, "sounds": {}})
+    previous = fonts.loader
+    fonts.attach(loader)
+    try:
+        assert fonts.get(None, 21) is loader.font(None, 21)
+        assert fonts.get("missing.ttf", 21) is loader.fonts[("missing.ttf", 21)]
+    finally:
+        fonts.attach(previous)
@@ -0,0 +1,45 @@
+import os
+import threading
+import pytest
+from src.services.persistence import WriteBehind, atomic_write
+from src.services.profiles import ProfileStore
+
+def test_atomic_write_keeps_old_file_when_encoding_fails(tmp_path):
+    path = str(tmp_path / "f.bin")
+    atomic_write(path, b"old")
+    with pytest.raises(TypeError):
+        atomic_write(path, "not bytes")
+    assert open(path, "rb").read() == b"old"
+    assert os.listdir(str(tmp_path)) == ["f.bin"]
+
+def test_puts_are_coalesced_and_written_off_thread(tmp_path):
+    writer = WriteBehind(delay=10)
+    path = str(tmp_path / "a.json")
+    threads = []
+    def render(n):
+        return lambda: threads.append(threading.current_thread().name) or b"v%d" % n
+    for n in range(5):
+        writer.put(path, render(n))
+    assert not os.path.exists(path)
+    assert writer.flush(timeout=5)
+    assert open(path, "rb").read() == b"v4"
+    assert writer.writes == 1 and threads == ["write-behind"]
+    writer.close()
+
+def test_close_flushes_pending_writes(tmp_path):
+    writer = WriteBehind(delay=60)
+    writer.put(str(tmp_path / "b"), b"data")
+    writer.close()
+    assert open(str(tmp_path / "b"), "rb").read() == b"data"
+    with pytest.raises(RuntimeError):
+        writer.put(str(tmp_path / "c"), b"late")
+
+def test_profile_updates_do_not_write_synchronously(tmp_path):
+    writer = WriteBehind(delay=60)
+    path = str(tmp_path / "profiles.json")
+    store = ProfileStore(path, writer)
+    store.update_win("Ann", 40)
+    store.update_play("Ann")
+    assert not os.path.exists(path)
+    writer.close()
+    assert ProfileStore(path).get("Ann").games_played == 2